@@ -1,18 +1,49 @@
 """AWS FinOps Dashboard package."""
 
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
 __version__ = "2.4.0"  # Update version to reflect the new feature
 
-from aws_finops_dashboard.dashboard_runner import run_dashboard
-from aws_finops_dashboard.ri_optimizer import (
-    RIOptimizer, 
-    get_ri_and_sp_recommendations,
-    display_optimization_summary
-)
-from aws_finops_dashboard.resource_analyzer import (
-    UnusedResourceAnalyzer,
-    analyze_unused_resources
-)
-from aws_finops_dashboard.resource_analyzer_export import export_unused_resources
+if TYPE_CHECKING:
+    from aws_finops_dashboard.dashboard_runner import run_dashboard
+    from aws_finops_dashboard.ri_optimizer import (
+        RIOptimizer, 
+        get_ri_and_sp_recommendations,
+        display_optimization_summary
+    )
+    from aws_finops_dashboard.resource_analyzer import (
+        UnusedResourceAnalyzer,
+        analyze_unused_resources
+    )
+    from aws_finops_dashboard.resource_analyzer_export import export_unused_resources
+
+# Public names and the submodule defining each one. They are imported on first
+# attribute access so that importing the package (e.g. for the CLI entry
+# point) does not load boto3, pandas or ReportLab up front.
+_LAZY_EXPORTS = {
+    "run_dashboard": "aws_finops_dashboard.dashboard_runner",
+    "RIOptimizer": "aws_finops_dashboard.ri_optimizer",
+    "get_ri_and_sp_recommendations": "aws_finops_dashboard.ri_optimizer",
+    "display_optimization_summary": "aws_finops_dashboard.ri_optimizer",
+    "UnusedResourceAnalyzer": "aws_finops_dashboard.resource_analyzer",
+    "analyze_unused_resources": "aws_finops_dashboard.resource_analyzer",
+    "export_unused_resources": "aws_finops_dashboard.resource_analyzer_export",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(__all__))
+
 
 __all__ = [
     "run_dashboard", 
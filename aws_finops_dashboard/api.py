@@ -15,7 +15,7 @@ from flask_cors import CORS
 import configparser
 
 from aws_finops_dashboard.dashboard_runner import run_dashboard
-from aws_finops_dashboard.aws_client import get_aws_profiles, get_aws_profiles_with_details, validate_aws_profile, get_account_details
+from aws_finops_dashboard.aws_client import clear_profile_caches, get_aws_profiles, get_aws_profiles_with_details, validate_aws_profile, get_account_details
 from aws_finops_dashboard.web_ui import run_task_thread, task_results, app as web_app
 
 # Create Flask app
@@ -396,6 +396,9 @@ def add_profile():
             if not success:
                 return jsonify({'error': 'Could not add profile using any available method'}), 500
         
+        # The AWS config files changed, so drop sessions built from the old ones
+        clear_profile_caches()
+        
         # Validate the new profile
         validation = validate_aws_profile(profile_name)
         if not validation.get('is_valid', False):
@@ -1,17 +1,23 @@
+import logging
+import weakref
 from collections import defaultdict
-from typing import Dict, List, Optional, Any
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, List, Optional, Any, Set, Tuple
 
 import boto3
 from boto3.session import Session
 from botocore.exceptions import ClientError
 import botocore.exceptions
-from rich.console import Console
 import os
 import configparser
 
 from aws_finops_dashboard.types import BudgetInfo, EC2Summary, RegionName
 
-console = Console()
+logger = logging.getLogger(__name__)
+
+# Upper bound on concurrent per-region API calls for a single profile
+MAX_REGION_WORKERS = 16
 
 
 def get_aws_profiles() -> List[str]:
@@ -175,66 +181,196 @@ def get_account_details(profile_name: str) -> Optional[Dict[str, Any]]:
         return None
 
 
+# Account IDs already resolved through STS; entries go away with their session
+_SESSION_ACCOUNT_IDS: "weakref.WeakKeyDictionary[Session, Optional[str]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
 def get_account_id(session: Session) -> Optional[str]:
-    """Get the AWS account ID for a session."""
+    """Get the AWS account ID for a session, calling STS once per session."""
+    try:
+        return _SESSION_ACCOUNT_IDS[session]
+    except KeyError:
+        pass
     try:
         account_id = session.client("sts").get_caller_identity().get("Account")
-        return str(account_id) if account_id is not None else None
     except Exception as e:
-        console.log(f"[yellow]Warning: Could not get account ID: {str(e)}[/]")
+        logger.warning("Could not get account ID: %s", e)
+        return None
+    if account_id is None:
         return None
+    result = str(account_id)
+    _SESSION_ACCOUNT_IDS[session] = result
+    return result
 
 
-def get_all_regions(session: Session) -> List[RegionName]:
+@lru_cache(maxsize=None)
+def get_session(profile_name: str) -> Session:
     """
-    Get all available AWS regions.
-    Using us-east-1 as a default region to get the list of all regions.
+    Get a boto3 session for a profile, reusing it across calls.
 
-    If the call fails, it will return a hardcoded list of common regions.
+    Creating a session re-reads the AWS config files and resolves credentials,
+    so each profile is only set up once until clear_profile_caches is called.
     """
+    return boto3.Session(profile_name=profile_name)
+
+
+def get_account_id_for_profile(profile_name: str) -> Optional[str]:
+    """Get the AWS account ID for a profile, calling STS once per profile."""
+    return get_account_id(get_session(profile_name))
+
+
+def get_management_account_id(session: Session) -> Optional[str]:
+    """Get the management account ID of the session's organization, if visible."""
+    try:
+        organization = session.client("organizations").describe_organization()
+        return str(organization["Organization"]["MasterAccountId"])
+    except Exception as e:
+        logger.debug("Could not describe organization: %s", e)
+        return None
+
+
+def get_organization_account_ids(session: Session) -> Optional[Set[str]]:
+    """Get the IDs of all accounts in the organization, from its management account."""
+    try:
+        paginator = session.client("organizations").get_paginator("list_accounts")
+        return {
+            account["Id"]
+            for page in paginator.paginate()
+            for account in page.get("Accounts", [])
+        }
+    except Exception as e:
+        logger.debug("Could not list organization accounts: %s", e)
+        return None
+
+
+_FALLBACK_REGIONS: Tuple[RegionName, ...] = (
+    "us-east-1",
+    "us-east-2",
+    "us-west-1",
+    "us-west-2",
+    "ap-southeast-1",
+    "ap-south-1",
+    "eu-west-1",
+    "eu-west-2",
+    "eu-central-1",
+)
+
+
+def _describe_region_names(session: Session) -> Optional[List[RegionName]]:
+    """List all region names from us-east-1, or None if the call fails."""
     try:
         ec2_client = session.client("ec2", region_name="us-east-1")
-        regions = [
+        return [
             region["RegionName"] for region in ec2_client.describe_regions()["Regions"]
         ]
-        return regions
     except Exception as e:
-        console.log(f"[yellow]Warning: Could not get all regions: {str(e)}[/]")
-        return [
-            "us-east-1",
-            "us-east-2",
-            "us-west-1",
-            "us-west-2",
-            "ap-southeast-1",
-            "ap-south-1",
-            "eu-west-1",
-            "eu-west-2",
-            "eu-central-1",
-        ]
+        logger.warning("Could not get all regions: %s", e)
+        return None
 
 
-def get_accessible_regions(session: Session) -> List[RegionName]:
-    """Get regions that are accessible with the current credentials."""
-    all_regions = get_all_regions(session)
-    accessible_regions = []
+def get_all_regions(session: Session) -> List[RegionName]:
+    """
+    Get all available AWS regions.
+    Using us-east-1 as a default region to get the list of all regions.
 
+    If the call fails, it will return a hardcoded list of common regions.
+    """
+    regions = _describe_region_names(session)
+    return regions if regions is not None else list(_FALLBACK_REGIONS)
+
+
+def _probe_accessible_regions(
+    session: Session, all_regions: List[RegionName]
+) -> List[RegionName]:
+    """Return the regions in all_regions where EC2 can be called."""
+    # Clients are created up front because a boto3 Session is not thread-safe
+    region_clients = []
     for region in all_regions:
         try:
-            ec2_client = session.client("ec2", region_name=region)
+            region_clients.append((region, session.client("ec2", region_name=region)))
+        except Exception:
+            logger.warning(
+                "Region %s is not accessible with the current credentials", region
+            )
+
+    def probe_region(region: RegionName, ec2_client: Any) -> bool:
+        try:
             ec2_client.describe_instances(MaxResults=5)
-            accessible_regions.append(region)
+            return True
         except Exception:
-            console.log(
-                f"[yellow]Region {region} is not accessible with the current credentials[/]"
+            logger.warning(
+                "Region %s is not accessible with the current credentials", region
             )
+            return False
+
+    accessible_regions = []
+    if region_clients:
+        with ThreadPoolExecutor(
+            max_workers=min(MAX_REGION_WORKERS, len(region_clients))
+        ) as executor:
+            # map keeps the regions in get_all_regions order
+            for (region, _), accessible in zip(
+                region_clients,
+                executor.map(
+                    lambda region_client: probe_region(*region_client),
+                    region_clients,
+                ),
+            ):
+                if accessible:
+                    accessible_regions.append(region)
+
+    return accessible_regions
 
+
+def _or_default_regions(accessible_regions: List[RegionName]) -> List[RegionName]:
+    """Fall back to a few common regions when none were accessible."""
     if not accessible_regions:
-        console.log("[yellow]No accessible regions found. Using default regions.[/]")
+        logger.warning("No accessible regions found. Using default regions.")
         return ["us-east-1", "us-east-2", "us-west-1", "us-west-2"]
-
     return accessible_regions
 
 
+def get_accessible_regions(session: Session) -> List[RegionName]:
+    """Get regions that are accessible with the current credentials."""
+    return _or_default_regions(
+        _probe_accessible_regions(session, get_all_regions(session))
+    )
+
+
+# Accessible regions per profile. Only complete probes are stored, so a profile
+# whose region lookup failed is probed again on the next call.
+_PROFILE_ACCESSIBLE_REGIONS: Dict[str, Tuple[RegionName, ...]] = {}
+
+
+def clear_profile_caches() -> None:
+    """
+    Forget the cached sessions and accessible regions of every profile.
+
+    Called at the start of each dashboard run and after profiles are added, so
+    a long-lived process picks up new or rotated credentials.
+    """
+    get_session.cache_clear()
+    _PROFILE_ACCESSIBLE_REGIONS.clear()
+
+
+def get_accessible_regions_for_profile(profile_name: str) -> List[RegionName]:
+    """Get accessible regions for a profile, probing them once per profile."""
+    cached = _PROFILE_ACCESSIBLE_REGIONS.get(profile_name)
+    if cached is not None:
+        return list(cached)
+
+    session = get_session(profile_name)
+    all_regions = _describe_region_names(session)
+    accessible_regions = _probe_accessible_regions(
+        session, all_regions if all_regions is not None else list(_FALLBACK_REGIONS)
+    )
+    if all_regions is not None and accessible_regions:
+        _PROFILE_ACCESSIBLE_REGIONS[profile_name] = tuple(accessible_regions)
+    return _or_default_regions(accessible_regions)
+
+
 def ec2_summary(
     session: Session, regions: Optional[List[RegionName]] = None
 ) -> EC2Summary:
@@ -254,18 +390,35 @@ def ec2_summary(
 
     instance_summary: EC2Summary = defaultdict(int)
 
+    # Clients are created up front because a boto3 Session is not thread-safe
+    region_clients = []
     for region in regions:
         try:
-            ec2_regional = session.client("ec2", region_name=region)
+            region_clients.append((region, session.client("ec2", region_name=region)))
+        except Exception as e:
+            logger.warning("Could not access EC2 in region %s: %s", region, e)
+
+    def count_instance_states(region: RegionName, ec2_regional: Any) -> Dict[str, int]:
+        states: Dict[str, int] = defaultdict(int)
+        try:
             instances = ec2_regional.describe_instances()
             for reservation in instances["Reservations"]:
                 for instance in reservation["Instances"]:
-                    state = instance["State"]["Name"]
-                    instance_summary[state] += 1
+                    states[instance["State"]["Name"]] += 1
         except Exception as e:
-            console.log(
-                f"[yellow]Warning: Could not access EC2 in region {region}: {str(e)}[/]"
-            )
+            logger.warning("Could not access EC2 in region %s: %s", region, e)
+        return states
+
+    if region_clients:
+        with ThreadPoolExecutor(
+            max_workers=min(MAX_REGION_WORKERS, len(region_clients))
+        ) as executor:
+            for states in executor.map(
+                lambda region_client: count_instance_states(*region_client),
+                region_clients,
+            ):
+                for state, count in states.items():
+                    instance_summary[state] += count
 
     if "running" not in instance_summary:
         instance_summary["running"] = 0
@@ -294,9 +447,7 @@ def get_stopped_instances(
             if ids:
                 stopped[region] = ids
         except Exception as e:
-            console.log(
-                f"[yellow]Warning: Could not fetch stopped instances in {region}: {str(e)}[/]"
-            )
+            logger.warning("Could not fetch stopped instances in %s: %s", region, e)
     return stopped
 
 
@@ -315,9 +466,7 @@ def get_unused_volumes(
             if vols:
                 unused[region] = vols
         except Exception as e:
-            console.log(
-                f"[yellow]Warning: Could not fetch unused volumes in {region}: {str(e)}[/]"
-            )
+            logger.warning("Could not fetch unused volumes in %s: %s", region, e)
     return unused
 
 
@@ -338,9 +487,7 @@ def get_unused_eips(
             if free:
                 eips[region] = free
         except Exception as e:
-            console.log(
-                f"[yellow]Warning: Could not fetch EIPs in {region}: {str(e)}[/]"
-            )
+            logger.warning("Could not fetch EIPs in %s: %s", region, e)
     return eips
 
 
@@ -366,9 +513,7 @@ def get_untagged_resources(
                             instance["InstanceId"]
                         )
         except Exception as e:
-            console.log(
-                f"[yellow]Warning: Could not fetch EC2 instances in {region}: {str(e)}[/]"
-            )
+            logger.warning("Could not fetch EC2 instances in %s: %s", region, e)
 
         # RDS
         try:
@@ -382,9 +527,7 @@ def get_untagged_resources(
                         db_instance["DBInstanceIdentifier"]
                     )
         except Exception as e:
-            console.log(
-                f"[yellow]Warning: Could not fetch RDS instances in {region}: {str(e)}[/]"
-            )
+            logger.warning("Could not fetch RDS instances in %s: %s", region, e)
 
         # Lambda
         try:
@@ -398,9 +541,7 @@ def get_untagged_resources(
                         function["FunctionName"]
                     )
         except Exception as e:
-            console.log(
-                f"[yellow]Warning: Could not fetch Lambda functions in {region}: {str(e)}[/]"
-            )
+            logger.warning("Could not fetch Lambda functions in %s: %s", region, e)
 
         # ELBv2
         try:
@@ -420,9 +561,7 @@ def get_untagged_resources(
                         lb_name = arn_to_name.get(arn, arn)
                         result["ELBv2"].setdefault(region, []).append(lb_name)
         except Exception as e:
-            console.log(
-                f"[yellow]Warning: Could not fetch ELBv2 load balancers in {region}: {str(e)}[/]"
-            )
+            logger.warning("Could not fetch ELBv2 load balancers in %s: %s", region, e)
 
     return result
 
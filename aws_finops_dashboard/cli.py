@@ -3,16 +3,10 @@ import os
 import sys
 from typing import Any, Dict, List, Optional
 
-from packaging import version
 from rich.console import Console
-import boto3
 
-from aws_finops_dashboard.helpers import load_config_file
-from aws_finops_dashboard.dashboard_runner import run_dashboard
-from aws_finops_dashboard.ri_optimizer import RIOptimizer
-from aws_finops_dashboard.aws_client import get_aws_profiles
-from aws_finops_dashboard.resource_analyzer import UnusedResourceAnalyzer, analyze_unused_resources
-from aws_finops_dashboard.resource_analyzer_export import export_unused_resources
+# boto3, ReportLab and the dashboard modules are imported where they are used
+# so that --help and argument errors return without loading them.
 
 console = Console()
 
@@ -49,6 +43,7 @@ def check_latest_version():
     """Check for the latest version of the package."""
     try:
         import requests
+        from packaging import version
 
         current_version = version.parse(
             pkg_resources.get_distribution("aws-finops-dashboard").version
@@ -81,7 +76,7 @@ def main() -> int:
     # Suppress warnings about pkg_resources specifically
     import os
     os.environ["PYTHONWARNINGS"] = "ignore::UserWarning:pkg_resources"
-    
+
     # Create the parser instance to be accessible for get_default
     parser = argparse.ArgumentParser(description="AWS FinOps Dashboard CLI")
 
@@ -252,6 +247,11 @@ def main() -> int:
     )
 
     args = parser.parse_args()
+
+    from aws_finops_dashboard.helpers import configure_logging, load_config_file
+
+    # Per-profile warnings from worker threads go through logging
+    configure_logging(console)
     
     # Only display the welcome banner if --no-banner is not specified
     if not args.no_banner:
@@ -280,12 +280,17 @@ def main() -> int:
         run_resource_analyzer(args)
         return 0
 
+    from aws_finops_dashboard.dashboard_runner import run_dashboard
+
     result = run_dashboard(args)
     return 0 if result == 0 else 1
 
 
 def run_ri_optimizer(args):
     """Run the RI optimizer with the given arguments."""
+    from aws_finops_dashboard.aws_client import get_aws_profiles, get_session
+    from aws_finops_dashboard.ri_optimizer import RIOptimizer
+
     # Get AWS session based on arguments
     profiles = []
 
@@ -309,7 +314,7 @@ def run_ri_optimizer(args):
 
     for profile in profiles:
         console.print(f"[bold bright_magenta]Analyzing profile: {profile}[/]")
-        session = boto3.Session(profile_name=profile)
+        session = get_session(profile)
         
         # Create and run the optimizer
         optimizer = RIOptimizer(session, args.lookback_days)
@@ -350,6 +355,10 @@ def run_ri_optimizer(args):
 
 def run_resource_analyzer(args):
     """Run the unused resource analyzer with the given arguments."""
+    from aws_finops_dashboard.aws_client import get_aws_profiles, get_session
+    from aws_finops_dashboard.resource_analyzer import UnusedResourceAnalyzer
+    from aws_finops_dashboard.resource_analyzer_export import export_unused_resources
+
     # Get AWS session based on arguments
     profiles = []
 
@@ -376,7 +385,7 @@ def run_resource_analyzer(args):
             console.print(f"[cyan]Analyzing profile: [bold]{profile}[/bold][/]")
             
             # Create AWS session
-            session = boto3.Session(profile_name=profile)
+            session = get_session(profile)
             
             # Create and run the analyzer
             analyzer = UnusedResourceAnalyzer(
@@ -1,17 +1,20 @@
 import csv
-import json
+import logging
 import os
 from collections import defaultdict
 from datetime import date, datetime, timedelta
-from typing import Any, Dict, List, Optional, Tuple
+from operator import itemgetter
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
 from boto3.session import Session
 from rich.console import Console
 
-from aws_finops_dashboard.aws_client import get_account_id
+from aws_finops_dashboard.aws_client import get_account_id, get_budgets
+from aws_finops_dashboard.helpers import write_json_file
 from aws_finops_dashboard.types import BudgetInfo, CostData, EC2Summary, ProfileData
 
 console = Console()
+logger = logging.getLogger(__name__)
 
 
 def get_trend(session: Session, tag: Optional[List[str]] = None) -> Dict[str, Any]:
@@ -24,39 +27,7 @@ def get_trend(session: Session, tag: Optional[List[str]] = None) -> Dict[str, An
 
     """
     ce = session.client("ce")
-    tag_filters: List[Dict[str, Any]] = []
-    if tag:
-        for t in tag:
-            key, value = t.split("=", 1)
-            tag_filters.append({"Key": key, "Values": [value]})
-
-    filter_param: Optional[Dict[str, Any]] = None
-    if tag_filters:
-        if len(tag_filters) == 1:
-            filter_param = {
-                "Tags": {
-                    "Key": tag_filters[0]["Key"],
-                    "Values": tag_filters[0]["Values"],
-                    "MatchOptions": ["EQUALS"],
-                }
-            }
-
-        else:
-            filter_param = {
-                "And": [
-                    {
-                        "Tags": {
-                            "Key": f["Key"],
-                            "Values": f["Values"],
-                            "MatchOptions": ["EQUALS"],
-                        }
-                    }
-                    for f in tag_filters
-                ]
-            }
-    kwargs = {}
-    if filter_param:
-        kwargs["Filter"] = filter_param
+    kwargs = _tag_filter_kwargs(tag)
 
     end_date = date.today()
     start_date = (end_date - timedelta(days=180)).replace(day=1)
@@ -82,7 +53,7 @@ def get_trend(session: Session, tag: Optional[List[str]] = None) -> Dict[str, An
             cost = float(period["Total"]["UnblendedCost"]["Amount"])
             monthly_costs.append((month, cost))
     except Exception as e:
-        console.log(f"[yellow]Error getting monthly trend data: {e}[/]")
+        logger.warning("Error getting monthly trend data: %s", e)
         monthly_costs = []
 
     return {
@@ -178,10 +149,175 @@ def get_detailed_cost_data(
         return detailed_data
     
     except Exception as e:
-        console.log(f"[yellow]Error getting detailed cost data: {e}[/]")
+        logger.warning("Error getting detailed cost data: %s", e)
         return []
 
 
+def _cost_periods(
+    today: date, time_range: Optional[int] = None
+) -> Tuple[date, date, date, date]:
+    """Return the current and previous period bounds as (start, end, previous_start, previous_end)."""
+    if time_range:
+        end_date = today
+        start_date = today - timedelta(days=time_range)
+        previous_period_end = start_date - timedelta(days=1)
+        previous_period_start = previous_period_end - timedelta(days=time_range)
+
+    else:
+        start_date = today.replace(day=1)
+        end_date = today
+
+        # Edge case when user runs the tool on the first day of the month
+        if start_date == end_date:
+            end_date += timedelta(days=1)
+
+        # Last calendar month
+        previous_period_end = start_date - timedelta(days=1)
+        previous_period_start = previous_period_end.replace(day=1)
+
+    return start_date, end_date, previous_period_start, previous_period_end
+
+
+def _period_names(time_range: Optional[int] = None) -> Tuple[str, str]:
+    """Return the display names of the current and previous periods."""
+    current_period_name = (
+        f"Current {time_range} days cost" if time_range else "Current month's cost"
+    )
+    previous_period_name = (
+        f"Previous {time_range} days cost" if time_range else "Last month's cost"
+    )
+    return current_period_name, previous_period_name
+
+
+def _tag_filter_kwargs(tag: Optional[List[str]] = None) -> Dict[str, Any]:
+    """Build the Cost Explorer Filter keyword argument for "Key=Value" tags."""
+    tag_filters = [
+        {
+            "Tags": {
+                "Key": key,
+                "Values": [value],
+                "MatchOptions": ["EQUALS"],
+            }
+        }
+        for key, value in (t.split("=", 1) for t in tag or [])
+    ]
+    if not tag_filters:
+        return {}
+    if len(tag_filters) == 1:
+        return {"Filter": tag_filters[0]}
+    return {"Filter": {"And": tag_filters}}
+
+
+def _iter_cost_groups(ce: Any, **request: Any) -> Iterator[Dict[str, Any]]:
+    """Yield every group of a grouped get_cost_and_usage query, following NextPageToken."""
+    while True:
+        response = ce.get_cost_and_usage(**request)
+        for result in response.get("ResultsByTime", []):
+            yield from result.get("Groups", [])
+        next_token = response.get("NextPageToken")
+        if not next_token:
+            return
+        request["NextPageToken"] = next_token
+
+
+def get_linked_account_cost_data(
+    session: Session,
+    account_ids: Iterable[str],
+    time_range: Optional[int] = None,
+    tag: Optional[List[str]] = None,
+) -> Optional[Dict[str, CostData]]:
+    """
+    Get cost data for several accounts from one organization's Cost Explorer.
+
+    Instead of three Cost Explorer calls per account, this issues one query for
+    the current period grouped by LINKED_ACCOUNT and SERVICE and one for the
+    previous period grouped by LINKED_ACCOUNT. The session must belong to the
+    organization's management account. Budgets are not included because they
+    can only be read from each account.
+
+    Args:
+        session: The boto3 session of the management account
+        account_ids: Accounts to return cost data for
+        time_range: Optional time range in days for cost data (default: current month)
+        tag: Optional list of tags in "Key=Value" format to filter resources.
+
+    Returns:
+        Cost data keyed by account ID, or None if the grouped query failed and
+        the caller should fall back to per-account get_cost_data calls.
+    """
+    ce = session.client("ce")
+    start_date, end_date, previous_period_start, previous_period_end = _cost_periods(
+        date.today(), time_range
+    )
+    kwargs = _tag_filter_kwargs(tag)
+
+    service_costs: Dict[str, Dict[str, float]] = {
+        account_id: defaultdict(float) for account_id in account_ids
+    }
+    previous_costs = dict.fromkeys(service_costs, 0.0)
+
+    try:
+        for group in _iter_cost_groups(
+            ce,
+            TimePeriod={"Start": start_date.isoformat(), "End": end_date.isoformat()},
+            Granularity="MONTHLY",
+            Metrics=["UnblendedCost"],
+            GroupBy=[
+                {"Type": "DIMENSION", "Key": "LINKED_ACCOUNT"},
+                {"Type": "DIMENSION", "Key": "SERVICE"},
+            ],
+            **kwargs,
+        ):
+            account_id, service = group["Keys"]
+            if account_id in service_costs:
+                service_costs[account_id][service] += float(
+                    group["Metrics"]["UnblendedCost"]["Amount"]
+                )
+
+        for group in _iter_cost_groups(
+            ce,
+            TimePeriod={
+                "Start": previous_period_start.isoformat(),
+                "End": previous_period_end.isoformat(),
+            },
+            Granularity="MONTHLY",
+            Metrics=["UnblendedCost"],
+            GroupBy=[{"Type": "DIMENSION", "Key": "LINKED_ACCOUNT"}],
+            **kwargs,
+        ):
+            account_id = group["Keys"][0]
+            if account_id in previous_costs:
+                previous_costs[account_id] += float(
+                    group["Metrics"]["UnblendedCost"]["Amount"]
+                )
+    except Exception as e:
+        logger.warning("Error getting linked account cost data: %s", e)
+        return None
+
+    current_period_name, previous_period_name = _period_names(time_range)
+    return {
+        account_id: {
+            "account_id": account_id,
+            "current_month": sum(services.values()),
+            "last_month": previous_costs[account_id],
+            "current_month_cost_by_service": [
+                {"Keys": [service], "Metrics": {"UnblendedCost": {"Amount": str(amount)}}}
+                for service, amount in services.items()
+            ],
+            "budgets": [],
+            "current_period_name": current_period_name,
+            "previous_period_name": previous_period_name,
+            "time_range": time_range,
+            "current_period_start": start_date.isoformat(),
+            "current_period_end": end_date.isoformat(),
+            "previous_period_start": previous_period_start.isoformat(),
+            "previous_period_end": previous_period_end.isoformat(),
+            "monthly_costs": None,
+        }
+        for account_id, services in service_costs.items()
+    }
+
+
 def get_cost_data(
     session: Session,
     time_range: Optional[int] = None,
@@ -199,60 +335,13 @@ def get_cost_data(
 
     """
     ce = session.client("ce")
-    budgets = session.client("budgets", region_name="us-east-1")
     today = date.today()
 
-    tag_filters: List[Dict[str, Any]] = []
-    if tag:
-        for t in tag:
-            key, value = t.split("=", 1)
-            tag_filters.append({"Key": key, "Values": [value]})
+    kwargs = _tag_filter_kwargs(tag)
 
-    filter_param: Optional[Dict[str, Any]] = None
-    if tag_filters:
-        if len(tag_filters) == 1:
-            filter_param = {
-                "Tags": {
-                    "Key": tag_filters[0]["Key"],
-                    "Values": tag_filters[0]["Values"],
-                    "MatchOptions": ["EQUALS"],
-                }
-            }
-
-        else:
-            filter_param = {
-                "And": [
-                    {
-                        "Tags": {
-                            "Key": f["Key"],
-                            "Values": f["Values"],
-                            "MatchOptions": ["EQUALS"],
-                        }
-                    }
-                    for f in tag_filters
-                ]
-            }
-    kwargs = {}
-    if filter_param:
-        kwargs["Filter"] = filter_param
-
-    if time_range:
-        end_date = today
-        start_date = today - timedelta(days=time_range)
-        previous_period_end = start_date - timedelta(days=1)
-        previous_period_start = previous_period_end - timedelta(days=time_range)
-
-    else:
-        start_date = today.replace(day=1)
-        end_date = today
-
-        # Edge case when user runs the tool on the first day of the month
-        if start_date == end_date:
-            end_date += timedelta(days=1)
-
-        # Last calendar month
-        previous_period_end = start_date - timedelta(days=1)
-        previous_period_start = previous_period_end.replace(day=1)
+    start_date, end_date, previous_period_start, previous_period_end = _cost_periods(
+        today, time_range
+    )
 
     account_id = get_account_id(session)
 
@@ -264,7 +353,7 @@ def get_cost_data(
             **kwargs,
         )
     except Exception as e:
-        console.log(f"[yellow]Error getting current period cost: {e}[/]")
+        logger.warning("Error getting current period cost: %s", e)
         this_period = {"ResultsByTime": [{"Total": {"UnblendedCost": {"Amount": 0}}}]}
 
     try:
@@ -278,7 +367,7 @@ def get_cost_data(
             **kwargs,
         )
     except Exception as e:
-        console.log(f"[yellow]Error getting previous period cost: {e}[/]")
+        logger.warning("Error getting previous period cost: %s", e)
         previous_period = {
             "ResultsByTime": [{"Total": {"UnblendedCost": {"Amount": 0}}}]
         }
@@ -292,17 +381,19 @@ def get_cost_data(
             **kwargs,
         )
     except Exception as e:
-        console.log(f"[yellow]Error getting current period cost by service: {e}[/]")
+        logger.warning("Error getting current period cost by service: %s", e)
         current_period_cost_by_service = {"ResultsByTime": [{"Groups": []}]}
 
     # Aggregate cost by service across all days
-    aggregated_service_costs: Dict[str, float] = defaultdict(float)
+    aggregated_service_costs: Dict[str, float] = {}
 
     for result in current_period_cost_by_service.get("ResultsByTime", []):
         for group in result.get("Groups", []):
             service = group["Keys"][0]
             amount = float(group["Metrics"]["UnblendedCost"]["Amount"])
-            aggregated_service_costs[service] += amount
+            aggregated_service_costs[service] = (
+                aggregated_service_costs.get(service, 0.0) + amount
+            )
 
     # Reformat into groups by service
     aggregated_groups = [
@@ -310,25 +401,7 @@ def get_cost_data(
         for service, amount in aggregated_service_costs.items()
     ]
 
-    budgets_data: List[BudgetInfo] = []
-    try:
-        response = budgets.describe_budgets(AccountId=account_id)
-        for budget in response["Budgets"]:
-            budgets_data.append(
-                {
-                    "name": budget["BudgetName"],
-                    "limit": float(budget["BudgetLimit"]["Amount"]),
-                    "actual": float(budget["CalculatedSpend"]["ActualSpend"]["Amount"]),
-                    "forecast": float(
-                        budget["CalculatedSpend"]
-                        .get("ForecastedSpend", {})
-                        .get("Amount", 0.0)
-                    )
-                    or None,
-                }
-            )
-    except Exception as e:
-        pass
+    budgets_data = get_budgets(session)
 
     current_period_cost = 0.0
     for period in this_period.get("ResultsByTime", []):
@@ -340,12 +413,7 @@ def get_cost_data(
         if "Total" in period and "UnblendedCost" in period["Total"]:
             previous_period_cost += float(period["Total"]["UnblendedCost"]["Amount"])
 
-    current_period_name = (
-        f"Current {time_range} days cost" if time_range else "Current month's cost"
-    )
-    previous_period_name = (
-        f"Previous {time_range} days cost" if time_range else "Last month's cost"
-    )
+    current_period_name, previous_period_name = _period_names(time_range)
 
     # Initialize the response dictionary
     result = {
@@ -374,27 +442,74 @@ def get_cost_data(
     return result
 
 
+# Below this many groups a plain Python loop is faster than the NumPy group-by
+VECTORIZE_MIN_GROUPS = 64
+
+
+def aggregate_service_costs(groups: List[Dict]) -> List[Tuple[str, float]]:
+    """
+    Sum Cost Explorer service groups into (service, cost) pairs.
+
+    Amounts of 0.001 or less are ignored and the result is sorted by cost, highest first.
+    """
+    if not groups:
+        return []
+
+    valid_groups = [group for group in groups if "Keys" in group and "Metrics" in group]
+
+    if len(valid_groups) == 1:
+        # Nothing to merge or sort for a single service
+        group = valid_groups[0]
+        cost_amount = float(group["Metrics"]["UnblendedCost"]["Amount"])
+        return [(group["Keys"][0], cost_amount)] if cost_amount > 0.001 else []
+
+    if len(valid_groups) > VECTORIZE_MIN_GROUPS:
+        import numpy as np
+
+        services = np.array([g["Keys"][0] for g in valid_groups])
+        # Cost Explorer amounts are strings; parse them in one C-level cast
+        amounts = np.array(
+            [g["Metrics"]["UnblendedCost"]["Amount"] for g in valid_groups]
+        ).astype(np.float64)
+        keep = amounts > 0.001
+
+        # Group-by-sum: one bucket per distinct service, filled by bincount
+        unique_services, first_seen, inverse = np.unique(
+            services[keep], return_index=True, return_inverse=True
+        )
+        totals = np.bincount(
+            inverse.ravel(), weights=amounts[keep], minlength=len(unique_services)
+        )
+        # Highest cost first; ties keep the order Cost Explorer returned them in
+        order = np.lexsort((first_seen, -totals))
+        order = order[totals[order] > 0.001]
+        return list(zip(unique_services[order].tolist(), totals[order].tolist()))
+
+    service_totals: Dict[str, float] = {}
+    for group in valid_groups:
+        cost_amount = float(group["Metrics"]["UnblendedCost"]["Amount"])
+        if cost_amount > 0.001:
+            service = group["Keys"][0]
+            service_totals[service] = service_totals.get(service, 0.0) + cost_amount
+
+    service_cost_data = [
+        (service, cost) for service, cost in service_totals.items() if cost > 0.001
+    ]
+    service_cost_data.sort(key=itemgetter(1), reverse=True)
+    return service_cost_data
+
+
 def process_service_costs(
     cost_data: CostData,
 ) -> Tuple[List[str], List[Tuple[str, float]]]:
     """Process and format service costs from cost data."""
-    service_costs: List[str] = []
-    service_cost_data: List[Tuple[str, float]] = []
-
-    for group in cost_data["current_month_cost_by_service"]:
-        if "Keys" in group and "Metrics" in group:
-            service_name = group["Keys"][0]
-            cost_amount = float(group["Metrics"]["UnblendedCost"]["Amount"])
-            if cost_amount > 0.001:
-                service_cost_data.append((service_name, cost_amount))
-
-    service_cost_data.sort(key=lambda x: x[1], reverse=True)
-
-    if not service_cost_data:
-        service_costs.append("No costs associated with this account")
-    else:
-        for service_name, cost_amount in service_cost_data:
-            service_costs.append(f"{service_name}: ${cost_amount:.2f}")
+    service_cost_data = aggregate_service_costs(
+        cost_data["current_month_cost_by_service"]
+    )
+    service_costs = [
+        f"{service_name}: ${cost_amount:.2f}"
+        for service_name, cost_amount in service_cost_data
+    ] or ["No costs associated with this account"]
 
     return service_costs, service_cost_data
 
@@ -535,8 +650,7 @@ def export_to_json(
         else:
             output_filename = base_filename
 
-        with open(output_filename, "w") as jsonfile:
-            json.dump(data, jsonfile, indent=4)
+        write_json_file(data, output_filename)
 
         console.print(
             f"[bright_green]Exported dashboard data to {os.path.abspath(output_filename)}[/]"
@@ -1,21 +1,29 @@
 import argparse
+import logging
 from collections import defaultdict
-from typing import Any, Dict, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional, Tuple, cast
 import os
-import json
 
-import boto3
 from rich import box
 from rich.console import Console
-from rich.progress import track
+from rich.live import Live
+from rich.progress import Progress
 from rich.status import Status
 from rich.table import Column, Table
+from rich.text import Text
 
 from aws_finops_dashboard.aws_client import (
-    get_accessible_regions,
-    get_account_id,
+    clear_profile_caches,
+    get_accessible_regions_for_profile,
+    get_account_id_for_profile,
     get_aws_profiles,
     get_budgets,
+    get_management_account_id,
+    get_organization_account_ids,
+    get_session,
     get_stopped_instances,
     get_untagged_resources,
     get_unused_eips,
@@ -25,28 +33,45 @@ from aws_finops_dashboard.cost_processor import (
     export_to_csv,
     export_to_json,
     get_cost_data,
+    get_linked_account_cost_data,
     get_trend,
 )
 from aws_finops_dashboard.helpers import (
     clean_rich_tags,
+    configure_logging,
     export_audit_report_to_pdf,
     export_cost_dashboard_to_pdf,
     export_audit_report_to_csv,
     export_audit_report_to_json,
     export_trend_data_to_json,
-    convert_currency,
     format_currency,
+    parse_budget_item,
+    usd_converter,
+    write_json_file,
 )
 from aws_finops_dashboard.profile_processor import (
+    failed_profile_data,
     process_combined_profiles,
     process_single_profile,
 )
-from aws_finops_dashboard.types import ProfileData
+from aws_finops_dashboard.types import CostData, ProfileData
 from aws_finops_dashboard.visualisations import create_trend_bars
 from aws_finops_dashboard.anomaly_detection import detect_anomalies
 from aws_finops_dashboard.optimization_recommendations import generate_optimization_recommendations
 
 console = Console()
+logger = logging.getLogger(__name__)
+
+# Upper bound on profiles processed concurrently; the work is I/O-bound AWS calls
+MAX_PROFILE_WORKERS = 32
+
+# Largest dashboard drawn with a live table; bigger ones are printed once at the end
+LIVE_TABLE_MAX_ROWS = 50
+
+
+def _profile_worker_count(num_tasks: int) -> int:
+    """Return a thread pool size for the given number of profile tasks."""
+    return max(1, min(MAX_PROFILE_WORKERS, num_tasks))
 
 
 def _initialize_profiles(
@@ -59,11 +84,12 @@ def _initialize_profiles(
             "[bold red]No AWS profiles found. Please configure AWS CLI first.[/]"
         )
         raise SystemExit(1)
+    available_set = set(available_profiles)
 
     profiles_to_use = []
     if args.profiles:
         for profile in args.profiles:
-            if profile in available_profiles:
+            if profile in available_set:
                 profiles_to_use.append(profile)
             else:
                 console.log(
@@ -77,7 +103,7 @@ def _initialize_profiles(
     elif args.all:
         profiles_to_use = available_profiles
     else:
-        if "default" in available_profiles:
+        if "default" in available_set:
             profiles_to_use = ["default"]
         else:
             profiles_to_use = available_profiles
@@ -111,9 +137,9 @@ def _run_audit_report(profiles_to_use: List[str], args: argparse.Namespace) -> N
     comma_nl = ",\n"
 
     for profile in profiles_to_use:
-        session = boto3.Session(profile_name=profile)
-        account_id = get_account_id(session) or "Unknown"
-        regions = args.regions or get_accessible_regions(session)
+        session = get_session(profile)
+        account_id = get_account_id_for_profile(profile) or "Unknown"
+        regions = args.regions or get_accessible_regions_for_profile(profile)
 
         try:
             untagged = get_untagged_resources(session, regions)
@@ -199,10 +225,12 @@ def _run_audit_report(profiles_to_use: List[str], args: argparse.Namespace) -> N
 
     if args.report_name:  # Ensure report_name is provided for any export
         if args.report_type:
+            # One timestamp per run keeps filenames and footers consistent across formats
+            generated_at = datetime.now()
             for report_type in args.report_type:
                 if report_type == "csv":
                     csv_path = export_audit_report_to_csv(
-                        audit_data, args.report_name, args.dir
+                        audit_data, args.report_name, args.dir, generated_at
                     )
                     if csv_path:
                         console.print(
@@ -210,7 +238,7 @@ def _run_audit_report(profiles_to_use: List[str], args: argparse.Namespace) -> N
                         )
                 elif report_type == "json":
                     json_path = export_audit_report_to_json(
-                        raw_audit_data, args.report_name, args.dir
+                        raw_audit_data, args.report_name, args.dir, generated_at
                     )
                     if json_path:
                         console.print(
@@ -218,7 +246,7 @@ def _run_audit_report(profiles_to_use: List[str], args: argparse.Namespace) -> N
                         )
                 elif report_type == "pdf":
                     pdf_path = export_audit_report_to_pdf(
-                        audit_data, args.report_name, args.dir
+                        audit_data, args.report_name, args.dir, generated_at
                     )
                     if pdf_path:
                         console.print(
@@ -234,19 +262,23 @@ def _run_trend_analysis(profiles_to_use: List[str], args: argparse.Namespace) ->
     )
 
     try:
-        for profile in profiles_to_use:
+        # Only the 6-month trend is shown, so skip the rest of get_cost_data
+        with ThreadPoolExecutor(
+            max_workers=_profile_worker_count(len(profiles_to_use))
+        ) as executor:
+            trends = list(
+                executor.map(
+                    lambda profile: get_trend(get_session(profile), args.tag),
+                    profiles_to_use,
+                )
+            )
+
+        for profile, trend in zip(profiles_to_use, trends):
             console.print(f"[bright_cyan]Processing profile: {profile}[/]")
-            session = boto3.Session(profile_name=profile)
-            if not session:
-                console.print(f"[bold red]Error creating session for profile {profile}[/]")
-                continue
+            monthly_costs = trend.get("monthly_costs", [])
 
-            # Get cost data with fetch_trend=True to get the past 6 months
-            cost_data = get_cost_data(session, tag=args.tag, fetch_trend=True)
-            
-            # Check if monthly_trend_data key exists and has data
-            if "monthly_trend_data" in cost_data and cost_data["monthly_trend_data"]:
-                create_trend_bars(cost_data["monthly_trend_data"], args.currency)
+            if monthly_costs:
+                create_trend_bars(monthly_costs, args.currency)
             else:
                 console.print("[yellow]No trend data available for this profile[/]")
                 
@@ -254,7 +286,7 @@ def _run_trend_analysis(profiles_to_use: List[str], args: argparse.Namespace) ->
             if args.report_name and "json" in args.report_type:
                 trend_data = {
                     "profile": profile,
-                    "monthly_costs": cost_data.get("monthly_trend_data", []),
+                    "monthly_costs": monthly_costs,
                 }
                 export_trend_data_to_json(
                     trend_data, args.report_name, args.dir, args.currency
@@ -267,13 +299,20 @@ def _run_trend_analysis(profiles_to_use: List[str], args: argparse.Namespace) ->
 
 
 def _get_display_table_period_info(
-    profiles_to_use: List[str], time_range: Optional[int]
-) -> Tuple[str, str, str, str]:
-    """Get period information for the display table."""
+    profiles_to_use: List[str],
+    time_range: Optional[int],
+    tag: Optional[List[str]] = None,
+) -> Tuple[str, str, str, str, Optional[CostData]]:
+    """
+    Get period information for the display table.
+
+    The cost data fetched for the first profile is returned as well so that
+    it can be reused instead of querying Cost Explorer for it a second time.
+    """
     if profiles_to_use:
         try:
-            sample_session = boto3.Session(profile_name=profiles_to_use[0])
-            sample_cost_data = get_cost_data(sample_session, time_range)
+            sample_session = get_session(profiles_to_use[0])
+            sample_cost_data = get_cost_data(sample_session, time_range, tag)
             previous_period_name = sample_cost_data.get(
                 "previous_period_name", "Last Month Due"
             )
@@ -287,10 +326,11 @@ def _get_display_table_period_info(
                 current_period_name,
                 previous_period_dates,
                 current_period_dates,
+                sample_cost_data,
             )
         except Exception:
             pass  # Fall through to default values
-    return "Last Month Due", "Current Month Cost", "N/A", "N/A"
+    return "Last Month Due", "Current Month Cost", "N/A", "N/A", None
 
 
 def create_display_table(
@@ -325,138 +365,241 @@ def create_display_table(
 
 def add_profile_to_table(table: Table, profile_data: ProfileData, currency: str = "USD") -> None:
     """Add profile data to the display table."""
+    # Cells are styled Text objects, so Rich does not have to parse markup per row
     if profile_data["success"]:
+        conv = usd_converter(currency)
+        fmt = partial(format_currency, currency_code=currency)
+
         percentage_change = profile_data.get("percent_change_in_total_cost")
-        change_text = ""
+        change_text: Tuple[str, str] = ("", "")
 
         if percentage_change is not None:
             if percentage_change > 0:
-                change_text = f"\n\n[bright_red]⬆ {percentage_change:.2f}%"
+                change_text = (f"\n\n⬆ {percentage_change:.2f}%", "bright_red")
             elif percentage_change < 0:
-                change_text = f"\n\n[bright_green]⬇ {abs(percentage_change):.2f}%"
+                change_text = (f"\n\n⬇ {abs(percentage_change):.2f}%", "bright_green")
             elif percentage_change == 0:
-                change_text = "\n\n[bright_yellow]➡ 0.00%[/]"
+                change_text = ("\n\n➡ 0.00%", "bright_yellow")
 
-        # Convert currency values
-        current_month_value = convert_currency(profile_data['current_month'], "USD", currency)
-        last_month_value = convert_currency(profile_data['last_month'], "USD", currency)
-        
         # Format with currency symbol
-        current_month_formatted = format_currency(current_month_value, currency)
-        last_month_formatted = format_currency(last_month_value, currency)
+        current_month_formatted = fmt(conv(profile_data["current_month"]))
+        last_month_formatted = fmt(conv(profile_data["last_month"]))
 
-        current_month_with_change = (
-            f"[bold red]{current_month_formatted}[/]{change_text}"
-        )
-
-        # Convert and format service costs
-        service_costs_formatted = []
-        for service_cost in profile_data["service_costs_formatted"]:
-            # Extract service name and cost value
-            if ": $" in service_cost:
-                service_name, cost_str = service_cost.split(": $")
-                cost_value = float(cost_str)
-                converted_cost = convert_currency(cost_value, "USD", currency)
-                formatted_cost = format_currency(converted_cost, currency)
-                service_costs_formatted.append(f"{service_name}: {formatted_cost}")
-            else:
-                service_costs_formatted.append(service_cost)
+        # Convert the raw service costs rather than re-parsing the USD display strings
+        service_costs_formatted = [
+            f"{service_name}: {fmt(conv(cost))}"
+            for service_name, cost in profile_data["service_costs"]
+        ] or profile_data["service_costs_formatted"]
         
         # Convert and format budget info
         budget_info_formatted = []
         for budget_item in profile_data["budget_info"]:
-            if " limit: $" in budget_item:
-                budget_name, limit_str = budget_item.split(" limit: $")
-                limit_value = float(limit_str)
-                converted_limit = convert_currency(limit_value, "USD", currency)
-                formatted_limit = format_currency(converted_limit, currency)
-                budget_info_formatted.append(f"{budget_name} limit: {formatted_limit}")
-            elif " actual: $" in budget_item:
-                budget_name, actual_str = budget_item.split(" actual: $")
-                actual_value = float(actual_str)
-                converted_actual = convert_currency(actual_value, "USD", currency)
-                formatted_actual = format_currency(converted_actual, currency)
-                budget_info_formatted.append(f"{budget_name} actual: {formatted_actual}")
-            elif " forecast: $" in budget_item:
-                budget_name, forecast_str = budget_item.split(" forecast: $")
-                forecast_value = float(forecast_str)
-                converted_forecast = convert_currency(forecast_value, "USD", currency)
-                formatted_forecast = format_currency(converted_forecast, currency)
-                budget_info_formatted.append(f"{budget_name} forecast: {formatted_forecast}")
-            else:
+            parsed = parse_budget_item(budget_item)
+            if parsed is None:
                 budget_info_formatted.append(budget_item)
+                continue
+            budget_name, field, amount = parsed
+            budget_info_formatted.append(f"{budget_name} {field}: {fmt(conv(amount))}")
 
         table.add_row(
-            f"[bright_magenta]Profile: {profile_data['profile']}\nAccount: {profile_data['account_id']}[/]",
-            f"[bold red]{last_month_formatted}[/]",
-            current_month_with_change,
-            "[bright_green]"
-            + "\n".join(service_costs_formatted)
-            + "[/]",
-            "[bright_yellow]" + "\n\n".join(budget_info_formatted) + "[/]",
+            Text(
+                f"Profile: {profile_data['profile']}\nAccount: {profile_data['account_id']}",
+                style="bright_magenta",
+            ),
+            Text(last_month_formatted, style="bold red"),
+            Text.assemble((current_month_formatted, "bold red"), change_text),
+            Text("\n".join(service_costs_formatted), style="bright_green"),
+            Text("\n\n".join(budget_info_formatted), style="bright_yellow"),
             "\n".join(profile_data["ec2_summary_formatted"]),
         )
     else:
         table.add_row(
-            f"[bright_magenta]{profile_data['profile']}[/]",
-            "[red]Error[/]",
-            "[red]Error[/]",
-            f"[red]Failed to process profile: {profile_data['error']}[/]",
-            "[red]N/A[/]",
-            "[red]N/A[/]",
+            Text(profile_data["profile"], style="bright_magenta"),
+            Text("Error", style="red"),
+            Text("Error", style="red"),
+            Text(f"Failed to process profile: {profile_data['error']}", style="red"),
+            Text("N/A", style="red"),
+            Text("N/A", style="red"),
         )
 
 
+def _get_organization_cost_data(
+    account_profiles: Dict[str, List[str]],
+    time_range: Optional[int],
+    tag: Optional[List[str]],
+) -> Dict[str, CostData]:
+    """
+    Fetch cost data for every combined account in one organization at once.
+
+    When one of the accounts is its organization's management account, a
+    single grouped Cost Explorer query from it covers all member accounts.
+    Accounts outside that organization, or all accounts when no management
+    account is among the profiles, are left to the per-account path.
+    """
+    if len(account_profiles) < 2:
+        return {}
+
+    first_profile = next(iter(account_profiles.values()))[0]
+    management_id = get_management_account_id(get_session(first_profile))
+    if management_id not in account_profiles:
+        return {}
+
+    payer_session = get_session(account_profiles[management_id][0])
+    member_ids = get_organization_account_ids(payer_session)
+    if not member_ids:
+        return {}
+
+    linked_ids = [account_id for account_id in account_profiles if account_id in member_ids]
+    return (
+        get_linked_account_cost_data(payer_session, linked_ids, time_range, tag)
+        or {}
+    )
+
+
 def _generate_dashboard_data(
     profiles_to_use: List[str],
     user_regions: Optional[List[str]],
     time_range: Optional[int],
     args: argparse.Namespace,
     table: Table,
+    sample_cost_data: Optional[CostData] = None,
 ) -> List[ProfileData]:
-    """Fetch, process, and prepare the main dashboard data."""
+    """
+    Fetch, process, and prepare the main dashboard data.
+
+    sample_cost_data is the already fetched cost data of profiles_to_use[0].
+    """
+    sample_profile = profiles_to_use[0] if profiles_to_use else None
     export_data: List[ProfileData] = []
     if args.combine:
-        account_profiles = defaultdict(list)
-        for profile in profiles_to_use:
+        def lookup_account_id(profile: str) -> Optional[str]:
             try:
-                session = boto3.Session(profile_name=profile)
-                current_account_id = get_account_id(
-                    session
-                )  # Renamed to avoid conflict
-                if current_account_id:
-                    account_profiles[current_account_id].append(profile)
-                else:
-                    console.log(
-                        f"[yellow]Could not determine account ID for profile {profile}[/]"
-                    )
+                account_id = get_account_id_for_profile(profile)
             except Exception as e:
-                console.log(
-                    f"[bold red]Error checking account ID for profile {profile}: {str(e)}[/]"
+                logger.error(
+                    "Error checking account ID for profile %s: %s", profile, e
                 )
+                return None
+            if not account_id:
+                logger.warning(
+                    "Could not determine account ID for profile %s", profile
+                )
+            return account_id
+
+        # Grouping needs every profile's account, so resolve them all at once
+        with ThreadPoolExecutor(
+            max_workers=_profile_worker_count(len(profiles_to_use))
+        ) as executor:
+            account_ids = list(executor.map(lookup_account_id, profiles_to_use))
+
+        account_profiles = defaultdict(list)
+        for profile, current_account_id in zip(profiles_to_use, account_ids):
+            if current_account_id:
+                account_profiles[current_account_id].append(profile)
 
         console.print("[bright_cyan]Fetching cost data...[/]")
-        for account_id_key, profiles_list in account_profiles.items():
-            # account_id_key here is known to be a string because it's a key from account_profiles
-            # where None keys were filtered out when populating it.
-            if len(profiles_list) > 1:
-                profile_data = process_combined_profiles(
-                    account_id_key, profiles_list, user_regions, time_range, args.tag
-                )
-            else:
-                profile_data = process_single_profile(
-                    profiles_list[0], user_regions, time_range, args.tag
-                )
-            export_data.append(profile_data)
-            add_profile_to_table(table, profile_data, args.currency)
+        linked_cost_data = _get_organization_cost_data(
+            account_profiles, time_range, args.tag
+        )
+
+        # account_id_key here is known to be a string because it's a key from account_profiles
+        # where None keys were filtered out when populating it.
+        # Cost data already known from the organization query or the header sample
+        known_cost_data = dict(linked_cost_data)
+        if sample_cost_data is not None:
+            for account_id_key, profiles_list in account_profiles.items():
+                if profiles_list[0] == sample_profile:
+                    known_cost_data.setdefault(account_id_key, sample_cost_data)
+
+        tasks = [
+            (
+                ", ".join(profiles_list),
+                process_combined_profiles,
+                (
+                    account_id_key,
+                    profiles_list,
+                    user_regions,
+                    time_range,
+                    args.tag,
+                    known_cost_data.get(account_id_key),
+                ),
+            )
+            if len(profiles_list) > 1 or account_id_key in linked_cost_data
+            else (
+                profiles_list[0],
+                process_single_profile,
+                (
+                    profiles_list[0],
+                    user_regions,
+                    time_range,
+                    args.tag,
+                    known_cost_data.get(account_id_key),
+                ),
+            )
+            for account_id_key, profiles_list in account_profiles.items()
+        ]
     else:
         console.print("[bright_cyan]Fetching cost data...[/]")
-        for profile in profiles_to_use:
-            profile_data = process_single_profile(
-                profile, user_regions, time_range, args.tag
+        tasks = [
+            (
+                profile,
+                process_single_profile,
+                (
+                    profile,
+                    user_regions,
+                    time_range,
+                    args.tag,
+                    sample_cost_data if profile == sample_profile else None,
+                ),
             )
+            for profile in profiles_to_use
+        ]
+
+    results: List[Optional[ProfileData]] = [None] * len(tasks)
+    next_row = 0
+    # Small tables are drawn live as profiles finish, keeping the requested
+    # order. Live redraws the whole table on every refresh, so large ones are
+    # filled in one pass after a progress bar and printed once.
+    stream_rows = len(tasks) <= LIVE_TABLE_MAX_ROWS
+    if stream_rows:
+        # The default "ellipsis" overflow crops a table taller than the screen
+        # while it is live; Rich prints it in full when the display stops
+        display: Any = Live(table, console=console, refresh_per_second=4)
+    else:
+        display = Progress(console=console, transient=True)
+        progress_task = display.add_task("Processing profiles", total=len(tasks))
+
+    with ThreadPoolExecutor(
+        max_workers=_profile_worker_count(len(tasks))
+    ) as executor, display:
+        futures = {
+            executor.submit(process_fn, *process_args): index
+            for index, (_, process_fn, process_args) in enumerate(tasks)
+        }
+        for future in as_completed(futures):
+            index = futures[future]
+            try:
+                results[index] = future.result()
+            except Exception as e:
+                results[index] = failed_profile_data(tasks[index][0], e)
+
+            if not stream_rows:
+                display.advance(progress_task)
+                continue
+            while next_row < len(results):
+                profile_data = results[next_row]
+                if profile_data is None:
+                    break
+                export_data.append(profile_data)
+                add_profile_to_table(table, profile_data, args.currency)
+                next_row += 1
+
+    if not stream_rows:
+        # Every slot is filled once the executor has finished
+        for profile_data in cast(List[ProfileData], results):
             export_data.append(profile_data)
             add_profile_to_table(table, profile_data, args.currency)
+        console.print(table)
     return export_data
 
 
@@ -473,41 +616,57 @@ def _export_dashboard_reports(
     from aws_finops_dashboard.helpers import (
         export_cost_dashboard_to_csv,
         export_cost_dashboard_to_json,
-        export_cost_dashboard_to_pdf,
     )
 
+    generated_at = datetime.now()
+
+    exports: List[Tuple[str, Callable[..., Optional[str]], Tuple[Any, ...]]] = []
     if "csv" in args.report_type:
-        csv_path = export_cost_dashboard_to_csv(
-            export_data, args.report_name, args.dir
-        )
-        if csv_path:
-            console.print(
-                f"[bright_green]Report exported to CSV: {csv_path}[/]"
+        exports.append(
+            (
+                "CSV",
+                export_cost_dashboard_to_csv,
+                (export_data, args.report_name, args.dir, generated_at),
             )
-
-    if "json" in args.report_type:
-        json_path = export_cost_dashboard_to_json(
-            export_data, args.report_name, args.dir
         )
-        if json_path:
-            console.print(
-                f"[bright_green]Report exported to JSON: {json_path}[/]"
+    if "json" in args.report_type:
+        exports.append(
+            (
+                "JSON",
+                export_cost_dashboard_to_json,
+                (export_data, args.report_name, args.dir, generated_at),
             )
-
-    if "pdf" in args.report_type:
-        pdf_path = export_cost_dashboard_to_pdf(
-            export_data,
-            args.report_name,
-            args.dir,
-            previous_period_dates,
-            current_period_dates,
-            args.currency,
-            args.enhanced_pdf,
         )
-        if pdf_path:
-            console.print(
-                f"[bright_green]Report exported to PDF: {pdf_path}[/]"
+    if "pdf" in args.report_type:
+        exports.append(
+            (
+                "PDF",
+                export_cost_dashboard_to_pdf,
+                (
+                    export_data,
+                    args.report_name,
+                    args.dir,
+                    previous_period_dates,
+                    current_period_dates,
+                    args.currency,
+                    args.enhanced_pdf,
+                    generated_at,
+                ),
             )
+        )
+
+    # The PDF build dominates; let the CSV/JSON file writes overlap with it
+    with ThreadPoolExecutor(max_workers=max(1, len(exports))) as executor:
+        futures = [
+            (label, executor.submit(export_fn, *export_args))
+            for label, export_fn, export_args in exports
+        ]
+        for label, future in futures:
+            path = future.result()
+            if path:
+                console.print(
+                    f"[bright_green]Report exported to {label}: {path}[/]"
+                )
 
 
 def _run_anomaly_detection(profiles_to_use: List[str], args: argparse.Namespace) -> None:
@@ -521,8 +680,8 @@ def _run_anomaly_detection(profiles_to_use: List[str], args: argparse.Namespace)
     for profile in profiles_to_use:
         console.print(f"[bold bright_magenta]Analyzing profile: {profile}[/]")
         
-        session = boto3.Session(profile_name=profile)
-        account_id = get_account_id(session) or "Unknown"
+        session = get_session(profile)
+        account_id = get_account_id_for_profile(profile) or "Unknown"
         
         # Run anomaly detection
         result = detect_anomalies(
@@ -577,8 +736,7 @@ def _run_anomaly_detection(profiles_to_use: List[str], args: argparse.Namespace)
             
             try:
                 os.makedirs(output_dir, exist_ok=True)
-                with open(filepath, "w") as f:
-                    json.dump(result, f, indent=2)
+                write_json_file(result, filepath, indent=2)
                 console.print(f"[green]Anomaly data exported to {filepath}[/]")
             except Exception as e:
                 console.print(f"[red]Error exporting anomaly data: {str(e)}[/]")
@@ -595,8 +753,8 @@ def _run_optimization_recommendations(profiles_to_use: List[str], args: argparse
     for profile in profiles_to_use:
         console.print(f"[bold bright_magenta]Analyzing profile: {profile}[/]")
         
-        session = boto3.Session(profile_name=profile)
-        account_id = get_account_id(session) or "Unknown"
+        session = get_session(profile)
+        account_id = get_account_id_for_profile(profile) or "Unknown"
         
         # Generate optimization recommendations
         result = generate_optimization_recommendations(
@@ -750,8 +908,7 @@ def _run_optimization_recommendations(profiles_to_use: List[str], args: argparse
             
             try:
                 os.makedirs(output_dir, exist_ok=True)
-                with open(filepath, "w") as f:
-                    json.dump(result, f, indent=2)
+                write_json_file(result, filepath, indent=2)
                 console.print(f"[green]Optimization data exported to {filepath}[/]")
             except Exception as e:
                 console.print(f"[red]Error exporting optimization data: {str(e)}[/]")
@@ -770,7 +927,7 @@ def _run_resource_analyzer(profiles_to_use: List[str], args: argparse.Namespace)
             console.print(f"[cyan]Analyzing profile: [bold]{profile}[/bold][/]")
             
             # Create AWS session
-            session = boto3.Session(profile_name=profile)
+            session = get_session(profile)
             
             # Create and run the analyzer
             analyzer = UnusedResourceAnalyzer(session, args.lookback_days or 14)
@@ -802,11 +959,16 @@ def _run_resource_analyzer(profiles_to_use: List[str], args: argparse.Namespace)
 
 def run_dashboard(args: argparse.Namespace) -> int:
     """Main function to run the AWS FinOps dashboard."""
+    # Sessions and region lists are reused within a run only, so a long-lived
+    # API or web server sees credential changes on its next run
+    clear_profile_caches()
     try:
         # Apply force_color if specified
         global console
         if hasattr(args, 'force_color') and args.force_color:
             console = Console(force_terminal=True, color_system="truecolor")
+        # Warnings from worker threads are logged; show them wherever this run prints
+        configure_logging(console)
             
         with Status("[bright_cyan]Initialising...", spinner="aesthetic", speed=0.4):
             profiles_to_use, user_regions, time_range, currency = _initialize_profiles(args)
@@ -843,7 +1005,8 @@ def run_dashboard(args: argparse.Namespace) -> int:
                 current_period_name,
                 previous_period_dates,
                 current_period_dates,
-            ) = _get_display_table_period_info(profiles_to_use, time_range)
+                sample_cost_data,
+            ) = _get_display_table_period_info(profiles_to_use, time_range, args.tag)
 
             table = create_display_table(
                 previous_period_dates,
@@ -853,11 +1016,9 @@ def run_dashboard(args: argparse.Namespace) -> int:
             )
 
         export_data = _generate_dashboard_data(
-            profiles_to_use, user_regions, time_range, args, table
+            profiles_to_use, user_regions, time_range, args, table, sample_cost_data
         )
-                    
-        console.print(table)
-                
+
         _export_dashboard_reports(
             export_data, args, previous_period_dates, current_period_dates
         )
@@ -1,65 +1,289 @@
 import csv  # Added csv
+import heapq
 import json
+import logging
 import os
 import re
 import sys
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple, Union
-
-# Conditional import for tomllib
-if sys.version_info >= (3, 11):
-    import tomllib
-else:
-    try:
-        import tomli as tomllib  # Use tomli and alias it as tomllib
-    except ImportError:
-        tomllib = None  # type: ignore
-
-import yaml
-from reportlab.lib import colors
-from reportlab.lib.pagesizes import landscape, letter, A4
-from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
-from reportlab.lib.units import inch
-from reportlab.platypus import (
-    Flowable,
-    Paragraph,
-    SimpleDocTemplate,
-    Spacer,
-    Table,
-    TableStyle,
-    PageBreak,
-    Image,
-    ListFlowable,
-    ListItem,
+from functools import lru_cache, partial
+from itertools import cycle, islice
+from operator import itemgetter
+from types import MappingProxyType
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+    Union,
 )
-from reportlab.graphics.shapes import Drawing
-from reportlab.graphics.charts.piecharts import Pie
-from reportlab.graphics.charts.barcharts import VerticalBarChart
-from reportlab.graphics.charts.legends import Legend
+
+try:
+    import orjson  # Optional: faster JSON encoding that writes bytes directly
+except ImportError:
+    orjson = None  # type: ignore
+
 from rich.console import Console
 
 from aws_finops_dashboard.types import ProfileData
 
+if TYPE_CHECKING:
+    from reportlab.lib.styles import ParagraphStyle, StyleSheet1
+    from reportlab.platypus import Flowable, TableStyle
+
+# ReportLab, PyYAML and the TOML parser are imported inside the functions that
+# need them so that CLI startup and dashboard-only runs do not pay for them.
+
 console = Console()
 
+# Handler installed by configure_logging, replaced on each call
+_LOG_HANDLER: Optional[logging.Handler] = None
 
-styles = getSampleStyleSheet()
 
-# Custom style for the footer
-audit_footer_style = ParagraphStyle(
-    name="AuditFooter",
-    parent=styles["Normal"],
-    fontSize=8,
-    textColor=colors.grey,
-    alignment=1,
-    leading=10,
-)
+def configure_logging(target_console: Console) -> None:
+    """
+    Show the package's warnings on a Rich console.
+
+    The CLI calls this at start-up and run_dashboard calls it on every run, so
+    the API server and web UI, which do not configure logging themselves, get
+    the same warnings in the output they capture.
+    """
+    from rich.logging import RichHandler
+
+    global _LOG_HANDLER
+    package_logger = logging.getLogger("aws_finops_dashboard")
+    if _LOG_HANDLER is not None:
+        package_logger.removeHandler(_LOG_HANDLER)
+    _LOG_HANDLER = RichHandler(console=target_console, show_path=False)
+    _LOG_HANDLER.setLevel(logging.WARNING)
+    _LOG_HANDLER.setFormatter(logging.Formatter("%(message)s"))
+    package_logger.addHandler(_LOG_HANDLER)
+
+
+@lru_cache(maxsize=None)
+def _table_styles() -> Dict[str, "TableStyle"]:
+    """
+    Return the PDF table styles, building them on first use.
+
+    Table styles are immutable once built and can be shared across Table objects.
+    """
+    from reportlab.lib import colors
+    from reportlab.platypus import TableStyle
+
+    return {
+        "audit": TableStyle(
+            [
+                ("BACKGROUND", (0, 0), (-1, 0), colors.black),
+                ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
+                ("FONTNAME", (0, 0), (-1, -1), "Helvetica"),
+                ("FONTSIZE", (0, 0), (-1, -1), 8),
+                ("ALIGN", (0, 0), (-1, -1), "LEFT"),
+                ("VALIGN", (0, 0), (-1, -1), "TOP"),
+                ("GRID", (0, 0), (-1, -1), 0.25, colors.black),
+                ("BACKGROUND", (0, 1), (-1, -1), colors.whitesmoke),
+            ]
+        ),
+        "standard": TableStyle(
+            [
+                ("BACKGROUND", (0, 0), (-1, 0), colors.black),
+                ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
+                ("FONTNAME", (0, 0), (-1, -1), "Helvetica"),
+                ("FONTSIZE", (0, 0), (-1, -1), 8),
+                ("ALIGN", (0, 0), (-1, -1), "LEFT"),
+                ("VALIGN", (0, 0), (-1, -1), "TOP"),
+                ("GRID", (0, 0), (-1, -1), 0.25, colors.grey),
+                ("BACKGROUND", (0, 1), (-1, -1), colors.whitesmoke),
+            ]
+        ),
+        "enhanced": TableStyle(
+            [
+                ("BACKGROUND", (0, 0), (-1, 0), colors.steelblue),
+                ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
+                ("FONTNAME", (0, 0), (-1, -1), "Helvetica"),
+                ("FONTSIZE", (0, 0), (-1, 0), 8),  # Header font size
+                ("FONTSIZE", (0, 1), (-1, -1), 7),  # Data font size (smaller)
+                ("ALIGN", (0, 0), (-1, -1), "LEFT"),
+                ("VALIGN", (0, 0), (-1, -1), "TOP"),
+                ("GRID", (0, 0), (-1, -1), 0.25, colors.grey),
+                ("BACKGROUND", (0, 1), (-1, -1), colors.whitesmoke),
+                ("WORDWRAP", (0, 0), (-1, -1), True),  # Enable word wrapping
+                # Add alternating row colors for better readability
+                ("BACKGROUND", (0, 1), (-1, -1), colors.whitesmoke),
+                (
+                    "ROWBACKGROUNDS",
+                    (0, 1),
+                    (-1, -1),
+                    [colors.whitesmoke, colors.lightgrey],
+                ),
+                # Add some padding
+                ("TOPPADDING", (0, 0), (-1, -1), 3),
+                ("BOTTOMPADDING", (0, 0), (-1, -1), 3),
+                ("LEFTPADDING", (0, 0), (-1, -1), 3),
+                ("RIGHTPADDING", (0, 0), (-1, -1), 3),
+            ]
+        ),
+    }
+
+
+@lru_cache(maxsize=None)
+def _pie_colors() -> Tuple[Any, ...]:
+    """Return the pie chart slice palette."""
+    from reportlab.lib import colors
+
+    return (
+        colors.red,
+        colors.green,
+        colors.blue,
+        colors.yellow,
+        colors.cyan,
+        colors.magenta,
+        colors.pink,
+        colors.lavender,
+        colors.orange,
+        colors.purple,
+    )
+
+
+@lru_cache(maxsize=None)
+def _sample_styles() -> "StyleSheet1":
+    """Return ReportLab's sample stylesheet, built once and shared by all reports."""
+    from reportlab.lib.styles import getSampleStyleSheet
+
+    return getSampleStyleSheet()
+
+
+@lru_cache(maxsize=None)
+def _audit_footer_style() -> "ParagraphStyle":
+    """Return the custom style for the audit report footer."""
+    from reportlab.lib import colors
+    from reportlab.lib.styles import ParagraphStyle
+
+    return ParagraphStyle(
+        name="AuditFooter",
+        parent=_sample_styles()["Normal"],
+        fontSize=8,
+        textColor=colors.grey,
+        alignment=1,
+        leading=10,
+    )
+
+
+def _mk_style(name: str, size: float, **kwargs: Any) -> "ParagraphStyle":
+    """Create a paragraph style, defaulting to bold Helvetica."""
+    from reportlab.lib.styles import ParagraphStyle
+
+    kwargs.setdefault("fontName", "Helvetica-Bold")
+    return ParagraphStyle(name=name, fontSize=size, **kwargs)
+
+
+@lru_cache(maxsize=None)
+def _get_enhanced_styles() -> Dict[str, "ParagraphStyle"]:
+    """Return the enhanced PDF paragraph styles, building them on first use."""
+    normal_style = _sample_styles()["Normal"]
+    return {
+        "title": _mk_style("EnhancedTitle", 18, spaceAfter=12, alignment=1),
+        "heading2": _mk_style("EnhancedHeading2", 14, spaceAfter=8, spaceBefore=12),
+        "small_text": _mk_style("EnhancedSmallText", 8, fontName="Helvetica"),
+        "summary": _mk_style(
+            "EnhancedSummary",
+            10,
+            parent=normal_style,
+            fontName=normal_style.fontName,
+            leading=14,
+            spaceAfter=6,
+        ),
+    }
+
+
+# Rows per Table flowable; ReportLab's table layout slows down sharply on huge tables
+PDF_TABLE_CHUNK_ROWS = 50
+
+
+def _chunked(seq: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    """Yield successive lists of at most size items from seq."""
+    it = iter(seq)
+    return iter(lambda: list(islice(it, size)), [])
+
+
+def _build_pdf_tables(
+    table_data: List[List[Any]], style: "TableStyle", **table_kwargs: Any
+) -> List["Flowable"]:
+    """
+    Build the table flowables for a header row plus data rows.
+
+    Large tables are split every PDF_TABLE_CHUNK_ROWS rows into separate
+    tables that each repeat the header, separated by a small spacer.
+    """
+    from reportlab.platypus import Spacer, Table
+
+    header, rows = table_data[0], table_data[1:]
+    flowables: List["Flowable"] = []
+    for chunk in _chunked(rows, PDF_TABLE_CHUNK_ROWS) if rows else [[]]:
+        if flowables:
+            flowables.append(Spacer(1, 6))
+        table = Table([header, *chunk], repeatRows=1, **table_kwargs)
+        table.setStyle(style)
+        flowables.append(table)
+    return flowables
+
+
+# Output directories already created during this process
+_ENSURED_DIRS: Set[str] = set()
+
+
+def _ensure_dir(path: Optional[str]) -> None:
+    """Create the directory once per process, skipping repeat stat calls."""
+    if path and path not in _ENSURED_DIRS:
+        os.makedirs(path, exist_ok=True)
+        _ENSURED_DIRS.add(path)
+
+
+def _resolve_output(path: Optional[str], base_filename: str) -> str:
+    """Return the output file path, creating its directory if needed."""
+    if not path:
+        return base_filename
+    path = os.fspath(path)
+    _ensure_dir(path)
+    return os.path.join(path, base_filename)
+
+
+def write_json_file(data: Any, file_path: str, indent: int = 4) -> None:
+    """
+    Write data to a JSON file, using orjson when it is installed.
+
+    orjson can only indent with two spaces, so any other indent goes through
+    the stdlib encoder. Non-ASCII text is written as UTF-8 on both paths, so
+    an indent of two produces the same bytes whether or not orjson is present.
+    """
+    if orjson is not None and indent == 2:
+        with open(file_path, "wb") as f:
+            f.write(
+                orjson.dumps(
+                    data,
+                    option=orjson.OPT_INDENT_2
+                    | orjson.OPT_NON_STR_KEYS
+                    | orjson.OPT_SERIALIZE_NUMPY,
+                )
+            )
+    else:
+        # Serialise in one shot and write once rather than per encoded chunk
+        payload = json.dumps(data, indent=indent, ensure_ascii=False)
+        with open(file_path, "w", encoding="utf-8") as f:
+            f.write(payload)
 
 
 def export_audit_report_to_pdf(
     audit_data_list: List[Dict[str, str]],
     file_name: str = "audit_report",
     path: Optional[str] = None,
+    generated_at: Optional[datetime] = None,
 ) -> Optional[str]:
     """
     Export the audit report to a PDF file.
@@ -67,21 +291,23 @@ def export_audit_report_to_pdf(
     :param audit_data_list: List of dictionaries, each representing a profile/account's audit data.
     :param file_name: The base name of the output PDF file.
     :param path: Optional directory where the PDF file will be saved.
+    :param generated_at: Optional report time shared across export formats.
     :return: Full path of the generated PDF file or None on error.
     """
     try:
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M")
+        from reportlab.lib.pagesizes import landscape, letter
+        from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer
+
+        generated_at = generated_at or datetime.now()
+        timestamp = generated_at.strftime("%Y%m%d_%H%M")
         base_filename = f"{file_name}_{timestamp}.pdf"
 
-        if path:
-            os.makedirs(path, exist_ok=True)
-            output_filename = os.path.join(path, base_filename)
-        else:
-            output_filename = base_filename
+        output_filename = _resolve_output(path, base_filename)
 
         doc = SimpleDocTemplate(output_filename, pagesize=landscape(letter))
-        styles = getSampleStyleSheet()
-        elements: List[Flowable] = []
+        styles = _sample_styles()
+        audit_footer_style = _audit_footer_style()
+        elements: List["Flowable"] = []
 
         headers = [
             "Profile",
@@ -92,42 +318,27 @@ def export_audit_report_to_pdf(
             "Unused EIPs",
             "Budget Alerts",
         ]
-        table_data = [headers]
-
-        for row in audit_data_list:
-            table_data.append(
-                [
-                    row.get("profile", ""),
-                    row.get("account_id", ""),
-                    row.get("untagged_resources", ""),
-                    row.get("stopped_instances", ""),
-                    row.get("unused_volumes", ""),
-                    row.get("unused_eips", ""),
-                    row.get("budget_alerts", ""),
-                ]
-            )
-
-        table = Table(table_data, repeatRows=1)
-        table.setStyle(
-            TableStyle(
-                [
-                    ("BACKGROUND", (0, 0), (-1, 0), colors.black),
-                    ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
-                    ("FONTNAME", (0, 0), (-1, -1), "Helvetica"),
-                    ("FONTSIZE", (0, 0), (-1, -1), 8),
-                    ("ALIGN", (0, 0), (-1, -1), "LEFT"),
-                    ("VALIGN", (0, 0), (-1, -1), "TOP"),
-                    ("GRID", (0, 0), (-1, -1), 0.25, colors.black),
-                    ("BACKGROUND", (0, 1), (-1, -1), colors.whitesmoke),
-                ]
-            )
+        rows = (
+            [
+                row.get("profile", ""),
+                row.get("account_id", ""),
+                row.get("untagged_resources", ""),
+                row.get("stopped_instances", ""),
+                row.get("unused_volumes", ""),
+                row.get("unused_eips", ""),
+                row.get("budget_alerts", ""),
+            ]
+            for row in audit_data_list
         )
+        table_data = [headers, *rows]
+
+        tables = _build_pdf_tables(table_data, _table_styles()["audit"])
 
         elements.append(
             Paragraph("AWS FinOps Dashboard (Audit Report)", styles["Title"])
         )
         elements.append(Spacer(1, 12))
-        elements.append(table)
+        elements.extend(tables)
         elements.append(Spacer(1, 4))
         elements.append(
             Paragraph(
@@ -136,7 +347,7 @@ def export_audit_report_to_pdf(
             )
         )
         elements.append(Spacer(1, 2))
-        current_time_str = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        current_time_str = generated_at.strftime("%Y-%m-%d %H:%M:%S")
         footer_text = f"This audit report is generated using AWS FinOps Dashboard (CLI) \u00a9 2025 on {current_time_str}"
         elements.append(Paragraph(footer_text, audit_footer_style))
 
@@ -147,6 +358,9 @@ def export_audit_report_to_pdf(
         return None
 
 
+_RICH_TAG_RE = re.compile(r"\[/?[a-zA-Z0-9#_]*\]")
+
+
 def clean_rich_tags(text: str) -> str:
     """
     Clean the rich text before writing the data to a pdf.
@@ -154,22 +368,38 @@ def clean_rich_tags(text: str) -> str:
     :param text: The rich text to clean.
     :return: Cleaned text.
     """
-    return re.sub(r"\[/?[a-zA-Z0-9#_]*\]", "", text)
+    if "[" not in text:
+        return text
+    return _RICH_TAG_RE.sub("", text)
+
+
+_BUDGET_ITEM_RE = re.compile(r"(.*) (limit|actual|forecast): \$(.*)")
+
+
+def parse_budget_item(budget_item: str) -> Optional[Tuple[str, str, float]]:
+    """
+    Split a formatted budget line such as "Monthly limit: $100.0".
+
+    :param budget_item: A line produced by format_budget_info.
+    :return: (budget name, field, USD amount), or None if the line holds no amount.
+    """
+    match = _BUDGET_ITEM_RE.fullmatch(budget_item)
+    if match is None:
+        return None
+    return match.group(1), match.group(2), float(match.group(3))
 
 
 def export_audit_report_to_csv(
     audit_data_list: List[Dict[str, str]],
     file_name: str = "audit_report",
     path: Optional[str] = None,
+    generated_at: Optional[datetime] = None,
 ) -> Optional[str]:
     """Export the audit report to a CSV file."""
     try:
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M")
+        timestamp = (generated_at or datetime.now()).strftime("%Y%m%d_%H%M")
         base_filename = f"{file_name}_{timestamp}.csv"
-        output_filename = base_filename
-        if path:
-            os.makedirs(path, exist_ok=True)
-            output_filename = os.path.join(path, base_filename)
+        output_filename = _resolve_output(path, base_filename)
 
         headers = [
             "Profile",
@@ -192,10 +422,11 @@ def export_audit_report_to_csv(
         ]
 
         with open(output_filename, "w", newline="") as csvfile:
-            writer = csv.writer(csvfile)
-            writer.writerow(headers)
-            for item in audit_data_list:
-                writer.writerow([item.get(key, "") for key in data_keys])
+            writer = csv.DictWriter(
+                csvfile, fieldnames=data_keys, restval="", extrasaction="ignore"
+            )
+            writer.writerow(dict(zip(data_keys, headers)))
+            writer.writerows(audit_data_list)
         return output_filename
     except Exception as e:
         console.print(f"[bold red]Error exporting audit report to CSV: {str(e)}[/]")
@@ -204,18 +435,15 @@ def export_audit_report_to_csv(
 def export_audit_report_to_json(
         raw_audit_data: List[Dict[str, Any]],
         file_name: str = "audit_report",
-        path: Optional[str] = None) -> Optional[str]:
+        path: Optional[str] = None,
+        generated_at: Optional[datetime] = None) -> Optional[str]:
     """Export the audit report to a JSON file."""
     try:
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M")
+        timestamp = (generated_at or datetime.now()).strftime("%Y%m%d_%H%M")
         base_filename = f"{file_name}_{timestamp}.json"
-        output_filename = base_filename
-        if path:
-            os.makedirs(path, exist_ok=True)
-            output_filename = os.path.join(path, base_filename)
+        output_filename = _resolve_output(path, base_filename)
 
-        with open(output_filename, "w", encoding="utf-8") as jsonfile:
-            json.dump(raw_audit_data, jsonfile, indent=4) # Use the structured list
+        write_json_file(raw_audit_data, output_filename)  # Use the structured list
         return output_filename
     except Exception as e:
         console.print(f"[bold red]Error exporting audit report to JSON: {str(e)}[/]")
@@ -229,12 +457,8 @@ def export_trend_data_to_json(
 ) -> Optional[str]:
     """Export trend data to a JSON file."""
     try:
-        if not output_dir:
-            output_dir = os.getcwd()
-        os.makedirs(output_dir, exist_ok=True)
-
-        file_path = os.path.join(
-            output_dir, f"{filename}_trend_report.json"
+        file_path = _resolve_output(
+            output_dir or os.getcwd(), f"{filename}_trend_report.json"
         )
 
         # Convert any costs to the target currency
@@ -253,27 +477,45 @@ def export_trend_data_to_json(
                 "formatted_cost": format_currency(converted_cost, currency)
             })
 
-        with open(file_path, "w") as f:
-            json.dump(export_data, f, indent=2)
+        write_json_file(export_data, file_path, indent=2)
 
         return file_path
     except Exception as e:
         console.print(f"[bold red]Error exporting trend data to JSON: {e}[/]")
         return None
 
+def _cost_dashboard_csv_row(item: Dict[str, Any]) -> Dict[str, Any]:
+    """Map one profile's dashboard data onto the cost CSV columns."""
+    if not item["success"]:
+        return {
+            "Profile": item.get("profile", ""),
+            "Last Month Cost": "Error",
+            "Current Month Cost": "Error",
+        }
+    ec2_summary = item.get("ec2_summary", {})
+    return {
+        "Profile": item.get("profile", ""),
+        "Account ID": item.get("account_id", ""),
+        "Last Month Cost": item.get("last_month", 0),
+        "Current Month Cost": item.get("current_month", 0),
+        "Percentage Change": f"{item.get('percent_change_in_total_cost', 0):.2f}%",
+        "Budget Status": "; ".join(item.get("budget_info", [])),
+        "EC2 Running": ec2_summary.get("running", 0),
+        "EC2 Stopped": ec2_summary.get("stopped", 0),
+    }
+
+
 def export_cost_dashboard_to_csv(
     export_data: List[Dict[str, Any]],
     file_name: str = "cost_report",
     path: Optional[str] = None,
+    generated_at: Optional[datetime] = None,
 ) -> Optional[str]:
     """Export the cost dashboard data to a CSV file."""
     try:
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M")
+        timestamp = (generated_at or datetime.now()).strftime("%Y%m%d_%H%M")
         base_filename = f"{file_name}_{timestamp}.csv"
-        output_filename = base_filename
-        if path:
-            os.makedirs(path, exist_ok=True)
-            output_filename = os.path.join(path, base_filename)
+        output_filename = _resolve_output(path, base_filename)
 
         headers = [
             "Profile",
@@ -287,31 +529,9 @@ def export_cost_dashboard_to_csv(
         ]
 
         with open(output_filename, "w", newline="") as csvfile:
-            writer = csv.writer(csvfile)
-            writer.writerow(headers)
-            for item in export_data:
-                if item["success"]:
-                    writer.writerow([
-                        item.get("profile", ""),
-                        item.get("account_id", ""),
-                        item.get("last_month", 0),
-                        item.get("current_month", 0),
-                        f"{item.get('percent_change_in_total_cost', 0):.2f}%",
-                        "; ".join(item.get("budget_info", [])),
-                        item.get("ec2_summary", {}).get("running", 0),
-                        item.get("ec2_summary", {}).get("stopped", 0),
-                    ])
-                else:
-                    writer.writerow([
-                        item.get("profile", ""),
-                        "",
-                        "Error",
-                        "Error",
-                        "",
-                        "",
-                        "",
-                        "",
-                    ])
+            writer = csv.DictWriter(csvfile, fieldnames=headers, restval="")
+            writer.writeheader()
+            writer.writerows(_cost_dashboard_csv_row(item) for item in export_data)
         return output_filename
     except Exception as e:
         console.print(f"[bold red]Error exporting cost dashboard to CSV: {str(e)}[/]")
@@ -321,15 +541,13 @@ def export_cost_dashboard_to_json(
     export_data: List[Dict[str, Any]],
     file_name: str = "cost_report",
     path: Optional[str] = None,
+    generated_at: Optional[datetime] = None,
 ) -> Optional[str]:
     """Export the cost dashboard data to a JSON file."""
     try:
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M")
+        timestamp = (generated_at or datetime.now()).strftime("%Y%m%d_%H%M")
         base_filename = f"{file_name}_{timestamp}.json"
-        output_filename = base_filename
-        if path:
-            os.makedirs(path, exist_ok=True)
-            output_filename = os.path.join(path, base_filename)
+        output_filename = _resolve_output(path, base_filename)
 
         # Create a deep copy to avoid modifying the original data
         json_data = []
@@ -353,8 +571,7 @@ def export_cost_dashboard_to_json(
                     clean_data[key] = value
             json_data.append(clean_data)
 
-        with open(output_filename, "w", encoding="utf-8") as jsonfile:
-            json.dump(json_data, jsonfile, indent=4)
+        write_json_file(json_data, output_filename)
         return output_filename
     except Exception as e:
         console.print(f"[bold red]Error exporting cost dashboard to JSON: {str(e)}[/]")
@@ -368,15 +585,18 @@ def export_cost_dashboard_to_pdf(
     current_period_dates: str = "N/A",
     currency: str = "USD",
     enhanced: bool = False,
+    generated_at: Optional[datetime] = None,
 ) -> Optional[str]:
     """Export dashboard data to a PDF file with enhanced visualizations if requested."""
     if enhanced:
         return _export_enhanced_pdf(
-            data, filename, output_dir, previous_period_dates, current_period_dates, currency
+            data, filename, output_dir, previous_period_dates, current_period_dates, currency,
+            generated_at,
         )
     else:
         return _export_standard_pdf(
-            data, filename, output_dir, previous_period_dates, current_period_dates, currency
+            data, filename, output_dir, previous_period_dates, current_period_dates, currency,
+            generated_at,
         )
         
 def _export_standard_pdf(
@@ -386,19 +606,12 @@ def _export_standard_pdf(
     previous_period_dates: str = "N/A",
     current_period_dates: str = "N/A",
     currency: str = "USD",
+    generated_at: Optional[datetime] = None,
 ) -> Optional[str]:
     """Export dashboard data to a standard PDF file."""
     try:
-        from reportlab.lib import colors
         from reportlab.lib.pagesizes import landscape, letter
-        from reportlab.lib.styles import getSampleStyleSheet
-        from reportlab.platypus import (
-            Paragraph,
-            SimpleDocTemplate,
-            Spacer,
-            Table,
-            TableStyle,
-        )
+        from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer
     except ImportError:
         console.print(
             "[bold red]ReportLab library is required for PDF export. "
@@ -407,18 +620,14 @@ def _export_standard_pdf(
         return None
 
     try:
-        if not output_dir:
-            output_dir = os.getcwd()
-            os.makedirs(output_dir, exist_ok=True)
-
-        file_path = os.path.join(output_dir, f"{filename}.pdf")
+        file_path = _resolve_output(output_dir or os.getcwd(), f"{filename}.pdf")
 
         # Set up the document
         doc = SimpleDocTemplate(
             file_path, pagesize=landscape(letter), rightMargin=30, leftMargin=30
         )
 
-        styles = getSampleStyleSheet()
+        styles = _sample_styles()
         elements = []
 
         # Create the table headers
@@ -434,93 +643,58 @@ def _export_standard_pdf(
 
         table_data = [table_headers]
 
-        # Get currency symbol for formatting
-        currency_symbol = get_currency_symbol(currency)
+        # Bind the conversion and formatting for this report once
+        conv = usd_converter(currency)
+        fmt = partial(format_currency, currency_code=currency)
 
         for row in data:
             # Convert costs to the target currency
-            current_month_value = convert_currency(row['current_month'], "USD", currency)
-            last_month_value = convert_currency(row['last_month'], "USD", currency)
+            current_month_value = conv(row['current_month'])
+            last_month_value = conv(row['last_month'])
             
             # Format service costs
             services_data = []
             for service, cost in row["service_costs"]:
-                converted_cost = convert_currency(cost, "USD", currency)
-                formatted_cost = format_currency(converted_cost, currency)
-                services_data.append(f"{service}: {formatted_cost}")
+                services_data.append(f"{service}: {fmt(conv(cost))}")
             
             services_text = "\n".join(services_data) if services_data else "No costs"
             
             # Format budget info
             budgets_data = []
             for budget_item in row["budget_info"]:
-                if " limit: $" in budget_item:
-                    budget_name, limit_str = budget_item.split(" limit: $")
-                    limit_value = float(limit_str)
-                    converted_limit = convert_currency(limit_value, "USD", currency)
-                    formatted_limit = format_currency(converted_limit, currency)
-                    budgets_data.append(f"{budget_name} limit: {formatted_limit}")
-                elif " actual: $" in budget_item:
-                    budget_name, actual_str = budget_item.split(" actual: $")
-                    actual_value = float(actual_str)
-                    converted_actual = convert_currency(actual_value, "USD", currency)
-                    formatted_actual = format_currency(converted_actual, currency)
-                    budgets_data.append(f"{budget_name} actual: {formatted_actual}")
-                elif " forecast: $" in budget_item:
-                    budget_name, forecast_str = budget_item.split(" forecast: $")
-                    forecast_value = float(forecast_str)
-                    converted_forecast = convert_currency(forecast_value, "USD", currency)
-                    formatted_forecast = format_currency(converted_forecast, currency)
-                    budgets_data.append(f"{budget_name} forecast: {formatted_forecast}")
-                else:
+                parsed = parse_budget_item(budget_item)
+                if parsed is None:
                     budgets_data.append(budget_item)
+                    continue
+                budget_name, field, amount = parsed
+                budgets_data.append(f"{budget_name} {field}: {fmt(conv(amount))}")
                     
             budgets_text = "\n".join(budgets_data) if budgets_data else "No budgets"
             
             # Format EC2 instance summary
-            ec2_data_summary = "\n".join(
-                [
-                    f"{state.capitalize()}: {count}"
-                    for state, count in row["ec2_summary"].items()
-                    if count > 0
-                ]
-            )
+            ec2_data_summary = _ec2_cell_text(row["ec2_summary"])
 
             table_data.append(
                 [
                     row["profile"],
                     row["account_id"],
-                    format_currency(last_month_value, currency),
-                    format_currency(current_month_value, currency),
+                    fmt(last_month_value),
+                    fmt(current_month_value),
                     services_text or "No costs",
                     budgets_text or "No budgets",
                     ec2_data_summary or "No instances",
                 ]
             )
 
-        table = Table(table_data, repeatRows=1)
-        table.setStyle(
-            TableStyle(
-                [
-                    ("BACKGROUND", (0, 0), (-1, 0), colors.black),
-                    ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
-                    ("FONTNAME", (0, 0), (-1, -1), "Helvetica"),
-                    ("FONTSIZE", (0, 0), (-1, -1), 8),
-                    ("ALIGN", (0, 0), (-1, -1), "LEFT"),
-                    ("VALIGN", (0, 0), (-1, -1), "TOP"),
-                    ("GRID", (0, 0), (-1, -1), 0.25, colors.grey),
-                    ("BACKGROUND", (0, 1), (-1, -1), colors.whitesmoke),
-                ]
-            )
-        )
+        tables = _build_pdf_tables(table_data, _table_styles()["standard"])
 
         elements.append(
             Paragraph(f"AWS FinOps Dashboard ({currency})", styles["Title"])
         )
         elements.append(Spacer(1, 12))
-        elements.append(table)
+        elements.extend(tables)
         elements.append(Spacer(1, 4))
-        current_time_str = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        current_time_str = (generated_at or datetime.now()).strftime("%Y-%m-%d %H:%M:%S")
         elements.append(
             Paragraph(
                 f"Report generated on: {current_time_str}", styles["Normal"]
@@ -536,6 +710,37 @@ def _export_standard_pdf(
         console.print(traceback.format_exc())
         return None
         
+def _ec2_cell_text(ec2_summary: Dict[str, int]) -> str:
+    """Return the plain-text EC2 state counts for a PDF table cell."""
+    return "\n".join(
+        f"{state.capitalize()}: {count}"
+        for state, count in ec2_summary.items()
+        if count > 0
+    )
+
+
+def _legend_label(service: str, cost: float, total: float) -> str:
+    """Shorten a service name to fit the pie legend and append its share of total."""
+    # Very short names for services to fit in legend
+    service_name = service
+    if len(service_name) > 18:
+        # Try to extract meaningful parts of AWS service names
+        if "Amazon" in service_name:
+            service_name = service_name.replace("Amazon ", "")
+        if "Elastic" in service_name and len(service_name) > 15:
+            service_name = service_name.replace("Elastic ", "E.")
+        if "Compute Cloud" in service_name:
+            service_name = service_name.replace("Compute Cloud", "EC2")
+        if len(service_name) > 18:
+            service_name = service_name[:16] + "..."
+
+    # Add percentage to each service
+    percentage = (cost / total) * 100
+    if percentage >= 1:  # Only show percentage if it's at least 1%
+        service_name = f"{service_name} ({percentage:.1f}%)"
+    return service_name
+
+
 def _export_enhanced_pdf(
     data: List[ProfileData],
     filename: str,
@@ -543,18 +748,23 @@ def _export_enhanced_pdf(
     previous_period_dates: str = "N/A",
     current_period_dates: str = "N/A",
     currency: str = "USD",
+    generated_at: Optional[datetime] = None,
 ) -> Optional[str]:
     """Export dashboard data to a PDF file with enhanced visualizations."""
+    if not any(profile_data["success"] for profile_data in data):
+        # Nothing to summarise or chart, so the standard report is sufficient
+        return _export_standard_pdf(
+            data, filename, output_dir, previous_period_dates, current_period_dates, currency,
+            generated_at,
+        )
+
     try:
         from reportlab.lib import colors
         from reportlab.lib.pagesizes import landscape, letter, A4
-        from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
         from reportlab.platypus import (
             Paragraph,
             SimpleDocTemplate,
             Spacer,
-            Table,
-            TableStyle,
             PageBreak,
             Image,
             ListFlowable,
@@ -573,11 +783,7 @@ def _export_enhanced_pdf(
         return None
 
     try:
-        if not output_dir:
-            output_dir = os.getcwd()
-        os.makedirs(output_dir, exist_ok=True)
-
-        file_path = os.path.join(output_dir, f"{filename}.pdf")
+        file_path = _resolve_output(output_dir or os.getcwd(), f"{filename}.pdf")
 
         # Set up the document with landscape A4 for better table fit
         doc = SimpleDocTemplate(
@@ -589,46 +795,25 @@ def _export_enhanced_pdf(
             bottomMargin=36
         )
 
-        styles = getSampleStyleSheet()
-        # Modify existing styles or create new ones with unique names
-        title_style = ParagraphStyle(
-            name='EnhancedTitle', 
-            fontName='Helvetica-Bold',
-            fontSize=18, 
-            spaceAfter=12,
-            alignment=1  # 1 = center alignment
-        )
-        
-        heading2_style = ParagraphStyle(
-            name='EnhancedHeading2', 
-            fontName='Helvetica-Bold',
-            fontSize=14, 
-            spaceAfter=8,
-            spaceBefore=12
-        )
-        
-        small_text_style = ParagraphStyle(
-            name='EnhancedSmallText', 
-            fontName='Helvetica',
-            fontSize=8
-        )
-        
-        exec_summary_style = ParagraphStyle(
-            name='EnhancedExecutiveSummary', 
-            fontName='Helvetica-Bold',
-            fontSize=12,
-            spaceAfter=10,
-            spaceBefore=10
-        )
+        styles = _sample_styles()
+        enhanced_styles = _get_enhanced_styles()
+        title_style = enhanced_styles["title"]
+        heading2_style = enhanced_styles["heading2"]
+        small_text_style = enhanced_styles["small_text"]
+        summary_style = enhanced_styles["summary"]
 
         elements = []
 
         # Add title and date
         elements.append(Paragraph(f"AWS FinOps Dashboard ({currency})", title_style))
-        current_time_str = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        current_time_str = (generated_at or datetime.now()).strftime("%Y-%m-%d %H:%M:%S")
         elements.append(Paragraph(f"Report generated on: {current_time_str}", small_text_style))
         elements.append(Spacer(1, 20))
         
+        # Bind the conversion and formatting for this report once
+        conv = usd_converter(currency)
+        fmt = partial(format_currency, currency_code=currency)
+
         # Add executive summary
         total_current_spend = 0
         total_previous_spend = 0
@@ -636,8 +821,8 @@ def _export_enhanced_pdf(
         
         for profile_data in data:
             if profile_data["success"]:
-                current_spend = convert_currency(profile_data["current_month"], "USD", currency)
-                previous_spend = convert_currency(profile_data["last_month"], "USD", currency)
+                current_spend = conv(profile_data["current_month"])
+                previous_spend = conv(profile_data["last_month"])
                 total_current_spend += current_spend
                 total_previous_spend += previous_spend
         
@@ -651,18 +836,10 @@ def _export_enhanced_pdf(
         elif percentage_change < 0:
             change_text = f"decreased by {abs(percentage_change):.2f}%"
             
-        formatted_current = format_currency(total_current_spend, currency)
-        formatted_previous = format_currency(total_previous_spend, currency)
+        formatted_current = fmt(total_current_spend)
+        formatted_previous = fmt(total_previous_spend)
         
         elements.append(Paragraph("Executive Summary", heading2_style))
-        summary_style = ParagraphStyle(
-            name='EnhancedSummary', 
-            parent=styles["Normal"],
-            fontSize=10,
-            leading=14,
-            spaceAfter=6
-        )
-        
         elements.append(Paragraph(
             f"This report summarizes AWS costs across {total_accounts} account{'s' if total_accounts > 1 else ''}. "
             f"The total spend for the current period ({current_period_dates}) is {formatted_current} ({currency}), which has {change_text} "
@@ -709,14 +886,14 @@ def _export_enhanced_pdf(
         for profile_data in data:
             if profile_data["success"]:
                 for service, cost in profile_data["service_costs"]:
-                    converted_cost = convert_currency(cost, "USD", currency)
+                    converted_cost = conv(cost)
                     if service in all_services:
                         all_services[service] += converted_cost
                     else:
                         all_services[service] = converted_cost
         
-        # Sort services by cost and take top 10
-        top_services = sorted(all_services.items(), key=lambda x: x[1], reverse=True)[:10]
+        # Take the top 10 services by cost without sorting the rest
+        top_services = heapq.nlargest(10, all_services.items(), key=itemgetter(1))
         
         # Create pie chart
         if top_services:
@@ -747,11 +924,9 @@ def _export_enhanced_pdf(
             pie.slices.strokeWidth = 0.5
             
             # Add different colors for pie slices
-            pie_colors = [colors.red, colors.green, colors.blue, colors.yellow, colors.cyan, 
-                    colors.magenta, colors.pink, colors.lavender, colors.orange, colors.purple]
-                    
-            for i in range(len(pie_data)):
-                pie.slices[i].fillColor = pie_colors[i % len(pie_colors)]
+            slice_colors = list(islice(cycle(_pie_colors()), len(pie_data)))
+            for i, color in enumerate(slice_colors):
+                pie.slices[i].fillColor = color
             
             drawing.add(pie)
             
@@ -768,37 +943,19 @@ def _export_enhanced_pdf(
             legend.fontSize = 7         # Smaller font size
             
             # Truncate long service names more aggressively
-            colorNamePairs = []
-            for i, (service, cost) in enumerate(top_n_services_with_other):
-                if i == len(top_n_services_with_other) - 1 and service == "Other Services":
-                    # Highlight "Other" differently
-                    service_name = "Other Services"
-                else:
-                    # Very short names for services to fit in legend
-                    service_name = service
-                    if len(service_name) > 18:
-                        # Try to extract meaningful parts of AWS service names
-                        if "Amazon" in service_name:
-                            service_name = service_name.replace("Amazon ", "")
-                        if "Elastic" in service_name and len(service_name) > 15:
-                            service_name = service_name.replace("Elastic ", "E.")
-                        if "Compute Cloud" in service_name:
-                            service_name = service_name.replace("Compute Cloud", "EC2")
-                        if len(service_name) > 18:
-                            service_name = service_name[:16] + "..."
-                
-                # Add percentage to each service
-                percentage = (cost / sum(pie_data)) * 100
-                if percentage >= 1:  # Only show percentage if it's at least 1%
-                    service_name = f"{service_name} ({percentage:.1f}%)"
-                
-                colorNamePairs.append((pie_colors[i % len(pie_colors)], service_name))
+            total_pie = sum(pie_data) or 1.0
+            colorNamePairs = [
+                (color, _legend_label(service, cost, total_pie))
+                for color, (service, cost) in zip(slice_colors, top_n_services_with_other)
+            ]
                 
             legend.colorNamePairs = colorNamePairs
             drawing.add(legend)
             
             elements.append(drawing)
             elements.append(Spacer(1, 20))  # Add more space after the chart
+        else:
+            elements.append(Paragraph("No service cost data available.", small_text_style))
         
         # Add text that summarizes the overall spending
         elements.append(Spacer(1, 10))
@@ -806,7 +963,7 @@ def _export_enhanced_pdf(
         if currency != "USD":
             currency_note = f" (Currency: {currency})"
         spend_summary = Paragraph(
-            f"Total current period spend: {format_currency(total_current_spend, currency)}{currency_note}", 
+            f"Total current period spend: {fmt(total_current_spend)}{currency_note}", 
             summary_style
         )
         elements.append(spend_summary)
@@ -882,14 +1039,13 @@ def _export_enhanced_pdf(
                 continue
                 
             # Convert costs to the target currency
-            current_month_value = convert_currency(row['current_month'], "USD", currency)
-            last_month_value = convert_currency(row['last_month'], "USD", currency)
+            current_month_value = conv(row['current_month'])
+            last_month_value = conv(row['last_month'])
             
             # Format service costs - limit to top 6 services to prevent overflow
             services_data = []
             for service, cost in row["service_costs"][:6]:  # Limit to top 6 services
-                converted_cost = convert_currency(cost, "USD", currency)
-                formatted_cost = format_currency(converted_cost, currency)
+                formatted_cost = fmt(conv(cost))
                 # Truncate long service names
                 if len(service) > 25:
                     service = service[:25] + "..."
@@ -906,22 +1062,22 @@ def _export_enhanced_pdf(
             budget_actual = None
             
             for budget_item in row["budget_info"]:
-                if " limit: $" in budget_item:
-                    _, limit_str = budget_item.split(" limit: $")
-                    budget_limit = float(limit_str)
-                elif " actual: $" in budget_item:
-                    _, actual_str = budget_item.split(" actual: $")
-                    budget_actual = float(actual_str)
+                parsed = parse_budget_item(budget_item)
+                if parsed is None:
+                    continue
+                _, field, amount = parsed
+                if field == "limit":
+                    budget_limit = amount
+                elif field == "actual":
+                    budget_actual = amount
             
             # Create a simplified budget display
             budget_data = []
             if budget_limit is not None:
-                converted_limit = convert_currency(budget_limit, "USD", currency)
-                budget_data.append(f"Limit: {format_currency(converted_limit, currency)}")
+                budget_data.append(f"Limit: {fmt(conv(budget_limit))}")
             
             if budget_actual is not None:
-                converted_actual = convert_currency(budget_actual, "USD", currency)
-                budget_data.append(f"Actual: {format_currency(converted_actual, currency)}")
+                budget_data.append(f"Actual: {fmt(conv(budget_actual))}")
                 
                 # Add a percentage of limit indicator
                 if budget_limit is not None and budget_limit > 0:
@@ -932,20 +1088,14 @@ def _export_enhanced_pdf(
             budgets_text = "\n".join(budget_data) if budget_data else "No budget"
             
             # Format EC2 instance summary more clearly
-            ec2_data = []
-            for state, count in row["ec2_summary"].items():
-                if count > 0:
-                    # Simplified format without emojis
-                    ec2_data.append(f"{state.capitalize()}: {count}")
-            
-            ec2_data_summary = "\n".join(ec2_data) if ec2_data else "No instances"
+            ec2_data_summary = _ec2_cell_text(row["ec2_summary"]) or "No instances"
 
             table_data.append(
                 [
                     row["profile"],
                     row["account_id"],
-                    format_currency(last_month_value, currency),
-                    format_currency(current_month_value, currency),
+                    fmt(last_month_value),
+                    fmt(current_month_value),
                     services_text,
                     budgets_text,
                     ec2_data_summary,
@@ -954,35 +1104,12 @@ def _export_enhanced_pdf(
 
         # Define column widths that work better in landscape mode
         col_widths = [70, 85, 70, 70, 200, 120, 85]
-        table = Table(table_data, repeatRows=1, colWidths=col_widths)
-        
         # Add more distinctive styling
-        table.setStyle(
-            TableStyle(
-                [
-                    ("BACKGROUND", (0, 0), (-1, 0), colors.steelblue),
-                    ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
-                    ("FONTNAME", (0, 0), (-1, -1), "Helvetica"),
-                    ("FONTSIZE", (0, 0), (-1, 0), 8),  # Header font size
-                    ("FONTSIZE", (0, 1), (-1, -1), 7),  # Data font size (smaller)
-                    ("ALIGN", (0, 0), (-1, -1), "LEFT"),
-                    ("VALIGN", (0, 0), (-1, -1), "TOP"),
-                    ("GRID", (0, 0), (-1, -1), 0.25, colors.grey),
-                    ("BACKGROUND", (0, 1), (-1, -1), colors.whitesmoke),
-                    ("WORDWRAP", (0, 0), (-1, -1), True),  # Enable word wrapping
-                    # Add alternating row colors for better readability
-                    ("BACKGROUND", (0, 1), (-1, -1), colors.whitesmoke),
-                    ("ROWBACKGROUNDS", (0, 1), (-1, -1), [colors.whitesmoke, colors.lightgrey]),
-                    # Add some padding
-                    ("TOPPADDING", (0, 0), (-1, -1), 3),
-                    ("BOTTOMPADDING", (0, 0), (-1, -1), 3),
-                    ("LEFTPADDING", (0, 0), (-1, -1), 3),
-                    ("RIGHTPADDING", (0, 0), (-1, -1), 3),
-                ]
+        elements.extend(
+            _build_pdf_tables(
+                table_data, _table_styles()["enhanced"], colWidths=col_widths
             )
         )
-
-        elements.append(table)
         elements.append(Spacer(1, 20))
         
         # Add footer
@@ -1001,42 +1128,89 @@ def _export_enhanced_pdf(
         return None
 
 
+# Parsed configuration files keyed by (absolute path, modification time).
+# At most _CONFIG_CACHE_SIZE entries are kept; the oldest is evicted first.
+_CONFIG_CACHE_SIZE = 16
+_CONFIG_CACHE: Dict[Tuple[str, float], Dict[str, Any]] = {}
+
+
 def load_config_file(file_path: str) -> Optional[Dict[str, Any]]:
-    """Load configuration from TOML, YAML, or JSON file."""
+    """
+    Load configuration from TOML, YAML, or JSON file.
+
+    Successful loads are cached until the file's modification time changes.
+    """
+    try:
+        cache_key = (os.path.abspath(file_path), os.path.getmtime(file_path))
+    except OSError:
+        # Let the loader report missing or unreadable files
+        return _read_config_file(file_path)
+
+    if cache_key not in _CONFIG_CACHE:
+        loaded_data = _read_config_file(file_path)
+        if loaded_data is None:
+            return None
+        if len(_CONFIG_CACHE) >= _CONFIG_CACHE_SIZE:
+            del _CONFIG_CACHE[next(iter(_CONFIG_CACHE))]
+        _CONFIG_CACHE[cache_key] = loaded_data
+    # Callers may update the returned mapping, so hand out a copy
+    return dict(_CONFIG_CACHE[cache_key])
+
+
+def _import_tomllib() -> Any:
+    """Import the TOML parser: tomllib on Python 3.11+, tomli before that."""
+    if sys.version_info >= (3, 11):
+        import tomllib
+
+        return tomllib
+    try:
+        import tomli  # Use tomli in place of tomllib
+
+        return tomli
+    except ImportError:
+        return None
+
+
+def _read_config_file(file_path: str) -> Optional[Dict[str, Any]]:
+    """Parse a TOML, YAML, or JSON configuration file."""
     _, file_extension = os.path.splitext(file_path)
     file_extension = file_extension.lower()
 
     try:
-        with open(file_path, "rb" if file_extension == ".toml" else "r") as f:
+        with open(file_path, "rb" if file_extension in (".toml", ".json") else "r") as f:
             if file_extension == ".toml":
+                tomllib = _import_tomllib()
                 if tomllib is None:
                     console.print(
                         f"[bold red]Error: TOML library (tomli) not installed for Python < 3.11. Please install it.[/]"
                     )
                     return None
-                loaded_data = tomllib.load(f)
-                if isinstance(loaded_data, dict):
-                    return loaded_data
-                console.print(
-                    f"[bold red]Error: TOML file {file_path} did not load as a dictionary.[/]"
-                )
-                return None
+                file_format = "TOML"
+                try:
+                    loaded_data = tomllib.load(f)
+                except tomllib.TOMLDecodeError as e:
+                    console.print(f"[bold red]Error decoding TOML file {file_path}: {e}[/]")
+                    return None
             elif file_extension in [".yaml", ".yml"]:
-                loaded_data = yaml.safe_load(f)
-                if isinstance(loaded_data, dict):
-                    return loaded_data
-                console.print(
-                    f"[bold red]Error: YAML file {file_path} did not load as a dictionary.[/]"
-                )
-                return None
+                import yaml
+
+                file_format = "YAML"
+                # The libyaml-backed loader is much faster when PyYAML was built with it
+                loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+                try:
+                    loaded_data = yaml.load(f, Loader=loader)
+                except yaml.YAMLError as e:
+                    console.print(f"[bold red]Error decoding YAML file {file_path}: {e}[/]")
+                    return None
             elif file_extension == ".json":
-                loaded_data = json.load(f)
-                if isinstance(loaded_data, dict):
-                    return loaded_data
-                console.print(
-                    f"[bold red]Error: JSON file {file_path} did not load as a dictionary.[/]"
-                )
-                return None
+                file_format = "JSON"
+                try:
+                    # orjson.JSONDecodeError subclasses json.JSONDecodeError
+                    loads = orjson.loads if orjson is not None else json.loads
+                    loaded_data = loads(f.read())
+                except json.JSONDecodeError as e:
+                    console.print(f"[bold red]Error decoding JSON file {file_path}: {e}[/]")
+                    return None
             else:
                 console.print(
                     f"[bold red]Error: Unsupported configuration file format: {file_extension}[/]"
@@ -1045,22 +1219,31 @@ def load_config_file(file_path: str) -> Optional[Dict[str, Any]]:
     except FileNotFoundError:
         console.print(f"[bold red]Error: Configuration file not found: {file_path}[/]")
         return None
-    except tomllib.TOMLDecodeError as e:
-        console.print(f"[bold red]Error decoding TOML file {file_path}: {e}[/]")
-        return None
-    except yaml.YAMLError as e:
-        console.print(f"[bold red]Error decoding YAML file {file_path}: {e}[/]")
-        return None
-    except json.JSONDecodeError as e:
-        console.print(f"[bold red]Error decoding JSON file {file_path}: {e}[/]")
-        return None
     except Exception as e:
         console.print(f"[bold red]Error loading configuration file {file_path}: {e}[/]")
         return None
 
-def get_currency_symbol(currency_code: str = "USD") -> str:
-    """Get the currency symbol for a given currency code."""
-    currency_symbols = {
+    if isinstance(loaded_data, dict):
+        return loaded_data
+    console.print(
+        f"[bold red]Error: {file_format} file {file_path} did not load as a dictionary.[/]"
+    )
+    return None
+
+# Exchange rates from USD as of September 2023 (would ideally be fetched from an API)
+_EXCHANGE_RATES: Dict[str, float] = {
+    "INR": 83.5,  # 1 USD = 83.5 INR
+    "EUR": 0.91,  # 1 USD = 0.91 EUR
+    "GBP": 0.79,  # 1 USD = 0.79 GBP
+    "JPY": 149.2,  # 1 USD = 149.2 JPY
+    "AUD": 1.55,  # 1 USD = 1.55 AUD
+    "CAD": 1.38,  # 1 USD = 1.38 CAD
+    "CNY": 7.29,  # 1 USD = 7.29 CNY
+}
+
+# Display symbols for each supported currency
+_CURRENCY_SYMBOLS: Mapping[str, str] = MappingProxyType(
+    {
         "USD": "$",
         "INR": "₹",
         "EUR": "€",
@@ -1070,7 +1253,21 @@ def get_currency_symbol(currency_code: str = "USD") -> str:
         "CAD": "C$",
         "CNY": "¥",
     }
-    return currency_symbols.get(currency_code, "$")
+)
+
+# Use currency codes for PDF rather than symbols for better compatibility
+_CURRENCY_PREFIXES: Mapping[str, str] = MappingProxyType(
+    {
+        **_CURRENCY_SYMBOLS,
+        "INR": "Rs. ",  # Use "Rs. " instead of ₹ for better PDF compatibility
+        "CNY": "CN¥",  # Tell the yuan apart from the yen
+    }
+)
+
+
+def get_currency_symbol(currency_code: str = "USD") -> str:
+    """Get the currency symbol for a given currency code."""
+    return _CURRENCY_SYMBOLS.get(currency_code, "$")
 
 def convert_currency(amount: float, from_currency: str = "USD", to_currency: str = "USD") -> float:
     """
@@ -1084,28 +1281,20 @@ def convert_currency(amount: float, from_currency: str = "USD", to_currency: str
     Returns:
         Converted amount
     """
-    if from_currency == to_currency:
+    # For simplicity, we only support conversion from USD to other currencies.
+    # If the currency pair is not supported, the original amount is returned.
+    if from_currency == to_currency or from_currency != "USD":
         return amount
-        
-    # Exchange rates as of September 2023 (would ideally be fetched from an API)
-    exchange_rates = {
-        "USD_INR": 83.5,  # 1 USD = 83.5 INR
-        "USD_EUR": 0.91,  # 1 USD = 0.91 EUR
-        "USD_GBP": 0.79,  # 1 USD = 0.79 GBP
-        "USD_JPY": 149.2, # 1 USD = 149.2 JPY
-        "USD_AUD": 1.55,  # 1 USD = 1.55 AUD
-        "USD_CAD": 1.38,  # 1 USD = 1.38 CAD
-        "USD_CNY": 7.29,  # 1 USD = 7.29 CNY
-    }
-    
-    # For simplicity, we only support conversion from USD to other currencies
-    if from_currency == "USD":
-        rate_key = f"USD_{to_currency}"
-        if rate_key in exchange_rates:
-            return amount * exchange_rates[rate_key]
-    
-    # If currency pair not supported, return original amount
-    return amount
+    return amount * _EXCHANGE_RATES.get(to_currency, 1.0)
+
+def usd_converter(to_currency: str = "USD") -> Callable[[float], float]:
+    """Return a function converting USD amounts to ``to_currency``.
+
+    Equivalent to ``convert_currency(amount, "USD", to_currency)`` with the
+    exchange rate looked up once, for use in per-row loops.
+    """
+    rate = _EXCHANGE_RATES.get(to_currency, 1.0) if to_currency != "USD" else 1.0
+    return lambda amount: amount * rate
 
 def format_currency(amount: float, currency_code: str = "USD") -> str:
     """
@@ -1118,19 +1307,7 @@ def format_currency(amount: float, currency_code: str = "USD") -> str:
     Returns:
         Formatted amount with currency symbol
     """
-    # Use currency codes for PDF rather than symbols for better compatibility
-    pdf_currency_prefixes = {
-        "USD": "$",      # Dollar sign
-        "INR": "Rs. ",   # Use "Rs. " instead of ₹ for better PDF compatibility
-        "EUR": "€",      # Euro sign
-        "GBP": "£",      # Pound sign
-        "JPY": "¥",      # Yen sign
-        "AUD": "A$",     # Australian dollar
-        "CAD": "C$",     # Canadian dollar
-        "CNY": "CN¥",    # Chinese yuan
-    }
-    
-    symbol = pdf_currency_prefixes.get(currency_code, "$")
+    symbol = _CURRENCY_PREFIXES.get(currency_code, "$")
     
     # Format with commas for thousands separator
     if currency_code == "JPY":
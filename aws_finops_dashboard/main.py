@@ -1,14 +1,4 @@
-import argparse
 import sys
-from collections import defaultdict
-from typing import Dict, List, Optional
-
-import boto3
-from rich.console import Console
-
-from aws_finops_dashboard.dashboard_runner import run_dashboard
-
-console = Console()
 
 
 def main() -> int:
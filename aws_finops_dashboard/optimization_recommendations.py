@@ -3,12 +3,19 @@ AI-powered cost optimization recommendations for AWS resources.
 This module provides recommendations for cost savings based on usage patterns.
 """
 
+import json
 import logging
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Tuple, Set
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from functools import partial
+from typing import Callable, Dict, Iterator, List, Optional, Any, Tuple, Set, cast
 
 import boto3
+import numpy as np
 from boto3.session import Session
+from botocore.config import Config
 from rich.console import Console
 from rich.status import Status
 
@@ -19,10 +26,21 @@ from aws_finops_dashboard.types import (
     SavingsPlansRecommendation,
     ResourceRecommendation,
 )
+from aws_finops_dashboard.aws_client import MAX_REGION_WORKERS, get_account_id
 
 console = Console()
 logger = logging.getLogger(__name__)
 
+# Guards client creation on sessions shared between analyzer threads
+_CLIENT_LOCK = threading.Lock()
+
+# Seconds to reuse Cost Explorer purchase recommendations for the same account
+RECOMMENDATION_CACHE_TTL = 3600
+_CE_RESPONSE_CACHE: Dict[Tuple[Any, ...], Tuple[float, Dict[str, Any]]] = {}
+
+# Adaptive retries absorb throttling when many regions are scanned at once
+_RETRY_CONFIG = Config(retries={"mode": "adaptive", "max_attempts": 10})
+
 # EC2 instance type families for right-sizing comparisons
 INSTANCE_FAMILIES = {
     "t2": ["t2.nano", "t2.micro", "t2.small", "t2.medium", "t2.large", "t2.xlarge", "t2.2xlarge"],
@@ -32,7 +50,24 @@ INSTANCE_FAMILIES = {
     "r5": ["r5.large", "r5.xlarge", "r5.2xlarge", "r5.4xlarge", "r5.8xlarge", "r5.12xlarge", "r5.16xlarge", "r5.24xlarge"],
 }
 
-# Instance pricing for savings estimation (simplified for example)
+# Next size down for every instance type in INSTANCE_FAMILIES
+_SMALLER_INSTANCE: Dict[str, str] = {
+    instance_type: instances[index - 1]
+    for instances in INSTANCE_FAMILIES.values()
+    for index, instance_type in enumerate(instances)
+    if index > 0
+}
+
+# Only these types can be right-sized, so other instances are filtered out by EC2
+_DOWNSIZABLE_TYPES: List[str] = list(_SMALLER_INSTANCE)
+
+# GetMetricData accepts at most this many queries per request
+METRIC_DATA_QUERY_LIMIT = 500
+
+# EC2 describe_* filters accept at most this many values each
+DESCRIBE_FILTER_VALUE_LIMIT = 200
+
+# Fallback hourly pricing when the Price List API cannot be used (simplified for example)
 INSTANCE_PRICING = {
     # t2 family
     "t2.nano": 0.0058, "t2.micro": 0.0116, "t2.small": 0.023, "t2.medium": 0.0464, 
@@ -49,11 +84,92 @@ INSTANCE_PRICING = {
 }
 
 
+# On-demand cost of running each instance type for a 30-day month
+HOURS_PER_MONTH = 24 * 30
+_MONTHLY_INSTANCE_PRICING: Dict[str, float] = {
+    instance_type: hourly * HOURS_PER_MONTH
+    for instance_type, hourly in INSTANCE_PRICING.items()
+}
+
+# Monthly prices looked up from the Price List API, keyed by (region, instance type)
+_MONTHLY_PRICE_CACHE: Dict[Tuple[str, str], float] = {}
+
+
 def get_instance_pricing(instance_type: str) -> float:
     """Get hourly on-demand pricing for an EC2 instance type."""
     return INSTANCE_PRICING.get(instance_type, 0.0)
 
 
+def _get_api_monthly_price(pricing: Any, region: str, instance_type: str) -> Optional[float]:
+    """
+    Get the monthly on-demand Linux price of an instance type from the Price List API.
+    
+    Prices the API returns are kept for the life of the process. None is
+    returned, and nothing cached, when the call fails or has no matching
+    product, so the API is asked again next time.
+    """
+    key = (region, instance_type)
+    cached = _MONTHLY_PRICE_CACHE.get(key)
+    if cached is not None:
+        return cached
+    
+    try:
+        response = pricing.get_products(
+            ServiceCode="AmazonEC2",
+            Filters=[
+                {"Type": "TERM_MATCH", "Field": field, "Value": value}
+                for field, value in (
+                    ("regionCode", region),
+                    ("instanceType", instance_type),
+                    ("operatingSystem", "Linux"),
+                    ("tenancy", "Shared"),
+                    ("preInstalledSw", "NA"),
+                    ("capacitystatus", "Used"),
+                    ("licenseModel", "No License required"),
+                    ("marketoption", "OnDemand"),
+                )
+            ],
+            MaxResults=1,
+        )
+        for price_item in response.get("PriceList", []):
+            product = json.loads(price_item) if isinstance(price_item, str) else price_item
+            for term in product.get("terms", {}).get("OnDemand", {}).values():
+                for dimension in term.get("priceDimensions", {}).values():
+                    hourly = float(dimension.get("pricePerUnit", {}).get("USD", 0))
+                    if hourly > 0:
+                        # Only prices the API actually returned are cached
+                        monthly_price = hourly * HOURS_PER_MONTH
+                        _MONTHLY_PRICE_CACHE[key] = monthly_price
+                        return monthly_price
+    except Exception as e:
+        logger.debug("Could not get price for %s in %s: %s", instance_type, region, e)
+    
+    return None
+
+
+def _get_monthly_savings(
+    pricing: Optional[Any], region: str, current_type: str, smaller_type: str
+) -> Optional[float]:
+    """
+    Get the monthly saving of moving from one instance type to another.
+    
+    Both types are priced from the same source: the Price List API when it has
+    both prices, otherwise the INSTANCE_PRICING estimates. Returns None when
+    neither source knows both prices.
+    """
+    if pricing is not None:
+        current_price = _get_api_monthly_price(pricing, region, current_type)
+        smaller_price = _get_api_monthly_price(pricing, region, smaller_type)
+        if current_price is not None and smaller_price is not None:
+            return current_price - smaller_price
+    
+    current_price = _MONTHLY_INSTANCE_PRICING.get(current_type)
+    smaller_price = _MONTHLY_INSTANCE_PRICING.get(smaller_type)
+    if current_price is None or smaller_price is None:
+        return None
+    return current_price - smaller_price
+
+
 def get_smaller_instance(instance_type: str) -> Optional[str]:
     """
     Get a smaller instance type in the same family.
@@ -64,25 +180,274 @@ def get_smaller_instance(instance_type: str) -> Optional[str]:
     Returns:
         Smaller instance type or None if already smallest
     """
-    # Extract family and size
-    parts = instance_type.split(".")
-    if len(parts) != 2:
-        return None
+    return _SMALLER_INSTANCE.get(instance_type)
+
+
+def _tag(resource: Dict[str, Any], key: str, default: str = "") -> str:
+    """Get the value of a tag on an EC2 resource description."""
+    return next(
+        (tag["Value"] for tag in resource.get("Tags", ()) if tag["Key"] == key), default
+    )
+
+
+def _iter_instances(
+    ec2: Any, state: str, instance_types: Optional[List[str]] = None
+) -> Iterator[Dict[str, Any]]:
+    """Yield the instances in the given state, one describe_instances page at a time."""
+    filters = [{"Name": "instance-state-name", "Values": [state]}]
+    if instance_types:
+        filters.append({"Name": "instance-type", "Values": instance_types})
+    
+    paginator = ec2.get_paginator("describe_instances")
+    pages = paginator.paginate(Filters=filters, PaginationConfig={"PageSize": 1000})
+    # Flatten reservations client-side as each page arrives
+    instances: Iterator[Dict[str, Any]] = pages.search("Reservations[].Instances[]")
+    return instances
+
+
+def _get_cpu_utilization(
+    cloudwatch: Any,
+    instance_ids: List[str],
+    stat: str,
+    start_time: datetime,
+    end_time: datetime,
+) -> Dict[str, np.ndarray]:
+    """
+    Fetch one hourly CPU utilization statistic for many instances with GetMetricData.
+    
+    Args:
+        cloudwatch: CloudWatch client for the instances' region
+        instance_ids: Instances to query, METRIC_DATA_QUERY_LIMIT per request
+        stat: CloudWatch statistic to request, e.g. "Average" or "Maximum"
+        start_time: Start of the metric window
+        end_time: End of the metric window
+        
+    Returns:
+        Mapping of instance ID to its hourly values
+    """
+    values: Dict[str, List[float]] = {instance_id: [] for instance_id in instance_ids}
+    paginator = cloudwatch.get_paginator("get_metric_data")
     
-    family = parts[0]
+    for offset in range(0, len(instance_ids), METRIC_DATA_QUERY_LIMIT):
+        batch = instance_ids[offset:offset + METRIC_DATA_QUERY_LIMIT]
+        queries = [
+            {
+                "Id": f"m{index}",
+                "MetricStat": {
+                    "Metric": {
+                        "Namespace": "AWS/EC2",
+                        "MetricName": "CPUUtilization",
+                        "Dimensions": [{"Name": "InstanceId", "Value": instance_id}],
+                    },
+                    "Period": 3600,
+                    "Stat": stat,
+                },
+                "ReturnData": True,
+            }
+            for index, instance_id in enumerate(batch)
+        ]
+        
+        for page in paginator.paginate(
+            MetricDataQueries=queries, StartTime=start_time, EndTime=end_time
+        ):
+            for result in page.get("MetricDataResults", []):
+                values[batch[int(result["Id"][1:])]].extend(result.get("Values", []))
     
-    if family not in INSTANCE_FAMILIES:
-        return None
+    return {
+        instance_id: np.asarray(instance_values, dtype=np.float64)
+        for instance_id, instance_values in values.items()
+    }
+
+
+def _create_client(session: Session, service: str, **kwargs: Any) -> Any:
+    """
+    Create a boto3 client while holding the module client lock.
+    
+    A boto3 Session is not thread-safe and the analyzers may run concurrently
+    on the same session, so client creation is serialised.
+    """
+    with _CLIENT_LOCK:
+        return session.client(service, **kwargs)
+
+
+def _resolve_regions(session: Session, regions: Optional[List[str]]) -> List[str]:
+    """Return the given regions, or every region enabled for the account if None."""
+    if regions is not None:
+        return regions
     
-    instances = INSTANCE_FAMILIES[family]
     try:
-        current_index = instances.index(instance_type)
-        if current_index > 0:
-            return instances[current_index - 1]
-    except ValueError:
-        pass
+        ec2_client = _create_client(session, "ec2", region_name="us-east-1")
+        return [region["RegionName"] for region in ec2_client.describe_regions()["Regions"]]
+    except Exception as e:
+        console.log(f"[yellow]Warning: Could not get regions: {str(e)}[/]")
+        return ["us-east-1", "us-east-2", "us-west-1", "us-west-2"]
+
+
+class _RegionScanError(Exception):
+    """A region scan that failed part-way, carrying the results it did find."""
+
+    def __init__(self, message: str, results: List[Any]) -> None:
+        super().__init__(message)
+        self.results = results
+
+
+def _scan_regions(
+    session: Session,
+    regions: List[str],
+    services: Tuple[str, ...],
+    scan_region: Callable[..., List[Any]],
+    description: str,
+) -> List[Any]:
+    """
+    Run a per-region scan concurrently and flatten the results.
     
-    return None
+    Regions that fail are logged at DEBUG level and reported on the console
+    in a single warning once every region has finished. A region that raises
+    _RegionScanError keeps the results it carries.
+    
+    Args:
+        session: The boto3 session to use
+        regions: Regions to scan
+        services: Client services passed to ``scan_region`` after the region name
+        scan_region: Callable taking the region and its clients, returning a list
+        description: What the scan does, used in warnings (e.g. "analyzing unused resources")
+        
+    Returns:
+        Combined results of all regions, in region order
+    """
+    failures: List[str] = []
+    
+    # Clients are created up front so the worker threads never touch the session
+    region_clients = []
+    for region in regions:
+        try:
+            clients = [
+                _create_client(session, service, region_name=region, config=_RETRY_CONFIG)
+                for service in services
+            ]
+        except Exception as e:
+            logger.debug("Error %s in %s: %s", description, region, e)
+            failures.append(f"{region}: {e}")
+            continue
+        region_clients.append((region, *clients))
+    
+    def scan(region_client: Tuple[Any, ...]) -> Tuple[List[Any], Optional[str]]:
+        region = region_client[0]
+        try:
+            return scan_region(*region_client), None
+        except _RegionScanError as e:
+            logger.debug("Error %s in %s: %s", description, region, e)
+            return e.results, f"{region}: {e}"
+        except Exception as e:
+            logger.debug("Error %s in %s: %s", description, region, e)
+            return [], f"{region}: {e}"
+    
+    results: List[Any] = []
+    if region_clients:
+        with ThreadPoolExecutor(
+            max_workers=min(MAX_REGION_WORKERS, len(region_clients))
+        ) as executor:
+            for region_results, failure in executor.map(scan, region_clients):
+                results.extend(region_results)
+                if failure:
+                    failures.append(failure)
+    
+    if failures:
+        console.log(
+            f"[yellow]Warning: Error {description} in {len(failures)} region(s): "
+            f"{'; '.join(failures)}[/]"
+        )
+    return results
+
+
+def _scan_region_right_sizing(
+    region: str,
+    ec2: Any,
+    cloudwatch: Any,
+    start_time: datetime,
+    end_time: datetime,
+    cpu_threshold: float,
+    pricing: Optional[Any],
+) -> List[EC2Recommendation]:
+    """Find right-sizing candidates among the running instances of one region.
+    
+    API errors propagate so _scan_regions can report the region as failed.
+    """
+    recommendations: List[EC2Recommendation] = []
+    
+    # Collect running instances that have a smaller type to move to
+    candidates = []
+    for instance in _iter_instances(ec2, "running", _DOWNSIZABLE_TYPES):
+        smaller_type = get_smaller_instance(instance["InstanceType"])
+        if smaller_type:
+            candidates.append((instance, smaller_type))
+    
+    if not candidates:
+        return recommendations
+    
+    # Get CPU utilization metrics for the metric window in batched requests
+    averages = _get_cpu_utilization(
+        cloudwatch,
+        [instance["InstanceId"] for instance, _ in candidates],
+        "Average",
+        start_time,
+        end_time,
+    )
+    avg_cpu_by_instance = {
+        instance_id: float(hourly.mean())
+        for instance_id, hourly in averages.items()
+        if hourly.size
+    }
+    # Only instances that are idle on average need their peak checked
+    low_average_ids = [
+        instance_id
+        for instance_id, avg_cpu in avg_cpu_by_instance.items()
+        if avg_cpu < cpu_threshold
+    ]
+    maximums = (
+        _get_cpu_utilization(
+            cloudwatch, low_average_ids, "Maximum", start_time, end_time
+        )
+        if low_average_ids
+        else {}
+    )
+    
+    for instance, smaller_type in candidates:
+        instance_id = instance["InstanceId"]
+        instance_type = instance["InstanceType"]
+        avg_cpu = avg_cpu_by_instance.get(instance_id)
+        
+        if avg_cpu is None or avg_cpu >= cpu_threshold:
+            continue
+        
+        peaks = maximums.get(instance_id)
+        max_cpu = float(peaks.max()) if peaks is not None and peaks.size else 0.0
+        
+        # If CPU utilization is consistently low, recommend downsizing
+        if max_cpu < 80.0:
+            reason = f"Low CPU utilization (avg: {avg_cpu:.1f}%, max: {max_cpu:.1f}%)"
+            savings = _get_monthly_savings(pricing, region, instance_type, smaller_type)
+            if savings is None:
+                # Still worth downsizing, but do not report a made-up saving
+                reason += "; savings unknown, no price for both instance types"
+                savings = 0.0
+            
+            recommendations.append({
+                "resource_id": instance_id,
+                "resource_name": _tag(instance, "Name"),
+                "region": region,
+                "current_type": instance_type,
+                "recommended_type": smaller_type,
+                "reason": reason,
+                "savings": savings,
+                "metrics": {
+                    "avg_cpu": avg_cpu,
+                    "max_cpu": max_cpu,
+                    "datapoints": len(averages[instance_id])
+                }
+            })
+    
+    return recommendations
 
 
 def analyze_ec2_right_sizing(
@@ -103,95 +468,184 @@ def analyze_ec2_right_sizing(
     Returns:
         List of EC2 right-sizing recommendations
     """
-    recommendations: List[EC2Recommendation] = []
+    regions = _resolve_regions(session, regions)
+    
+    # One UTC window, aligned to the hour, shared by every region
+    end_time = datetime.now(timezone.utc).replace(minute=0, second=0, microsecond=0)
+    start_time = end_time - timedelta(days=days)
+    
+    # The Price List API is only served from a few regions; us-east-1 covers all of them
+    try:
+        pricing = _create_client(session, "pricing", region_name="us-east-1", config=_RETRY_CONFIG)
+    except Exception as e:
+        logger.warning("Could not create Price List client, using estimated prices: %s", e)
+        pricing = None
     
-    # Get regions if not specified
-    if regions is None:
+    recommendations: List[EC2Recommendation] = _scan_regions(
+        session,
+        regions,
+        ("ec2", "cloudwatch"),
+        partial(
+            _scan_region_right_sizing,
+            start_time=start_time,
+            end_time=end_time,
+            cpu_threshold=cpu_threshold,
+            pricing=pricing,
+        ),
+        "analyzing EC2 instances",
+    )
+    
+    # Sort recommendations by potential savings
+    recommendations.sort(key=lambda x: x["savings"], reverse=True)
+    return recommendations
+
+
+def _get_attached_volumes(ec2: Any, instance_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+    """
+    Get the EBS volumes attached to the given instances, keyed by volume ID.
+    
+    Volumes are looked up with an attachment filter so a handful of paginated
+    describe_volumes calls replace one call per volume.
+    """
+    volumes_by_id: Dict[str, Dict[str, Any]] = {}
+    paginator = ec2.get_paginator("describe_volumes")
+    
+    for offset in range(0, len(instance_ids), DESCRIBE_FILTER_VALUE_LIMIT):
+        batch = instance_ids[offset:offset + DESCRIBE_FILTER_VALUE_LIMIT]
         try:
-            ec2_client = session.client("ec2", region_name="us-east-1")
-            regions = [region["RegionName"] for region in ec2_client.describe_regions()["Regions"]]
+            for page in paginator.paginate(
+                Filters=[{"Name": "attachment.instance-id", "Values": batch}]
+            ):
+                for volume in page.get("Volumes", []):
+                    volumes_by_id[volume["VolumeId"]] = volume
         except Exception as e:
-            console.log(f"[yellow]Warning: Could not get regions: {str(e)}[/]")
-            regions = ["us-east-1", "us-east-2", "us-west-1", "us-west-2"]
+            logger.debug("Error getting attached EBS volumes: %s", e)
     
-    for region in regions:
+    return volumes_by_id
+
+
+def _scan_region_unused_resources(region: str, ec2: Any) -> List[ResourceRecommendation]:
+    """Find unused volumes, Elastic IPs and stopped instances in one region.
+    
+    Each check runs on its own, so a denied call only loses that check's
+    results. Failed checks are raised as a _RegionScanError carrying the
+    other checks' recommendations, so _scan_regions can report the region.
+    """
+    recommendations: List[ResourceRecommendation] = []
+    errors: List[str] = []
+    for check in (_find_unused_volumes, _find_unused_eips, _find_idle_stopped_instances):
         try:
-            ec2 = session.client("ec2", region_name=region)
-            cloudwatch = session.client("cloudwatch", region_name=region)
+            recommendations.extend(check(region, ec2))
+        except Exception as e:
+            errors.append(str(e))
+    
+    if errors:
+        raise _RegionScanError("; ".join(errors), recommendations)
+    return recommendations
+
+
+def _find_unused_volumes(region: str, ec2: Any) -> List[ResourceRecommendation]:
+    """Find unattached EBS volumes in one region."""
+    recommendations: List[ResourceRecommendation] = []
+    volumes_response = ec2.describe_volumes(
+        Filters=[{"Name": "status", "Values": ["available"]}]
+    )
+    
+    for volume in volumes_response.get("Volumes", []):
+        volume_id = volume["VolumeId"]
+        volume_size = volume["Size"]
+        volume_type = volume["VolumeType"]
+        
+        # Estimate monthly cost
+        monthly_cost = 0.0
+        if volume_type == "gp2":
+            monthly_cost = volume_size * 0.10  # $0.10 per GB-month for gp2
+        elif volume_type == "gp3":
+            monthly_cost = volume_size * 0.08  # $0.08 per GB-month for gp3
+        elif volume_type == "io1":
+            monthly_cost = volume_size * 0.125  # Simplified for example
+        
+        recommendations.append({
+            "resource_id": volume_id,
+            "resource_name": "",
+            "resource_type": "EBS Volume",
+            "region": region,
+            "recommendation": "Delete unused EBS volume",
+            "reason": f"Volume has been detached for an extended period. Size: {volume_size} GB, Type: {volume_type}",
+            "savings": monthly_cost
+        })
+    
+    return recommendations
+
+
+def _find_unused_eips(region: str, ec2: Any) -> List[ResourceRecommendation]:
+    """Find Elastic IPs that are not associated with anything in one region."""
+    recommendations: List[ResourceRecommendation] = []
+    eips_response = ec2.describe_addresses()
+    
+    for eip in eips_response.get("Addresses", []):
+        if "AssociationId" not in eip:
+            eip_id = eip.get("AllocationId", "")
+            public_ip = eip.get("PublicIp", "")
             
-            # Get all running instances
-            response = ec2.describe_instances(
-                Filters=[{"Name": "instance-state-name", "Values": ["running"]}]
-            )
+            # Unattached EIPs cost approximately $0.005 per hour = $3.6 per month
+            monthly_cost = 3.6
             
-            for reservation in response.get("Reservations", []):
-                for instance in reservation.get("Instances", []):
-                    instance_id = instance["InstanceId"]
-                    instance_type = instance["InstanceType"]
-                    
-                    # Skip if no smaller instance type available
-                    smaller_type = get_smaller_instance(instance_type)
-                    if not smaller_type:
-                        continue
-                    
-                    # Get CPU utilization metrics for the past days
-                    end_time = datetime.now()
-                    start_time = end_time - timedelta(days=days)
+            recommendations.append({
+                "resource_id": eip_id,
+                "resource_name": public_ip,
+                "resource_type": "Elastic IP",
+                "region": region,
+                "recommendation": "Release unused Elastic IP",
+                "reason": "Elastic IP is not associated with any instance",
+                "savings": monthly_cost
+            })
+    
+    return recommendations
+
+
+def _find_idle_stopped_instances(region: str, ec2: Any) -> List[ResourceRecommendation]:
+    """Find stopped instances that still pay for attached EBS volumes in one region."""
+    recommendations: List[ResourceRecommendation] = []
+    stopped_instances = list(_iter_instances(ec2, "stopped"))
+    
+    # Fetch the attached EBS volumes of all stopped instances in one pass
+    volumes_by_id = _get_attached_volumes(
+        ec2, [instance["InstanceId"] for instance in stopped_instances]
+    )
+    
+    for instance in stopped_instances:
+        instance_id = instance["InstanceId"]
+        instance_type = instance["InstanceType"]
+        
+        # Calculate cost of attached EBS volumes
+        volumes_cost = 0.0
+        for device in instance.get("BlockDeviceMappings", []):
+            if "Ebs" in device:
+                vol = volumes_by_id.get(device["Ebs"].get("VolumeId"))
+                if vol:
+                    vol_size = vol["Size"]
+                    vol_type = vol["VolumeType"]
                     
-                    try:
-                        metric = cloudwatch.get_metric_statistics(
-                            Namespace="AWS/EC2",
-                            MetricName="CPUUtilization",
-                            Dimensions=[{"Name": "InstanceId", "Value": instance_id}],
-                            StartTime=start_time,
-                            EndTime=end_time,
-                            Period=3600,  # 1 hour
-                            Statistics=["Average", "Maximum"]
-                        )
-                        
-                        datapoints = metric.get("Datapoints", [])
-                        
-                        if not datapoints:
-                            continue
-                        
-                        # Calculate average and maximum CPU utilization
-                        avg_cpu = sum(dp["Average"] for dp in datapoints) / len(datapoints)
-                        max_cpu = max(dp["Maximum"] for dp in datapoints) if datapoints else 0
-                        
-                        # If CPU utilization is consistently low, recommend downsizing
-                        if avg_cpu < cpu_threshold and max_cpu < 80.0:
-                            current_cost = get_instance_pricing(instance_type) * 24 * 30  # Monthly cost
-                            recommended_cost = get_instance_pricing(smaller_type) * 24 * 30
-                            savings = current_cost - recommended_cost
-                            
-                            # Get instance name from tags
-                            instance_name = ""
-                            for tag in instance.get("Tags", []):
-                                if tag["Key"] == "Name":
-                                    instance_name = tag["Value"]
-                                    break
-                            
-                            recommendations.append({
-                                "resource_id": instance_id,
-                                "resource_name": instance_name,
-                                "region": region,
-                                "current_type": instance_type,
-                                "recommended_type": smaller_type,
-                                "reason": f"Low CPU utilization (avg: {avg_cpu:.1f}%, max: {max_cpu:.1f}%)",
-                                "savings": savings,
-                                "metrics": {
-                                    "avg_cpu": avg_cpu,
-                                    "max_cpu": max_cpu,
-                                    "datapoints": len(datapoints)
-                                }
-                            })
-                    except Exception as e:
-                        logger.warning(f"Error getting metrics for instance {instance_id}: {str(e)}")
-        except Exception as e:
-            console.log(f"[yellow]Warning: Error analyzing EC2 instances in {region}: {str(e)}[/]")
+                    # Simplified cost calculation
+                    if vol_type == "gp2":
+                        volumes_cost += vol_size * 0.10
+                    elif vol_type == "gp3":
+                        volumes_cost += vol_size * 0.08
+                    elif vol_type == "io1":
+                        volumes_cost += vol_size * 0.125
+        
+        if volumes_cost > 0:
+            recommendations.append({
+                "resource_id": instance_id,
+                "resource_name": _tag(instance, "Name"),
+                "resource_type": "EC2 Instance",
+                "region": region,
+                "recommendation": "Terminate stopped EC2 instance or delete unused EBS volumes",
+                "reason": f"Instance has been stopped for an extended period, but you are still paying for attached EBS volumes",
+                "savings": volumes_cost
+            })
     
-    # Sort recommendations by potential savings
-    recommendations.sort(key=lambda x: x["savings"], reverse=True)
     return recommendations
 
 
@@ -209,128 +663,42 @@ def analyze_unused_resources(
     Returns:
         List of resource recommendations
     """
-    recommendations: List[ResourceRecommendation] = []
-    
-    # Get regions if not specified
-    if regions is None:
-        try:
-            ec2_client = session.client("ec2", region_name="us-east-1")
-            regions = [region["RegionName"] for region in ec2_client.describe_regions()["Regions"]]
-        except Exception as e:
-            console.log(f"[yellow]Warning: Could not get regions: {str(e)}[/]")
-            regions = ["us-east-1", "us-east-2", "us-west-1", "us-west-2"]
+    regions = _resolve_regions(session, regions)
     
-    for region in regions:
-        try:
-            ec2 = session.client("ec2", region_name=region)
-            
-            # Check for unused EBS volumes
-            volumes_response = ec2.describe_volumes(
-                Filters=[{"Name": "status", "Values": ["available"]}]
-            )
-            
-            for volume in volumes_response.get("Volumes", []):
-                volume_id = volume["VolumeId"]
-                volume_size = volume["Size"]
-                volume_type = volume["VolumeType"]
-                
-                # Estimate monthly cost
-                monthly_cost = 0.0
-                if volume_type == "gp2":
-                    monthly_cost = volume_size * 0.10  # $0.10 per GB-month for gp2
-                elif volume_type == "gp3":
-                    monthly_cost = volume_size * 0.08  # $0.08 per GB-month for gp3
-                elif volume_type == "io1":
-                    monthly_cost = volume_size * 0.125  # Simplified for example
-                
-                recommendations.append({
-                    "resource_id": volume_id,
-                    "resource_name": "",
-                    "resource_type": "EBS Volume",
-                    "region": region,
-                    "recommendation": "Delete unused EBS volume",
-                    "reason": f"Volume has been detached for an extended period. Size: {volume_size} GB, Type: {volume_type}",
-                    "savings": monthly_cost
-                })
-            
-            # Check for unused Elastic IPs
-            eips_response = ec2.describe_addresses()
-            
-            for eip in eips_response.get("Addresses", []):
-                if "AssociationId" not in eip:
-                    eip_id = eip.get("AllocationId", "")
-                    public_ip = eip.get("PublicIp", "")
-                    
-                    # Unattached EIPs cost approximately $0.005 per hour = $3.6 per month
-                    monthly_cost = 3.6
-                    
-                    recommendations.append({
-                        "resource_id": eip_id,
-                        "resource_name": public_ip,
-                        "resource_type": "Elastic IP",
-                        "region": region,
-                        "recommendation": "Release unused Elastic IP",
-                        "reason": "Elastic IP is not associated with any instance",
-                        "savings": monthly_cost
-                    })
-            
-            # Check for stopped EC2 instances
-            instances_response = ec2.describe_instances(
-                Filters=[{"Name": "instance-state-name", "Values": ["stopped"]}]
-            )
-            
-            for reservation in instances_response.get("Reservations", []):
-                for instance in reservation.get("Instances", []):
-                    instance_id = instance["InstanceId"]
-                    instance_type = instance["InstanceType"]
-                    
-                    # Get instance name from tags
-                    instance_name = ""
-                    for tag in instance.get("Tags", []):
-                        if tag["Key"] == "Name":
-                            instance_name = tag["Value"]
-                            break
-                    
-                    # Calculate cost of attached EBS volumes
-                    volumes_cost = 0.0
-                    for device in instance.get("BlockDeviceMappings", []):
-                        if "Ebs" in device:
-                            volume_id = device["Ebs"].get("VolumeId")
-                            if volume_id:
-                                try:
-                                    vol = ec2.describe_volumes(VolumeIds=[volume_id])["Volumes"][0]
-                                    vol_size = vol["Size"]
-                                    vol_type = vol["VolumeType"]
-                                    
-                                    # Simplified cost calculation
-                                    if vol_type == "gp2":
-                                        volumes_cost += vol_size * 0.10
-                                    elif vol_type == "gp3":
-                                        volumes_cost += vol_size * 0.08
-                                    elif vol_type == "io1":
-                                        volumes_cost += vol_size * 0.125
-                                except Exception:
-                                    pass
-                    
-                    if volumes_cost > 0:
-                        recommendations.append({
-                            "resource_id": instance_id,
-                            "resource_name": instance_name,
-                            "resource_type": "EC2 Instance",
-                            "region": region,
-                            "recommendation": "Terminate stopped EC2 instance or delete unused EBS volumes",
-                            "reason": f"Instance has been stopped for an extended period, but you are still paying for attached EBS volumes",
-                            "savings": volumes_cost
-                        })
-        
-        except Exception as e:
-            console.log(f"[yellow]Warning: Error analyzing unused resources in {region}: {str(e)}[/]")
+    recommendations: List[ResourceRecommendation] = _scan_regions(
+        session, regions, ("ec2",), _scan_region_unused_resources, "analyzing unused resources"
+    )
     
     # Sort recommendations by potential savings
     recommendations.sort(key=lambda x: x["savings"], reverse=True)
     return recommendations
 
 
+def _get_cached_ce_response(session: Session, operation: str, **params: Any) -> Dict[str, Any]:
+    """
+    Call a Cost Explorer operation, reusing its response for the same account.
+    
+    Purchase recommendations are billed per request and only refresh about
+    once a day, so responses are kept for RECOMMENDATION_CACHE_TTL seconds.
+    Errors are raised to the caller and never cached.
+    """
+    with _CLIENT_LOCK:
+        account_id = get_account_id(session)
+    response: Dict[str, Any]
+    if account_id is None:
+        response = getattr(_create_client(session, "ce"), operation)(**params)
+        return response
+    
+    key = (account_id, operation, tuple(sorted(params.items())))
+    cached = _CE_RESPONSE_CACHE.get(key)
+    if cached is not None and time.monotonic() - cached[0] < RECOMMENDATION_CACHE_TTL:
+        return cached[1]
+    
+    response = getattr(_create_client(session, "ce"), operation)(**params)
+    _CE_RESPONSE_CACHE[key] = (time.monotonic(), response)
+    return response
+
+
 def analyze_ri_opportunities(
     session: Session,
 ) -> List[RIRecommendation]:
@@ -347,9 +715,9 @@ def analyze_ri_opportunities(
     
     try:
         # Use AWS Cost Explorer API to get RI recommendations
-        ce = session.client("ce")
-        
-        response = ce.get_reservation_purchase_recommendation(
+        response = _get_cached_ce_response(
+            session,
+            "get_reservation_purchase_recommendation",
             Service="Amazon Elastic Compute Cloud - Compute",
             TermInYears="ONE_YEAR",
             LookbackPeriodInDays="SIXTY_DAYS",
@@ -401,9 +769,9 @@ def analyze_savings_plans_opportunities(
     
     try:
         # Use AWS Cost Explorer API to get Savings Plans recommendations
-        ce = session.client("ce")
-        
-        response = ce.get_savings_plans_purchase_recommendation(
+        response = _get_cached_ce_response(
+            session,
+            "get_savings_plans_purchase_recommendation",
             SavingsPlansType="COMPUTE_SP",
             TermInYears="ONE_YEAR",
             LookbackPeriodInDays="SIXTY_DAYS",
@@ -469,33 +837,49 @@ def generate_optimization_recommendations(
         }
     }
     
-    # Analyze EC2 instances for right-sizing
+    # Resolve the region list once and share it between the regional analyzers
+    if analyze_ec2 or analyze_resources:
+        regions = _resolve_regions(session, regions)
+    
+    # The analyzers are independent and I/O bound, so run them side by side
+    analyses: List[Tuple[str, str, str, Callable[[], List[Any]]]] = []
     if analyze_ec2:
         console.print("[bold green]Analyzing EC2 instances for right-sizing...[/]")
-        result["ec2_recommendations"] = analyze_ec2_right_sizing(
-            session, regions=regions, cpu_threshold=cpu_threshold
-        )
-        result["summary"]["ec2_savings"] = sum(rec["savings"] for rec in result["ec2_recommendations"])
-    
-    # Analyze unused resources
+        analyses.append((
+            "ec2_recommendations", "ec2_savings", "savings",
+            partial(analyze_ec2_right_sizing, session, regions=regions, cpu_threshold=cpu_threshold),
+        ))
     if analyze_resources:
         console.print("[bold green]Analyzing unused resources...[/]")
-        result["resource_recommendations"] = analyze_unused_resources(
-            session, regions=regions
-        )
-        result["summary"]["resource_savings"] = sum(rec["savings"] for rec in result["resource_recommendations"])
-    
-    # Analyze RI opportunities
+        analyses.append((
+            "resource_recommendations", "resource_savings", "savings",
+            partial(analyze_unused_resources, session, regions=regions),
+        ))
     if analyze_reservations:
         console.print("[bold green]Analyzing Reserved Instance opportunities...[/]")
-        result["ri_recommendations"] = analyze_ri_opportunities(session)
-        result["summary"]["ri_savings"] = sum(rec["monthly_savings"] for rec in result["ri_recommendations"])
-    
-    # Analyze Savings Plans opportunities
+        analyses.append((
+            "ri_recommendations", "ri_savings", "monthly_savings",
+            partial(analyze_ri_opportunities, session),
+        ))
     if analyze_savings_plans:
         console.print("[bold green]Analyzing Savings Plans opportunities...[/]")
-        result["savings_plans_recommendations"] = analyze_savings_plans_opportunities(session)
-        result["summary"]["savings_plans_savings"] = sum(rec["monthly_savings"] for rec in result["savings_plans_recommendations"])
+        analyses.append((
+            "savings_plans_recommendations", "savings_plans_savings", "monthly_savings",
+            partial(analyze_savings_plans_opportunities, session),
+        ))
+    
+    if analyses:
+        with ThreadPoolExecutor(max_workers=len(analyses)) as executor:
+            futures = [
+                (result_key, summary_key, savings_key, executor.submit(analyze))
+                for result_key, summary_key, savings_key, analyze in analyses
+            ]
+            # The keys come from the table above, so index the TypedDicts as plain dicts
+            recommendations = cast(Dict[str, Any], result)
+            summary = cast(Dict[str, Any], result["summary"])
+            for result_key, summary_key, savings_key, future in futures:
+                recommendations[result_key] = future.result()
+                summary[summary_key] = sum(rec[savings_key] for rec in recommendations[result_key])
     
     # Calculate total potential savings
     result["summary"]["total_potential_savings"] = (
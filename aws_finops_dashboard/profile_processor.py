@@ -1,12 +1,11 @@
-from collections import defaultdict
-from typing import Dict, List, Optional
-
-import boto3
-from rich.console import Console
+import logging
+from typing import List, Optional
 
 from aws_finops_dashboard.aws_client import (
     ec2_summary,
-    get_accessible_regions,
+    get_accessible_regions_for_profile,
+    get_budgets,
+    get_session,
 )
 from aws_finops_dashboard.cost_processor import (
     change_in_total_cost,
@@ -21,7 +20,7 @@ from aws_finops_dashboard.types import (
     ProfileData,
 )
 
-console = Console()
+logger = logging.getLogger(__name__)
 
 
 def process_single_profile(
@@ -29,16 +28,25 @@ def process_single_profile(
     user_regions: Optional[List[str]] = None,
     time_range: Optional[int] = None,
     tag: Optional[List[str]] = None,
+    prefetched_cost_data: Optional[CostData] = None,
 ) -> ProfileData:
-    """Process a single AWS profile and return its data."""
+    """
+    Process a single AWS profile and return its data.
+
+    prefetched_cost_data, when given, must come from get_cost_data for this
+    profile with the same time_range and tag; Cost Explorer is then not queried.
+    """
     try:
-        session = boto3.Session(profile_name=profile)
-        cost_data = get_cost_data(session, time_range, tag)
+        session = get_session(profile)
+        if prefetched_cost_data is not None:
+            cost_data = prefetched_cost_data
+        else:
+            cost_data = get_cost_data(session, time_range, tag)
 
         if user_regions:
             profile_regions = user_regions
         else:
-            profile_regions = get_accessible_regions(session)
+            profile_regions = get_accessible_regions_for_profile(profile)
 
         ec2_data = ec2_summary(session, profile_regions)
         service_costs, service_cost_data = process_service_costs(cost_data)
@@ -67,22 +75,27 @@ def process_single_profile(
         }
 
     except Exception as e:
-        return {
-            "profile": profile,
-            "account_id": "Error",
-            "last_month": 0,
-            "current_month": 0,
-            "service_costs": [],
-            "service_costs_formatted": [f"Failed to process profile: {str(e)}"],
-            "budget_info": ["N/A"],
-            "ec2_summary": {"N/A": 0},
-            "ec2_summary_formatted": ["Error"],
-            "success": False,
-            "error": str(e),
-            "current_period_name": "Current month",
-            "previous_period_name": "Last month",
-            "percent_change_in_total_cost": None,
-        }
+        return failed_profile_data(profile, e)
+
+
+def failed_profile_data(profile: str, error: Exception) -> ProfileData:
+    """Build the dashboard row for a profile that could not be processed."""
+    return {
+        "profile": profile,
+        "account_id": "Error",
+        "last_month": 0,
+        "current_month": 0,
+        "service_costs": [],
+        "service_costs_formatted": [f"Failed to process profile: {str(error)}"],
+        "budget_info": ["N/A"],
+        "ec2_summary": {"N/A": 0},
+        "ec2_summary_formatted": ["Error"],
+        "success": False,
+        "error": str(error),
+        "current_period_name": "Current month",
+        "previous_period_name": "Last month",
+        "percent_change_in_total_cost": None,
+    }
 
 
 def process_combined_profiles(
@@ -91,11 +104,21 @@ def process_combined_profiles(
     user_regions: Optional[List[str]] = None,
     time_range: Optional[int] = None,
     tag: Optional[List[str]] = None,
+    cost_data: Optional[CostData] = None,
 ) -> ProfileData:
-    """Process multiple profiles from the same AWS account."""
+    """
+    Process multiple profiles from the same AWS account.
+
+    When cost_data was already fetched for the account (for example by
+    get_linked_account_cost_data), Cost Explorer is not queried again and only
+    budgets missing from it are read from the account.
+    """
+    if len(profiles) == 1 and cost_data is None:
+        # Nothing to combine; the single-profile path also handles failures
+        return process_single_profile(profiles[0], user_regions, time_range, tag)
 
     primary_profile = profiles[0]
-    primary_session = boto3.Session(profile_name=primary_profile)
+    primary_session = get_session(primary_profile)
 
     account_cost_data: CostData = {
         "account_id": account_id,
@@ -115,47 +138,30 @@ def process_combined_profiles(
 
     try:
         # Attempt to overwrite with actual data from Cost Explorer
-        account_cost_data = get_cost_data(primary_session, time_range, tag)
+        if cost_data is not None:
+            account_cost_data = {
+                **cost_data,
+                "budgets": cost_data["budgets"] or get_budgets(primary_session),
+            }
+        else:
+            account_cost_data = get_cost_data(primary_session, time_range, tag)
     except Exception as e:
-        console.log(
-            f"[bold red]Error getting cost data for account {account_id}: {str(e)}[/]"
-        )
+        logger.error("Error getting cost data for account %s: %s", account_id, e)
         # account_cost_data retains its default values if an error occurs
 
     combined_current_month = account_cost_data["current_month"]
     combined_last_month = account_cost_data["last_month"]
-    combined_service_costs_dict: Dict[str, float] = defaultdict(float)
-
-    for group in account_cost_data["current_month_cost_by_service"]:
-        if "Keys" in group and "Metrics" in group:
-            service_name = group["Keys"][0]
-            cost_amount = float(group["Metrics"]["UnblendedCost"]["Amount"])
-            if cost_amount > 0.001:
-                combined_service_costs_dict[service_name] += cost_amount
+    service_costs, service_cost_data = process_service_costs(account_cost_data)
 
     combined_budgets = account_cost_data["budgets"]
 
     if user_regions:
         primary_regions = user_regions
     else:
-        primary_regions = get_accessible_regions(primary_session)
+        primary_regions = get_accessible_regions_for_profile(primary_profile)
 
     combined_ec2 = ec2_summary(primary_session, primary_regions)
 
-    service_costs = []
-    service_cost_data = [
-        (service, cost)
-        for service, cost in combined_service_costs_dict.items()
-        if cost > 0.001
-    ]
-    service_cost_data.sort(key=lambda x: x[1], reverse=True)
-
-    if not service_cost_data:
-        service_costs.append("No costs associated with this account")
-    else:
-        for service_name, cost_amount in service_cost_data:
-            service_costs.append(f"{service_name}: ${cost_amount:.2f}")
-
     budget_info = format_budget_info(combined_budgets)
 
     ec2_summary_text = format_ec2_summary(combined_ec2)
@@ -6,13 +6,158 @@ resources that may be candidates for termination or downsizing.
 """
 
 import datetime
-from typing import Dict, List, Any, Optional, Set
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from itertools import chain
+from types import MappingProxyType
+from typing import Callable, Dict, List, Any, Optional, Set, Tuple
 import boto3
+import numpy as np
+from botocore.config import Config
+from botocore.exceptions import BotoCoreError, ClientError
 from rich.console import Console
 from rich.table import Table
-from aws_finops_dashboard.helpers import get_currency_symbol, convert_currency, format_currency
+from aws_finops_dashboard.aws_client import MAX_REGION_WORKERS
+from aws_finops_dashboard.helpers import get_currency_symbol, convert_currency, format_currency, usd_converter
 
 console = Console()
+logger = logging.getLogger(__name__)
+
+# Adaptive retries absorb throttling when regions and resource types are scanned at once
+_CLIENT_CONFIG = Config(retries={'mode': 'adaptive', 'max_attempts': 10})
+
+# Error codes for throttling that outlasted the adaptive retries
+_THROTTLING_CODES = frozenset({'Throttling', 'ThrottlingException', 'RequestLimitExceeded'})
+
+# Seconds an analyzer reuses the results of a region scan
+SCAN_CACHE_TTL = 300
+
+# GetMetricData accepts at most this many queries per request
+METRIC_DATA_QUERY_LIMIT = 500
+
+# Simplified on-demand hourly EC2 prices (USD)
+_EC2_HOURLY_PRICES = MappingProxyType({
+    't2.micro': 0.0116,
+    't2.small': 0.023,
+    't2.medium': 0.0464,
+    't2.large': 0.0928,
+    't3.micro': 0.0104,
+    't3.small': 0.0208,
+    't3.medium': 0.0416,
+    'm5.large': 0.096,
+    'm5.xlarge': 0.192,
+    'm5.2xlarge': 0.384,
+    'c5.large': 0.085,
+    'c5.xlarge': 0.17,
+    'r5.large': 0.126,
+    'r5.xlarge': 0.252
+})
+
+# EBS base prices per GB-month (USD)
+_EBS_GB_MONTH_PRICES = MappingProxyType({
+    'gp2': 0.10,
+    'gp3': 0.08,
+    'io1': 0.125,
+    'io2': 0.125,
+    'st1': 0.045,
+    'sc1': 0.025,
+    'standard': 0.05
+})
+
+# Regional price adjustments, shared by EC2 and EBS estimates
+_REGION_MULTIPLIERS = MappingProxyType({
+    'us-east-1': 1.0,
+    'us-east-2': 1.0,
+    'us-west-1': 1.1,
+    'us-west-2': 1.0,
+    'eu-west-1': 1.05,
+    'eu-central-1': 1.15,
+    'ap-northeast-1': 1.15,
+    'ap-southeast-1': 1.1,
+    'ap-southeast-2': 1.15,
+    'ap-south-1': 1.1,
+})
+
+_HOURS_PER_MONTH = 24 * 30  # Approximate month as 30 days
+_SECONDS_PER_DAY = 86400
+
+
+def _is_throttled(error: Exception) -> bool:
+    """Check whether an error is an AWS throttling response."""
+    return isinstance(error, ClientError) and error.response.get('Error', {}).get('Code') in _THROTTLING_CODES
+
+
+def _report_region_error(resources: str, region: str, error: Exception) -> None:
+    """
+    Report a failed region scan.
+    
+    Throttling is only logged at DEBUG level: under a throttling storm every
+    region can fail at once, and the CLI renders WARNING records on the
+    console too.
+    """
+    if _is_throttled(error):
+        logger.debug("Throttled analyzing %s in %s: %s", resources, region, error)
+        return
+    console.print(f"[yellow]Error analyzing {resources} in {region}: {str(error)}[/]")
+
+
+class _RegionScanError(Exception):
+    """A region scan that failed part-way, carrying the resources it did find."""
+
+    def __init__(self, message: str, results: List[Dict[str, Any]]) -> None:
+        super().__init__(message)
+        self.results = results
+
+
+def _get_average_cpu(
+    cloudwatch: Any,
+    instance_ids: List[str],
+    start_time: datetime.datetime,
+    end_time: datetime.datetime,
+    period: int,
+) -> Dict[str, List[float]]:
+    """
+    Get average CPU utilization datapoints for many instances with GetMetricData.
+    
+    Args:
+        cloudwatch: CloudWatch client for the instances' region
+        instance_ids: Instances to query, METRIC_DATA_QUERY_LIMIT per request
+        start_time: Start of the metric window
+        end_time: End of the metric window
+        period: Datapoint period in seconds
+        
+    Returns:
+        Mapping of instance ID to its average CPU datapoints
+    """
+    datapoints: Dict[str, List[float]] = {instance_id: [] for instance_id in instance_ids}
+    paginator = cloudwatch.get_paginator('get_metric_data')
+    
+    for offset in range(0, len(instance_ids), METRIC_DATA_QUERY_LIMIT):
+        batch = instance_ids[offset:offset + METRIC_DATA_QUERY_LIMIT]
+        queries = [
+            {
+                'Id': f"i{index}",
+                'MetricStat': {
+                    'Metric': {
+                        'Namespace': 'AWS/EC2',
+                        'MetricName': 'CPUUtilization',
+                        'Dimensions': [{'Name': 'InstanceId', 'Value': instance_id}],
+                    },
+                    'Period': period,
+                    'Stat': 'Average',
+                },
+            }
+            for index, instance_id in enumerate(batch)
+        ]
+        for page in paginator.paginate(MetricDataQueries=queries, StartTime=start_time, EndTime=end_time):
+            for result in page.get('MetricDataResults', []):
+                datapoints[batch[int(result['Id'][1:])]].extend(result.get('Values', []))
+    
+    return datapoints
+
 
 class UnusedResourceAnalyzer:
     """Analyzer for identifying unused AWS resources."""
@@ -29,15 +174,132 @@ class UnusedResourceAnalyzer:
         self.session = session
         self.lookback_period = lookback_period
         self.cpu_threshold = cpu_threshold
+        # A boto3 Session is not thread-safe, so clients are created under this lock
+        self._session_lock = threading.Lock()
+        # (service, region) -> client, so each region's clients are built once
+        self._clients: Dict[Tuple[str, Optional[str]], Any] = {}
+        self._regions_lock = threading.Lock()
+        self._regions_cache: Optional[List[str]] = None
+        # (scan name, regions) -> (monotonic time, results) for recent scans
+        self._scan_cache: Dict[Tuple[str, Tuple[str, ...]], Tuple[float, List[Dict[str, Any]]]] = {}
         self.account_id = self._get_account_id()
         
     def _get_account_id(self) -> str:
         """Get the AWS account ID."""
         try:
-            return self.session.client('sts').get_caller_identity().get('Account')
+            return self._client('sts').get_caller_identity().get('Account')
         except Exception:
             return "Unknown"
     
+    def _client(self, service: str, region: Optional[str] = None) -> Any:
+        """Get the boto3 client for a service and region, creating it once from the shared session."""
+        key = (service, region)
+        client = self._clients.get(key)
+        if client is None:
+            with self._session_lock:
+                client = self._clients.get(key)
+                if client is None:
+                    client = self.session.client(service, region_name=region, config=_CLIENT_CONFIG)
+                    self._clients[key] = client
+        return client
+    
+    @staticmethod
+    def _name_tag(tags: Optional[List[Dict[str, str]]]) -> str:
+        """Get the Name tag value from a list of AWS tags."""
+        return next((tag['Value'] for tag in tags or () if tag['Key'] == 'Name'), "Unnamed")
+    
+    @staticmethod
+    def _parse_stop_date(reason: str) -> Optional[datetime.datetime]:
+        """
+        Parse the stop time from an instance's state transition reason.
+        
+        The reason looks like "User initiated (YYYY-MM-DD HH:MM:SS UTC)";
+        the result is timezone-aware UTC, and None is returned when it
+        carries no date.
+        """
+        if '(' not in reason:
+            return None
+        try:
+            date_str = reason.split('(', 1)[1].split(')', 1)[0]
+            stop_date = datetime.datetime.strptime(date_str, '%Y-%m-%d %H:%M:%S %Z')
+            return stop_date.replace(tzinfo=datetime.timezone.utc)
+        except (IndexError, ValueError):
+            return None
+    
+    def _resolve_regions(self, regions: Optional[List[str]]) -> List[str]:
+        """Return the given regions, or all regions of the account, looked up once per analyzer."""
+        if regions:
+            return regions
+        
+        # Holding the lock makes concurrent analyzers wait for a single lookup
+        with self._regions_lock:
+            if self._regions_cache is None:
+                try:
+                    self._regions_cache = [region['RegionName'] for region in 
+                                           self._client('ec2').describe_regions()['Regions']]
+                except Exception as e:
+                    console.print(f"[red]Error retrieving regions: {str(e)}[/]")
+                    return ['us-east-1']  # Default to US East 1
+            return self._regions_cache
+    
+    def _cached_scan(
+        self,
+        analyze_region: Callable[[str], List[Dict[str, Any]]],
+        regions: Optional[List[str]],
+        resources: str,
+    ) -> List[Dict[str, Any]]:
+        """
+        Scan all regions, reusing results from the last SCAN_CACHE_TTL seconds.
+        
+        This lets the analysis and display entry points share one set of API
+        calls when they are used back to back on the same analyzer. Scans that
+        lost a region to an error are returned but not cached.
+        """
+        regions = self._resolve_regions(regions)
+        key = (analyze_region.__name__, tuple(regions))
+        cached = self._scan_cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < SCAN_CACHE_TTL:
+            return list(cached[1])
+        
+        results, complete = self._map_regions(analyze_region, regions, resources)
+        if complete:
+            self._scan_cache[key] = (time.monotonic(), results)
+        return list(results)
+    
+    def _map_regions(
+        self,
+        analyze_region: Callable[[str], List[Dict[str, Any]]],
+        regions: List[str],
+        resources: str,
+    ) -> Tuple[List[Dict[str, Any]], bool]:
+        """
+        Run a per-region analysis concurrently and combine the results in region order.
+        
+        Returns:
+            The combined results, and whether every region was scanned completely
+        """
+        if not regions:
+            return [], True
+        
+        def analyze_region_safely(region: str) -> Tuple[List[Dict[str, Any]], bool]:
+            try:
+                return analyze_region(region), True
+            except _RegionScanError as e:
+                # Already reported by the region scan; keep what it found
+                return e.results, False
+            except Exception as e:
+                # Last resort so an unexpected error in one region cannot abort every other region
+                _report_region_error(resources, region, e)
+                return [], False
+        
+        results: List[Dict[str, Any]] = []
+        complete = True
+        with ThreadPoolExecutor(max_workers=min(MAX_REGION_WORKERS, len(regions))) as executor:
+            for region_results, region_complete in executor.map(analyze_region_safely, regions):
+                results.extend(region_results)
+                complete = complete and region_complete
+        return results, complete
+    
     def analyze_ec2_instances(self, regions: Optional[List[str]] = None) -> List[Dict[str, Any]]:
         """
         Analyze EC2 instances to identify unused or underutilized instances.
@@ -48,174 +310,113 @@ class UnusedResourceAnalyzer:
         Returns:
             List of unused EC2 instances with metadata
         """
-        if not regions:
-            try:
-                regions = [region['RegionName'] for region in 
-                          self.session.client('ec2').describe_regions()['Regions']]
-            except Exception as e:
-                console.print(f"[red]Error retrieving regions: {str(e)}[/]")
-                regions = ['us-east-1']  # Default to US East 1
-        
+        return self._cached_scan(self._analyze_ec2_region, regions, 'EC2 instances')
+    
+    def _analyze_ec2_region(self, region: str) -> List[Dict[str, Any]]:
+        """Find stopped and underutilized EC2 instances in one region."""
         unused_instances = []
+        # One epoch clock reading for every instance in the region
+        now_ts = time.time()
         
-        for region in regions:
-            try:
-                ec2 = self.session.resource('ec2', region_name=region)
-                cloudwatch = self.session.client('cloudwatch', region_name=region)
-                
-                # Get all instances
-                instances = list(ec2.instances.all())
+        try:
+            ec2_client = self._client('ec2', region)
+            cloudwatch = self._client('cloudwatch', region)
+            
+            # Get running and stopped instances, page by page; other states are filtered out by EC2
+            paginator = ec2_client.get_paginator('describe_instances')
+            running_instances = []
+            pages = paginator.paginate(
+                Filters=[{'Name': 'instance-state-name', 'Values': ['running', 'stopped']}]
+            )
+            
+            for instance in pages.search('Reservations[].Instances[]'):
+                state = instance['State']['Name']
                 
-                for instance in instances:
-                    # Skip terminated instances
-                    if instance.state['Name'] == 'terminated':
-                        continue
+                # Check if instance is stopped
+                if state == 'stopped':
+                    # Calculate how long the instance has been stopped
+                    stopped_date = self._parse_stop_date(instance.get('StateTransitionReason', ''))
+                    if stopped_date:
+                        days_stopped = int((now_ts - stopped_date.timestamp()) // _SECONDS_PER_DAY)
+                    else:
+                        days_stopped = self.lookback_period  # Default if we can't determine
                     
-                    # Check if instance is stopped
-                    if instance.state['Name'] == 'stopped':
-                        # Calculate how long the instance has been stopped
-                        try:
-                            status_transitions = instance.state_transition_reason
-                            # Extract the date if it's in the format "User initiated (YYYY-MM-DD HH:MM:SS UTC)"
-                            if '(' in status_transitions and ')' in status_transitions:
-                                date_str = status_transitions.split('(')[1].split(')')[0]
-                                stopped_date = datetime.datetime.strptime(date_str, '%Y-%m-%d %H:%M:%S %Z')
-                                days_stopped = (datetime.datetime.now() - stopped_date).days
-                            else:
-                                days_stopped = self.lookback_period  # Default if we can't determine
-                        except Exception:
-                            days_stopped = self.lookback_period  # Default if we can't determine
-                        
-                        # Create the unused resource entry
-                        instance_name = "Unnamed"
-                        for tag in instance.tags or []:
-                            if tag['Key'] == 'Name':
-                                instance_name = tag['Value']
-                                break
-                        
-                        unused_instances.append({
-                            'resource_id': instance.id,
-                            'resource_type': 'EC2 Instance',
-                            'name': instance_name,
-                            'region': region,
-                            'state': 'stopped',
-                            'days_unused': days_stopped,
-                            'estimated_monthly_cost': self._estimate_ec2_monthly_cost(instance.instance_type, region),
-                            'last_used': stopped_date.strftime('%Y-%m-%d') if 'stopped_date' in locals() else 'Unknown',
-                            'recommendation': f"Consider terminating if not needed; stopped for {days_stopped} days"
-                        })
-                        continue
+                    # Create the unused resource entry
+                    instance_name = self._name_tag(instance.get('Tags'))
                     
-                    # For running instances, check CloudWatch metrics to determine if they're underutilized
-                    if instance.state['Name'] == 'running':
-                        # Log instance details
-                        instance_name = "Unnamed"
-                        for tag in instance.tags or []:
-                            if tag['Key'] == 'Name':
-                                instance_name = tag['Value']
-                                break
-                                
-                        console.print(f"[cyan]Checking metrics for instance {instance.id} ({instance_name})[/]")
-                        
-                        # Get CPU utilization for the past lookback_period days
-                        end_time = datetime.datetime.now()
-                        start_time = end_time - datetime.timedelta(days=self.lookback_period)
-                        
-                        try:
-                            response = cloudwatch.get_metric_statistics(
-                                Namespace='AWS/EC2',
-                                MetricName='CPUUtilization',
-                                Dimensions=[{'Name': 'InstanceId', 'Value': instance.id}],
-                                StartTime=start_time,
-                                EndTime=end_time,
-                                Period=86400,  # 1 day in seconds
-                                Statistics=['Average']
-                            )
-                            
-                            # Print debugging info
-                            console.print(f"[cyan]  - Found {len(response['Datapoints'])} datapoints for metrics[/]")
-                            
-                            # Calculate average CPU utilization
-                            if response['Datapoints']:
-                                avg_cpu = sum(dp['Average'] for dp in response['Datapoints']) / len(response['Datapoints'])
-                                console.print(f"[cyan]  - Average CPU: {avg_cpu:.2f}% (threshold: {self.cpu_threshold:.2f}%)[/]")
-                                
-                                # If CPU utilization is consistently below threshold, flag as unused
-                                if avg_cpu < self.cpu_threshold:
-                                    console.print(f"[green]  - Instance flagged as underutilized[/]")
-                                    
-                                    unused_instances.append({
-                                        'resource_id': instance.id,
-                                        'resource_type': 'EC2 Instance',
-                                        'name': instance_name,
-                                        'region': region,
-                                        'state': 'underutilized',
-                                        'days_unused': self.lookback_period,
-                                        'estimated_monthly_cost': self._estimate_ec2_monthly_cost(instance.instance_type, region),
-                                        'last_used': 'Currently running',
-                                        'utilization': f"{avg_cpu:.1f}% CPU",
-                                        'recommendation': f"Consider downsizing; avg CPU: {avg_cpu:.1f}%"
-                                    })
-                                else:
-                                    console.print(f"[yellow]  - Instance not flagged (utilization above threshold)[/]")
-                            else:
-                                # Try with a different period
-                                console.print(f"[yellow]  - No data with daily period, trying hourly period...[/]")
-                                response = cloudwatch.get_metric_statistics(
-                                    Namespace='AWS/EC2',
-                                    MetricName='CPUUtilization',
-                                    Dimensions=[{'Name': 'InstanceId', 'Value': instance.id}],
-                                    StartTime=start_time,
-                                    EndTime=end_time,
-                                    Period=3600,  # 1 hour in seconds
-                                    Statistics=['Average']
-                                )
-                                
-                                if response['Datapoints']:
-                                    console.print(f"[cyan]  - Found {len(response['Datapoints'])} hourly datapoints[/]")
-                                    avg_cpu = sum(dp['Average'] for dp in response['Datapoints']) / len(response['Datapoints'])
-                                    console.print(f"[cyan]  - Average CPU: {avg_cpu:.2f}% (threshold: {self.cpu_threshold:.2f}%)[/]")
-                                    
-                                    # If CPU utilization is consistently below threshold, flag as unused
-                                    if avg_cpu < self.cpu_threshold:
-                                        console.print(f"[green]  - Instance flagged as underutilized[/]")
-                                        
-                                        unused_instances.append({
-                                            'resource_id': instance.id,
-                                            'resource_type': 'EC2 Instance',
-                                            'name': instance_name,
-                                            'region': region,
-                                            'state': 'underutilized',
-                                            'days_unused': self.lookback_period,
-                                            'estimated_monthly_cost': self._estimate_ec2_monthly_cost(instance.instance_type, region),
-                                            'last_used': 'Currently running',
-                                            'utilization': f"{avg_cpu:.1f}% CPU",
-                                            'recommendation': f"Consider downsizing; avg CPU: {avg_cpu:.1f}%"
-                                        })
-                                    else:
-                                        console.print(f"[yellow]  - Instance not flagged (utilization above threshold)[/]")
-                                else:
-                                    # Log instances with missing CloudWatch data
-                                    console.print(f"[yellow]Warning: No CloudWatch data for instance {instance.id} ({instance_name}) in {region}[/]")
-                                    
-                                    # Try listing available metrics for this instance
-                                    console.print(f"[cyan]  - Checking available metrics for this instance...[/]")
-                                    try:
-                                        available_metrics = cloudwatch.list_metrics(
-                                            Namespace='AWS/EC2',
-                                            Dimensions=[{'Name': 'InstanceId', 'Value': instance.id}]
-                                        )
-                                        if available_metrics['Metrics']:
-                                            console.print(f"[cyan]  - Available metrics: {[m['MetricName'] for m in available_metrics['Metrics']]}")
-                                        else:
-                                            console.print(f"[yellow]  - No metrics available for this instance")
-                                    except Exception as e:
-                                        console.print(f"[red]  - Error listing metrics: {str(e)}")
-                        except Exception as e:
-                            console.print(f"[red]Error getting metrics for {instance.id}: {str(e)}")
-            except Exception as e:
-                console.print(f"[yellow]Error analyzing EC2 instances in {region}: {str(e)}[/]")
+                    unused_instances.append({
+                        'resource_id': instance['InstanceId'],
+                        'resource_type': 'EC2 Instance',
+                        'name': instance_name,
+                        'region': region,
+                        'state': 'stopped',
+                        'days_unused': days_stopped,
+                        'estimated_monthly_cost': self._estimate_ec2_monthly_cost(instance['InstanceType'], region),
+                        'last_used': stopped_date.strftime('%Y-%m-%d') if stopped_date else 'Unknown',
+                        'recommendation': f"Consider terminating if not needed; stopped for {days_stopped} days"
+                    })
+                    continue
                 
+                # Running instances are checked against CloudWatch in one batch below
+                if state == 'running':
+                    running_instances.append(instance)
+            
+            if not running_instances:
+                return unused_instances
+            
+            # Get CPU utilization for the past lookback_period days
+            end_time = datetime.datetime.fromtimestamp(now_ts, datetime.timezone.utc)
+            start_time = end_time - datetime.timedelta(days=self.lookback_period)
+            instance_ids = [instance['InstanceId'] for instance in running_instances]
+            
+            try:
+                console.print(f"[cyan]Checking metrics for {len(instance_ids)} running instances in {region}[/]")
+                datapoints = _get_average_cpu(cloudwatch, instance_ids, start_time, end_time, 86400)
+                
+                # Try with an hourly period for instances without daily data
+                missing_ids = [instance_id for instance_id in instance_ids if not datapoints[instance_id]]
+                if missing_ids:
+                    console.print(f"[yellow]  - No daily data for {len(missing_ids)} instances, trying hourly period...[/]")
+                    datapoints.update(_get_average_cpu(cloudwatch, missing_ids, start_time, end_time, 3600))
+            except (BotoCoreError, ClientError) as e:
+                if _is_throttled(e):
+                    logger.debug("Throttled getting metrics for instances in %s: %s", region, e)
+                else:
+                    console.print(f"[red]Error getting metrics for instances in {region}: {str(e)}")
+                raise _RegionScanError(str(e), unused_instances) from e
+            
+            for instance in running_instances:
+                # Log instance details
+                instance_name = self._name_tag(instance.get('Tags'))
+                
+                values = datapoints[instance['InstanceId']]
+                if not values:
+                    # Log instances with missing CloudWatch data
+                    console.print(f"[yellow]Warning: No CloudWatch data for instance {instance['InstanceId']} ({instance_name}) in {region}[/]")
+                    continue
+                
+                # Calculate average CPU utilization
+                avg_cpu = sum(values) / len(values)
+                console.print(f"[cyan]  - {instance['InstanceId']} ({instance_name}): average CPU {avg_cpu:.2f}% (threshold: {self.cpu_threshold:.2f}%)[/]")
+                
+                # If CPU utilization is consistently below threshold, flag as unused
+                if avg_cpu < self.cpu_threshold:
+                    unused_instances.append({
+                        'resource_id': instance['InstanceId'],
+                        'resource_type': 'EC2 Instance',
+                        'name': instance_name,
+                        'region': region,
+                        'state': 'underutilized',
+                        'days_unused': self.lookback_period,
+                        'estimated_monthly_cost': self._estimate_ec2_monthly_cost(instance['InstanceType'], region),
+                        'last_used': 'Currently running',
+                        'utilization': f"{avg_cpu:.1f}% CPU",
+                        'recommendation': f"Consider downsizing; avg CPU: {avg_cpu:.1f}%"
+                    })
+        except (BotoCoreError, ClientError) as e:
+            _report_region_error('EC2 instances', region, e)
+            raise _RegionScanError(str(e), unused_instances) from e
+        
         return unused_instances
     
     def analyze_ebs_volumes(self, regions: Optional[List[str]] = None) -> List[Dict[str, Any]]:
@@ -228,53 +429,45 @@ class UnusedResourceAnalyzer:
         Returns:
             List of unused EBS volumes with metadata
         """
-        if not regions:
-            try:
-                regions = [region['RegionName'] for region in 
-                          self.session.client('ec2').describe_regions()['Regions']]
-            except Exception as e:
-                console.print(f"[red]Error retrieving regions: {str(e)}[/]")
-                regions = ['us-east-1']  # Default to US East 1
-        
+        return self._cached_scan(self._analyze_ebs_region, regions, 'EBS volumes')
+    
+    def _analyze_ebs_region(self, region: str) -> List[Dict[str, Any]]:
+        """Find unattached EBS volumes in one region."""
         unused_volumes = []
+        # One epoch clock reading for every volume in the region
+        now_ts = time.time()
         
-        for region in regions:
-            try:
-                ec2 = self.session.resource('ec2', region_name=region)
-                
-                # Get all volumes
-                volumes = list(ec2.volumes.all())
+        try:
+            ec2_client = self._client('ec2', region)
+            
+            # Get available (not attached) volumes, page by page
+            paginator = ec2_client.get_paginator('describe_volumes')
+            pages = paginator.paginate(Filters=[{'Name': 'status', 'Values': ['available']}])
+            
+            for volume in pages.search('Volumes[]'):
+                # Calculate creation date
+                days_available = int((now_ts - volume['CreateTime'].timestamp()) // _SECONDS_PER_DAY)
                 
-                for volume in volumes:
-                    # Check if volume is available (not attached)
-                    if volume.state == 'available':
-                        # Calculate creation date
-                        create_time = volume.create_time
-                        days_available = (datetime.datetime.now(datetime.timezone.utc) - create_time).days
-                        
-                        # Create the unused resource entry
-                        volume_name = "Unnamed"
-                        for tag in volume.tags or []:
-                            if tag['Key'] == 'Name':
-                                volume_name = tag['Value']
-                                break
-                        
-                        unused_volumes.append({
-                            'resource_id': volume.id,
-                            'resource_type': 'EBS Volume',
-                            'name': volume_name,
-                            'region': region,
-                            'state': 'available',
-                            'days_unused': days_available,
-                            'size': f"{volume.size} GB",
-                            'volume_type': volume.volume_type,
-                            'estimated_monthly_cost': self._estimate_ebs_monthly_cost(volume.size, volume.volume_type, region),
-                            'last_used': 'Never attached' if not volume.attachments else 'Previously attached',
-                            'recommendation': f"Consider deleting if not needed; unattached for {days_available} days"
-                        })
-            except Exception as e:
-                console.print(f"[yellow]Error analyzing EBS volumes in {region}: {str(e)}[/]")
+                # Create the unused resource entry
+                volume_name = self._name_tag(volume.get('Tags'))
                 
+                unused_volumes.append({
+                    'resource_id': volume['VolumeId'],
+                    'resource_type': 'EBS Volume',
+                    'name': volume_name,
+                    'region': region,
+                    'state': 'available',
+                    'days_unused': days_available,
+                    'size': f"{volume['Size']} GB",
+                    'volume_type': volume['VolumeType'],
+                    'estimated_monthly_cost': self._estimate_ebs_monthly_cost(volume['Size'], volume['VolumeType'], region),
+                    'last_used': 'Never attached' if not volume.get('Attachments') else 'Previously attached',
+                    'recommendation': f"Consider deleting if not needed; unattached for {days_available} days"
+                })
+        except (BotoCoreError, ClientError) as e:
+            _report_region_error('EBS volumes', region, e)
+            raise _RegionScanError(str(e), unused_volumes) from e
+        
         return unused_volumes
     
     def analyze_elastic_ips(self, regions: Optional[List[str]] = None) -> List[Dict[str, Any]]:
@@ -287,106 +480,49 @@ class UnusedResourceAnalyzer:
         Returns:
             List of unused Elastic IPs with metadata
         """
-        if not regions:
-            try:
-                regions = [region['RegionName'] for region in 
-                          self.session.client('ec2').describe_regions()['Regions']]
-            except Exception as e:
-                console.print(f"[red]Error retrieving regions: {str(e)}[/]")
-                regions = ['us-east-1']  # Default to US East 1
-        
+        return self._cached_scan(self._analyze_eip_region, regions, 'Elastic IPs')
+    
+    def _analyze_eip_region(self, region: str) -> List[Dict[str, Any]]:
+        """Find unassociated Elastic IPs in one region."""
         unused_eips = []
         
-        for region in regions:
-            try:
-                ec2_client = self.session.client('ec2', region_name=region)
-                
-                # Get all Elastic IPs
-                response = ec2_client.describe_addresses()
-                
-                for address in response.get('Addresses', []):
-                    # Check if EIP is not associated with an instance
-                    if 'AssociationId' not in address:
-                        unused_eips.append({
-                            'resource_id': address.get('AllocationId', address.get('PublicIp', 'Unknown')),
-                            'resource_type': 'Elastic IP',
-                            'public_ip': address.get('PublicIp', 'Unknown'),
-                            'region': region,
-                            'state': 'unassociated',
-                            'days_unused': 'Unknown',  # AWS doesn't provide allocation time for EIPs
-                            'estimated_monthly_cost': 3.6,  # $0.005 per hour for unattached EIP = ~$3.6/month
-                            'recommendation': "Consider releasing if not needed; unassociated"
-                        })
-            except Exception as e:
-                console.print(f"[yellow]Error analyzing Elastic IPs in {region}: {str(e)}[/]")
-                
+        try:
+            ec2_client = self._client('ec2', region)
+            
+            # Get all Elastic IPs
+            response = ec2_client.describe_addresses()
+            
+            for address in response.get('Addresses', []):
+                # Check if EIP is not associated with an instance
+                if 'AssociationId' not in address:
+                    unused_eips.append({
+                        'resource_id': address.get('AllocationId', address.get('PublicIp', 'Unknown')),
+                        'resource_type': 'Elastic IP',
+                        'public_ip': address.get('PublicIp', 'Unknown'),
+                        'region': region,
+                        'state': 'unassociated',
+                        'days_unused': 'Unknown',  # AWS doesn't provide allocation time for EIPs
+                        'estimated_monthly_cost': 3.6,  # $0.005 per hour for unattached EIP = ~$3.6/month
+                        'recommendation': "Consider releasing if not needed; unassociated"
+                    })
+        except (BotoCoreError, ClientError) as e:
+            _report_region_error('Elastic IPs', region, e)
+            raise _RegionScanError(str(e), unused_eips) from e
+        
         return unused_eips
     
-    def _estimate_ec2_monthly_cost(self, instance_type: str, region: str) -> float:
-        """Estimate monthly cost for an EC2 instance."""
-        # This is a simplified pricing model
-        base_prices = {
-            't2.micro': 0.0116,
-            't2.small': 0.023,
-            't2.medium': 0.0464,
-            't2.large': 0.0928,
-            't3.micro': 0.0104,
-            't3.small': 0.0208,
-            't3.medium': 0.0416,
-            'm5.large': 0.096,
-            'm5.xlarge': 0.192,
-            'm5.2xlarge': 0.384,
-            'c5.large': 0.085,
-            'c5.xlarge': 0.17,
-            'r5.large': 0.126,
-            'r5.xlarge': 0.252
-        }
-        
-        # Regional price adjustments
-        region_multipliers = {
-            'us-east-1': 1.0,
-            'us-east-2': 1.0,
-            'us-west-1': 1.1,
-            'us-west-2': 1.0,
-            'eu-west-1': 1.05,
-            'eu-central-1': 1.15,
-            'ap-northeast-1': 1.15,
-            'ap-southeast-1': 1.1,
-            'ap-southeast-2': 1.15,
-            'ap-south-1': 1.1,
-        }
-        
-        hourly_rate = base_prices.get(instance_type, 0.1) * region_multipliers.get(region, 1.0)
-        return hourly_rate * 24 * 30  # Approximate month as 30 days
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def _estimate_ec2_monthly_cost(instance_type: str, region: str) -> float:
+        """Estimate monthly cost for an EC2 instance, memoised per (type, region)."""
+        hourly_rate = _EC2_HOURLY_PRICES.get(instance_type, 0.1) * _REGION_MULTIPLIERS.get(region, 1.0)
+        return hourly_rate * _HOURS_PER_MONTH
     
-    def _estimate_ebs_monthly_cost(self, size_gb: int, volume_type: str, region: str) -> float:
-        """Estimate monthly cost for an EBS volume."""
-        # Base prices per GB-month
-        base_prices = {
-            'gp2': 0.10,
-            'gp3': 0.08,
-            'io1': 0.125,
-            'io2': 0.125,
-            'st1': 0.045,
-            'sc1': 0.025,
-            'standard': 0.05
-        }
-        
-        # Regional price adjustments
-        region_multipliers = {
-            'us-east-1': 1.0,
-            'us-east-2': 1.0,
-            'us-west-1': 1.1,
-            'us-west-2': 1.0,
-            'eu-west-1': 1.05,
-            'eu-central-1': 1.15,
-            'ap-northeast-1': 1.15,
-            'ap-southeast-1': 1.1,
-            'ap-southeast-2': 1.15,
-            'ap-south-1': 1.1,
-        }
-        
-        gb_month_rate = base_prices.get(volume_type, 0.1) * region_multipliers.get(region, 1.0)
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def _estimate_ebs_monthly_cost(size_gb: int, volume_type: str, region: str) -> float:
+        """Estimate monthly cost for an EBS volume, memoised per (size, type, region)."""
+        gb_month_rate = _EBS_GB_MONTH_PRICES.get(volume_type, 0.1) * _REGION_MULTIPLIERS.get(region, 1.0)
         return gb_month_rate * size_gb
     
     def get_all_unused_resources(self, regions: Optional[List[str]] = None) -> Dict[str, Any]:
@@ -399,27 +535,32 @@ class UnusedResourceAnalyzer:
         Returns:
             Dictionary with lists of unused resources by type
         """
+        # The three analyses are independent, so run them side by side
         console.print("[cyan]Analyzing EC2 instances...[/]")
-        ec2_instances = self.analyze_ec2_instances(regions)
-        
         console.print("[cyan]Analyzing EBS volumes...[/]")
-        ebs_volumes = self.analyze_ebs_volumes(regions)
-        
         console.print("[cyan]Analyzing Elastic IPs...[/]")
-        elastic_ips = self.analyze_elastic_ips(regions)
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            ec2_future = executor.submit(self.analyze_ec2_instances, regions)
+            ebs_future = executor.submit(self.analyze_ebs_volumes, regions)
+            eip_future = executor.submit(self.analyze_elastic_ips, regions)
+            ec2_instances = ec2_future.result()
+            ebs_volumes = ebs_future.result()
+            elastic_ips = eip_future.result()
         
         # Calculate total estimated savings
-        total_monthly_savings = (
-            sum(instance['estimated_monthly_cost'] for instance in ec2_instances) +
-            sum(volume['estimated_monthly_cost'] for volume in ebs_volumes) +
-            sum(eip['estimated_monthly_cost'] for eip in elastic_ips)
-        )
+        total_resources = len(ec2_instances) + len(ebs_volumes) + len(elastic_ips)
+        total_monthly_savings = float(np.fromiter(
+            (resource['estimated_monthly_cost']
+             for resource in chain(ec2_instances, ebs_volumes, elastic_ips)),
+            dtype=np.float64,
+            count=total_resources,
+        ).sum())
         
         return {
             'ec2_instances': ec2_instances,
             'ebs_volumes': ebs_volumes,
             'elastic_ips': elastic_ips,
-            'total_resources': len(ec2_instances) + len(ebs_volumes) + len(elastic_ips),
+            'total_resources': total_resources,
             'estimated_monthly_savings': total_monthly_savings,
             'estimated_annual_savings': total_monthly_savings * 12,
             'account_id': self.account_id,
@@ -439,6 +580,10 @@ class UnusedResourceAnalyzer:
         # Get currency symbol
         currency_symbol = get_currency_symbol(currency)
         
+        # Bind the conversion and formatting for this report once
+        conv = usd_converter(currency)
+        fmt = partial(format_currency, currency_code=currency)
+        
         # Display EC2 instances
         if results['ec2_instances']:
             table = Table(
@@ -456,20 +601,20 @@ class UnusedResourceAnalyzer:
             table.add_column(f"Cost ({currency})")
             table.add_column("Recommendation")
             
-            for instance in results['ec2_instances']:
-                # Convert cost to specified currency
-                cost = convert_currency(instance['estimated_monthly_cost'], "USD", currency)
-                cost_formatted = format_currency(cost, currency)
-                
-                table.add_row(
+            rows: List[Tuple[Any, ...]] = [
+                (
                     instance['resource_id'],
                     instance['name'],
                     instance['region'],
                     instance['state'],
                     instance.get('utilization', f"{instance['days_unused']} days"),
-                    cost_formatted,
-                    instance['recommendation']
+                    fmt(conv(instance['estimated_monthly_cost'])),
+                    instance['recommendation'],
                 )
+                for instance in results['ec2_instances']
+            ]
+            for row in rows:
+                table.add_row(*row)
             
             console.print(table)
         else:
@@ -493,21 +638,21 @@ class UnusedResourceAnalyzer:
             table.add_column(f"Cost ({currency})")
             table.add_column("Recommendation")
             
-            for volume in results['ebs_volumes']:
-                # Convert cost to specified currency
-                cost = convert_currency(volume['estimated_monthly_cost'], "USD", currency)
-                cost_formatted = format_currency(cost, currency)
-                
-                table.add_row(
+            rows = [
+                (
                     volume['resource_id'],
                     volume.get('name', 'Unnamed'),
                     volume['region'],
                     volume['size'],
                     volume['volume_type'],
                     str(volume['days_unused']),
-                    cost_formatted,
-                    volume['recommendation']
+                    fmt(conv(volume['estimated_monthly_cost'])),
+                    volume['recommendation'],
                 )
+                for volume in results['ebs_volumes']
+            ]
+            for row in rows:
+                table.add_row(*row)
             
             console.print(table)
         else:
@@ -528,18 +673,18 @@ class UnusedResourceAnalyzer:
             table.add_column(f"Cost ({currency})")
             table.add_column("Recommendation")
             
-            for eip in results['elastic_ips']:
-                # Convert cost to specified currency
-                cost = convert_currency(eip['estimated_monthly_cost'], "USD", currency)
-                cost_formatted = format_currency(cost, currency)
-                
-                table.add_row(
+            rows = [
+                (
                     eip['resource_id'],
                     eip['public_ip'],
                     eip['region'],
-                    cost_formatted,
-                    eip['recommendation']
+                    fmt(conv(eip['estimated_monthly_cost'])),
+                    eip['recommendation'],
                 )
+                for eip in results['elastic_ips']
+            ]
+            for row in rows:
+                table.add_row(*row)
             
             console.print(table)
         else:
@@ -562,6 +707,17 @@ class UnusedResourceAnalyzer:
         console.print(f"Estimated monthly savings: {monthly_savings_formatted}")
         console.print(f"Estimated annual savings: {annual_savings_formatted}")
 
+
+@lru_cache(maxsize=16)
+def _get_analyzer(session: boto3.Session, lookback_days: int, cpu_threshold: float) -> UnusedResourceAnalyzer:
+    """
+    Get a shared analyzer for a session and settings.
+    
+    The module-level helpers reuse it so that their scan caches are shared.
+    """
+    return UnusedResourceAnalyzer(session, lookback_days, cpu_threshold)
+
+
 def analyze_unused_resources(session: boto3.Session, regions: Optional[List[str]] = None, 
                              lookback_days: int = 14, cpu_threshold: float = 5.0) -> Dict[str, Any]:
     """
@@ -576,7 +732,7 @@ def analyze_unused_resources(session: boto3.Session, regions: Optional[List[str]
     Returns:
         Dictionary with lists of unused resources by type
     """
-    analyzer = UnusedResourceAnalyzer(session, lookback_days, cpu_threshold)
+    analyzer = _get_analyzer(session, lookback_days, cpu_threshold)
     return analyzer.get_all_unused_resources(regions)
 
 
@@ -591,5 +747,5 @@ def display_unused_resources_summary(session: boto3.Session, regions: Optional[L
         lookback_days: Number of days to look back for usage analysis
         cpu_threshold: CPU utilization threshold percentage to consider an instance underutilized
     """
-    analyzer = UnusedResourceAnalyzer(session, lookback_days, cpu_threshold)
-    analyzer.display_unused_resources(regions) 
\ No newline at end of file
+    analyzer = _get_analyzer(session, lookback_days, cpu_threshold)
+    analyzer.display_unused_resources(regions)
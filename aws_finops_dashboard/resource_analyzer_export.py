@@ -5,9 +5,9 @@ This module provides functionality to export unused resource reports
 in various formats including CSV, JSON, and PDF.
 """
 
-import json
 import csv
 import os
+from functools import partial
 from typing import Dict, Any, List, Optional
 import datetime
 
@@ -16,7 +16,31 @@ from reportlab.lib.pagesizes import letter, landscape
 from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
 from reportlab.lib.styles import getSampleStyleSheet
 
-from aws_finops_dashboard.helpers import convert_currency, format_currency, get_currency_symbol
+from aws_finops_dashboard.helpers import (
+    format_currency,
+    get_currency_symbol,
+    usd_converter,
+    write_json_file,
+)
+
+# CSV columns for each resource type, in the order their values are built
+_EC2_CSV_FIELDS = (
+    'Resource Type', 'Resource ID', 'Name', 'Region', 'State',
+    'Utilization/Days Unused', 'Monthly Cost ($)', 'Recommendation',
+)
+_EBS_CSV_FIELDS = (
+    'Resource Type', 'Resource ID', 'Name', 'Region', 'Size',
+    'Volume Type', 'Days Unused', 'Monthly Cost ($)', 'Recommendation',
+)
+_EIP_CSV_FIELDS = (
+    'Resource Type', 'Resource ID', 'Public IP', 'Region',
+    'Monthly Cost ($)', 'Recommendation',
+)
+
+
+def _truncate(text: str, limit: int, keep: int) -> str:
+    """Shorten text longer than limit to its first keep characters plus an ellipsis."""
+    return text if len(text) <= limit else text[:keep] + '...'
 
 
 def export_to_json(data: Dict[str, Any], output_file: str) -> str:
@@ -30,8 +54,7 @@ def export_to_json(data: Dict[str, Any], output_file: str) -> str:
     Returns:
         Path to the exported file
     """
-    with open(output_file, 'w') as f:
-        json.dump(data, f, indent=2)
+    write_json_file(data, output_file, indent=2)
     
     return output_file
 
@@ -47,63 +70,72 @@ def export_to_csv(data: Dict[str, Any], output_file: str) -> str:
     Returns:
         Path to the exported file
     """
-    # Create a list to hold all resource entries
-    all_resources = []
-    
-    # Add EC2 instances
-    for instance in data.get('ec2_instances', []):
-        resource = {
-            'Resource Type': 'EC2 Instance',
-            'Resource ID': instance['resource_id'],
-            'Name': instance.get('name', 'Unnamed'),
-            'Region': instance['region'],
-            'State': instance['state'],
-            'Utilization/Days Unused': instance.get('utilization', f"{instance['days_unused']} days"),
-            'Monthly Cost ($)': f"${instance['estimated_monthly_cost']:.2f}",
-            'Recommendation': instance['recommendation']
-        }
-        all_resources.append(resource)
-    
-    # Add EBS volumes
-    for volume in data.get('ebs_volumes', []):
-        resource = {
-            'Resource Type': 'EBS Volume',
-            'Resource ID': volume['resource_id'],
-            'Name': volume.get('name', 'Unnamed'),
-            'Region': volume['region'],
-            'Size': volume['size'],
-            'Volume Type': volume['volume_type'],
-            'Days Unused': volume['days_unused'],
-            'Monthly Cost ($)': f"${volume['estimated_monthly_cost']:.2f}",
-            'Recommendation': volume['recommendation']
-        }
-        all_resources.append(resource)
-    
-    # Add Elastic IPs
-    for eip in data.get('elastic_ips', []):
-        resource = {
-            'Resource Type': 'Elastic IP',
-            'Resource ID': eip['resource_id'],
-            'Public IP': eip['public_ip'],
-            'Region': eip['region'],
-            'Monthly Cost ($)': f"${eip['estimated_monthly_cost']:.2f}",
-            'Recommendation': eip['recommendation']
-        }
-        all_resources.append(resource)
-    
-    # Get all unique fields
-    fields = set()
-    for resource in all_resources:
-        fields.update(resource.keys())
-    
-    fields = sorted(list(fields))
+    ec2_instances = data.get('ec2_instances', [])
+    ebs_volumes = data.get('ebs_volumes', [])
+    elastic_ips = data.get('elastic_ips', [])
+    
+    # Collect every resource entry, one schema per resource type
+    all_resources = (
+        [
+            dict(zip(_EC2_CSV_FIELDS, (
+                'EC2 Instance',
+                instance['resource_id'],
+                instance.get('name', 'Unnamed'),
+                instance['region'],
+                instance['state'],
+                instance.get('utilization', f"{instance['days_unused']} days"),
+                f"${instance['estimated_monthly_cost']:.2f}",
+                instance['recommendation'],
+            )))
+            for instance in ec2_instances
+        ]
+        + [
+            dict(zip(_EBS_CSV_FIELDS, (
+                'EBS Volume',
+                volume['resource_id'],
+                volume.get('name', 'Unnamed'),
+                volume['region'],
+                volume['size'],
+                volume['volume_type'],
+                volume['days_unused'],
+                f"${volume['estimated_monthly_cost']:.2f}",
+                volume['recommendation'],
+            )))
+            for volume in ebs_volumes
+        ]
+        + [
+            dict(zip(_EIP_CSV_FIELDS, (
+                'Elastic IP',
+                eip['resource_id'],
+                eip['public_ip'],
+                eip['region'],
+                f"${eip['estimated_monthly_cost']:.2f}",
+                eip['recommendation'],
+            )))
+            for eip in elastic_ips
+        ]
+    )
+    
+    # The columns are the schemas of the resource types present in the report
+    present_schemas = [
+        schema
+        for schema, resources in (
+            (_EC2_CSV_FIELDS, ec2_instances),
+            (_EBS_CSV_FIELDS, ebs_volumes),
+            (_EIP_CSV_FIELDS, elastic_ips),
+        )
+        if resources
+    ]
+    fields = sorted(set().union(*present_schemas))
+    
+    # Lay the rows out in column order up front so the writer emits them in one call
+    rows = [[resource.get(field, '') for field in fields] for resource in all_resources]
     
     # Write CSV file
     with open(output_file, 'w', newline='') as f:
-        writer = csv.DictWriter(f, fieldnames=fields)
-        writer.writeheader()
-        for resource in all_resources:
-            writer.writerow(resource)
+        writer = csv.writer(f)
+        writer.writerow(fields)
+        writer.writerows(rows)
     
     return output_file
 
@@ -161,13 +193,13 @@ def export_to_pdf(data: Dict[str, Any], output_file: str, currency: str = "USD")
     monthly_savings = data.get('estimated_monthly_savings', 0)
     annual_savings = data.get('estimated_annual_savings', 0)
     
-    # Convert amounts to selected currency
-    monthly_savings = convert_currency(monthly_savings, "USD", currency)
-    annual_savings = convert_currency(annual_savings, "USD", currency)
+    # Resolve the conversion and formatting for the selected currency once
+    conv = usd_converter(currency)
+    fmt = partial(format_currency, currency_code=currency)
     
-    # Format with appropriate currency
-    monthly_savings_formatted = format_currency(monthly_savings, currency)
-    annual_savings_formatted = format_currency(annual_savings, currency)
+    # Convert and format amounts in the selected currency
+    monthly_savings_formatted = fmt(conv(monthly_savings))
+    annual_savings_formatted = fmt(conv(annual_savings))
     
     summary_title = Paragraph("Summary", styles['Heading2'])
     elements.append(summary_title)
@@ -197,36 +229,20 @@ def export_to_pdf(data: Dict[str, Any], output_file: str, currency: str = "USD")
         ec2_title = Paragraph("Unused or Underutilized EC2 Instances", styles['Heading2'])
         elements.append(ec2_title)
         
-        # More descriptive header with proper capitalization
-        ec2_data = [["Instance ID", "Name", "Region", "State", "Utilization", f"Cost ({currency})", "Action"]]
-        
-        for instance in data.get('ec2_instances', []):
-            # Convert cost to selected currency
-            cost = convert_currency(instance['estimated_monthly_cost'], "USD", currency)
-            cost_formatted = format_currency(cost, currency)
-            
-            # Truncate name if too long
-            name = instance.get('name', 'Unnamed')
-            if len(name) > 20:
-                name = name[:18] + '...'
-            
-            # Shorten recommendations for better fit
-            recommendation = instance['recommendation']
-            if len(recommendation) > 60:
-                recommendation = recommendation[:57] + '...'
-            
-            # Format state (capitalize first letter)
-            state = instance['state'].capitalize()
-                
-            ec2_data.append([
+        # Descriptive header, then one row per instance with long names and
+        # recommendations shortened for better fit
+        ec2_data = [["Instance ID", "Name", "Region", "State", "Utilization", f"Cost ({currency})", "Action"]] + [
+            [
                 instance['resource_id'],
-                name,
+                _truncate(instance.get('name', 'Unnamed'), 20, 18),
                 instance['region'],
-                state,
+                instance['state'].capitalize(),
                 instance.get('utilization', f"{instance['days_unused']} days"),
-                cost_formatted,
-                recommendation
-            ])
+                fmt(conv(instance['estimated_monthly_cost'])),
+                _truncate(instance['recommendation'], 60, 57),
+            ]
+            for instance in data['ec2_instances']
+        ]
         
         # Better column widths distribution - adjusted for content
         col_widths = [90, 80, 60, 60, 80, 70, 200]
@@ -256,33 +272,19 @@ def export_to_pdf(data: Dict[str, Any], output_file: str, currency: str = "USD")
         ebs_data = [[
             "Volume ID", "Name", "Region", "Size", 
             "Type", "Days Unused", f"Cost ({currency})", "Action"
-        ]]
-        
-        for volume in data.get('ebs_volumes', []):
-            # Convert cost to selected currency
-            cost = convert_currency(volume['estimated_monthly_cost'], "USD", currency)
-            cost_formatted = format_currency(cost, currency)
-            
-            # Truncate name if too long
-            name = volume.get('name', 'Unnamed')
-            if len(name) > 15:
-                name = name[:13] + '...'
-                
-            # Shorten recommendations
-            recommendation = volume['recommendation']
-            if len(recommendation) > 50:
-                recommendation = recommendation[:47] + '...'
-                
-            ebs_data.append([
+        ]] + [
+            [
                 volume['resource_id'],
-                name,
+                _truncate(volume.get('name', 'Unnamed'), 15, 13),
                 volume['region'],
                 volume['size'],
                 volume['volume_type'],
                 str(volume['days_unused']),
-                cost_formatted,
-                recommendation
-            ])
+                fmt(conv(volume['estimated_monthly_cost'])),
+                _truncate(volume['recommendation'], 50, 47),
+            ]
+            for volume in data['ebs_volumes']
+        ]
         
         # Better column widths distribution
         col_widths = [80, 60, 55, 45, 45, 50, 70, 185]
@@ -309,25 +311,16 @@ def export_to_pdf(data: Dict[str, Any], output_file: str, currency: str = "USD")
         eip_title = Paragraph("Unused Elastic IPs", styles['Heading2'])
         elements.append(eip_title)
         
-        eip_data = [["Allocation ID", "Public IP", "Region", f"Cost ({currency})", "Action"]]
-        
-        for eip in data.get('elastic_ips', []):
-            # Convert cost to selected currency
-            cost = convert_currency(eip['estimated_monthly_cost'], "USD", currency)
-            cost_formatted = format_currency(cost, currency)
-            
-            # Shorten recommendations
-            recommendation = eip['recommendation']
-            if len(recommendation) > 80:
-                recommendation = recommendation[:77] + '...'
-                
-            eip_data.append([
+        eip_data = [["Allocation ID", "Public IP", "Region", f"Cost ({currency})", "Action"]] + [
+            [
                 eip['resource_id'],
                 eip['public_ip'],
                 eip['region'],
-                cost_formatted,
-                recommendation
-            ])
+                fmt(conv(eip['estimated_monthly_cost'])),
+                _truncate(eip['recommendation'], 80, 77),
+            ]
+            for eip in data['elastic_ips']
+        ]
         
         # Better column widths distribution
         col_widths = [110, 110, 80, 90, 240]